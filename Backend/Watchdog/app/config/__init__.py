@@ -8,7 +8,10 @@ from .settings import (
     GUI_COLORS,
     LOG_LEVEL,
     LOCAL_TZ,
-    LOG_DATA_FILE
+    LOG_DATA_FILE,
+    SAVE_DEBOUNCE_SECONDS,
+    SQLITE_DB_FILE,
+    STORAGE_BACKEND
 )
 
 __all__ = [
@@ -22,4 +25,7 @@ __all__ = [
     "LOG_LEVEL",
     "LOCAL_TZ",
     "LOG_DATA_FILE",
+    "SAVE_DEBOUNCE_SECONDS",
+    "SQLITE_DB_FILE",
+    "STORAGE_BACKEND",
 ]
@@ -1,6 +1,7 @@
 """
 애플리케이션 설정 파일
 """
+import os
 import datetime
 from pathlib import Path
 
@@ -10,11 +11,70 @@ APP_ROOT = Path(__file__).parent.parent
 
 # 데이터 파일 설정
 # 설치형 프로그램을 위해 사용자 홈 디렉토리에 데이터 저장
-USER_DATA_DIR = Path.home() / ".watchdog"
+# (서버 배포 시 WATCHDOG_HOME 환경 변수로 위치 변경 가능)
+USER_DATA_DIR = Path(os.environ.get("WATCHDOG_HOME") or Path.home() / ".watchdog")
 DATA_DIR = USER_DATA_DIR / "data"
 SERVERS_DATA_FILE = DATA_DIR / "servers.json"
 LOG_DATA_FILE = DATA_DIR / "log.json"
+LOG_SEGMENT_DIR = DATA_DIR / "logs"
+LOG_SEGMENT_MAX_BYTES = 5 * 1024 * 1024  # 세그먼트 최대 크기 (초과 시 교체)
+SQLITE_DB_FILE = DATA_DIR / "watchdog.db"
+# 체크 결과 장기 보관 아카이브
+HISTORY_DIR = DATA_DIR / "history"
+HISTORY_WINDOW_SECONDS = 6 * 3600  # 아카이브 파일 하나의 구간 길이 (길수록 압축률이 좋지만 구간이 끝날 때까지 메모리에 보관)
+HISTORY_CODEC = "zlib"  # "zlib" 또는 "lzma"
+HISTORY_RETENTION_SECONDS = 14 * 86400  # 원본 체크 기록 보관 기간
+# 해상도(초)별 집계 보관 기간 (None이면 영구 보관, 집계는 STORAGE_BACKEND가 "sqlite"일 때만 사용)
+ROLLUP_RETENTION_SECONDS = {
+    60: 7 * 86400,
+    3600: 180 * 86400,
+    86400: None,
+}
+# 진행 중인 집계 구간 저장 간격 (비정상 종료 시 이 시간만큼의 집계만 잃음)
+ROLLUP_FLUSH_SECONDS = 60
+# 적응형 체크 주기 (기본 주기는 MonitorService.check_interval)
+# 안정적인 서버는 MAX까지 주기를 늘리고, warning/inactive/flapping 서버는 MIN 주기로 체크
+SCHEDULER_MIN_INTERVAL = 5
+SCHEDULER_MAX_INTERVAL = 300
+SCHEDULER_BACKOFF = 1.5
+SCHEDULER_MAX_CHECKS_PER_SECOND: float | None = None  # 전체 체크 속도 한도 (None이면 제한 없음)
+SCHEDULER_FLAP_WINDOW_SECONDS = 600
+SCHEDULER_FLAP_THRESHOLD = 3  # 구간 내 상태 변화가 이 횟수 이상이면 flapping
+# 체크가 예정 시각을 지나쳤을 때 처리 ("skip", "coalesce", "catch_up")
+SCHEDULER_OVERRUN_POLICY = "coalesce"
+# 처음 등록된 서버의 첫 체크를 분산하는 최대 구간 (초, 이후 체크는 주기 전체에 분산)
+SCHEDULER_FIRST_CHECK_SPREAD = 5
+# 체크를 나눠서 수행할 워커 프로세스 수 (0이면 단일 프로세스)
+MONITOR_WORKERS = 0
+# 클러스터 (노드 id가 None이면 단독 실행)
+# 같은 CLUSTER_DB_FILE을 사용하는 노드끼리 서버를 나눠서 모니터링
+CLUSTER_NODE_ID: str | None = None
+CLUSTER_DB_FILE = DATA_DIR / "cluster.db"
+CLUSTER_HEARTBEAT_SECONDS = 5
+CLUSTER_NODE_TIMEOUT_SECONDS = 15
+# 서버 하나를 관측하는 노드 수와 down 판정에 필요한 노드 수
+# (CLUSTER_REPLICAS > 1이면 노드별 재시도 대신 여러 노드의 관측으로 장애를 확인)
+CLUSTER_REPLICAS = 1
+CLUSTER_QUORUM = 2
+QUORUM_MAX_RETRIES = 1
+# 이벤트 루프 지연 측정 (체크 중 지연이 FLAG 이상이면 latency가 부풀었다고 표시)
+LOOP_LAG_SAMPLE_SECONDS = 0.1
+LOOP_LAG_FLAG_SECONDS = 0.05
+# 이 시간 이상 루프를 점유한 콜백 기록 (None이면 비활성화, 모든 콜백 실행에 측정 비용 추가)
+LOOP_SLOW_CALLBACK_SECONDS: float | None = None
+# 모니터 주기 단계별 시간 측정 (활성화 시 PHASE_TIMING_LOG_SECONDS마다 로그에 요약 기록)
+PHASE_TIMING_ENABLED = False
+PHASE_TIMING_LOG_SECONDS = 300
+# 상태 변화 알림 (채널이 설정되지 않으면 콘솔 출력으로 대체)
+ALERTS_ENABLED = True
+# Prometheus 메트릭 엔드포인트 (포트가 None이면 비활성화)
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT: int | None = None
+# 서버 목록/로그 저장소: "json" 또는 "sqlite"
+STORAGE_BACKEND = "json"
 DATA_VERSION = "1.0"
+# 서버 목록 저장 요청을 모아서 기록하는 대기 시간 (초)
+SAVE_DEBOUNCE_SECONDS = 0.5
 LOG_LEVEL = "INFO"
 
 # 서버 상태 상수
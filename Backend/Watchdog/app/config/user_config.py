@@ -73,5 +73,10 @@ class UserConfigManager:
     def get(self, key: str) -> Any:
         return self.config.get(key)
 
-user_setting = UserConfigManager()
+
+def __getattr__(name: str) -> Any:
+    # import 시점에 설정 파일을 읽지 않도록 처음 접근할 때 생성
+    if name == "user_setting":
+        return UserConfigManager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
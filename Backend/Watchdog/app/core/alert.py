@@ -1,53 +1,213 @@
+import asyncio
+import logging
+
 from app.core.base import BaseWatcher, Notifier,BaseCheckResult
 from app.core.models import Message, Status, MessageGrade
 from app.core.notifier import EmailNotifier, SlackNotifier
+from app.core.template import CompiledTemplate, compile_template, render, render_plain
+
+logger = logging.getLogger("Alert")
+
+# (등급, 채널, plain 외에 채널이 요구하는 출력 포맷)
+Route = tuple[MessageGrade, tuple[Notifier, ...], tuple[str, ...]]
+RoutingTable = dict[tuple[Status, Status], Route]
+
+# 새 상태별 알림 채널 이름
+STATUS_CHANNELS: dict[Status, tuple[str, ...]] = {
+    Status.latency: ("email",),
+    Status.down: ("email", "slack"),
+    Status.normal: ("email", "slack"),
+}
+
+
+class NotifierRegistry:
+    """알림 채널 인스턴스 관리 (Singleton)
+
+    채널별로 하나의 인스턴스만 만들어 SMTP/HTTP 세션을 알림 간에 재사용한다.
+    """
+    _instance = None
+    _factories = {
+        "email": EmailNotifier,
+        "slack": SlackNotifier,
+    }
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self) -> None:
+        if self._initialized:
+            return
+
+        self._initialized = True
+        self.channels: dict[str, Notifier] = {}
+
+    def register(self, name: str, notifier: Notifier) -> None:
+        """채널 인스턴스 등록 (설정된 SMTP 서버, 웹훅 등을 주입할 때 사용)"""
+        self.channels[name] = notifier
+
+    def get(self, name: str) -> Notifier:
+        notifier = self.channels.get(name)
+        if notifier is None:
+            factory = self._factories.get(name)
+            if factory is None:
+                raise KeyError(f"[{name}] 알림 채널이 정의되지 않았습니다.")
+            notifier = factory()
+            self.channels[name] = notifier
+        return notifier
+
+    async def aclose(self) -> None:
+        """채널 세션 정리"""
+        for notifier in self.channels.values():
+            aclose = getattr(notifier, "aclose", None)
+            if aclose:
+                try:
+                    await aclose()
+                except Exception as e:
+                    logger.error(f"Failed to close notifier: {e}")
 
 
 def set_notifiers() -> dict[Status, list[Notifier]]:
+    registry = NotifierRegistry()
     return {
-        Status.latency: [EmailNotifier()],
-        Status.down: [EmailNotifier(), SlackNotifier()],
-        Status.normal: [EmailNotifier(), SlackNotifier()]
+        status: [registry.get(name) for name in names]
+        for status, names in STATUS_CHANNELS.items()
     }
 
+def _grade(old: Status, new: Status) -> MessageGrade:
+    if new == Status.down:
+        return MessageGrade.critical
+
+    if new == Status.latency:
+        return MessageGrade.warning
+
+    if new.value < old.value:
+        return MessageGrade.resolved
+
+    raise KeyError(f"[{new}] status가 정의되지 않았습니다.")
+
+def build_routes(notifiers: dict[Status, list[Notifier]] | None = None) -> RoutingTable:
+    """(이전 상태, 새 상태) -> (등급, 채널) 라우팅 테이블 생성"""
+    if notifiers is None:
+        notifiers = set_notifiers()
+
+    routes: RoutingTable = {}
+    for old in Status:
+        for new in Status:
+            if old == new:
+                continue
+
+            channels = tuple(notifiers[new])
+            formats = tuple(dict.fromkeys(
+                fmt for fmt in (getattr(n, "message_format", "plain") for n in channels)
+                if fmt != "plain"
+            ))
+            routes[(old, new)] = (_grade(old, new), channels, formats)
+
+    return routes
+
+_default_routes: RoutingTable | None = None
+
+def default_routes() -> RoutingTable:
+    global _default_routes
+    if _default_routes is None:
+        _default_routes = build_routes()
+    return _default_routes
+
 def set_alert(
     watcher: BaseWatcher,
     check: BaseCheckResult,
-    notifiers: dict[Status, list[Notifier]]
-) -> tuple[Message | None, list[Notifier]]:
-    level = check.status.value - watcher.status.value
-    if level == 0:
-        return None, []
+    routes: RoutingTable | None = None
+) -> tuple[Message | None, tuple[Notifier, ...]]:
+    if routes is None:
+        routes = default_routes()
+    route = routes.get((watcher.status, check.status))
+    if route is None:
+        return None, ()
 
     # 새로운 상태 업데이트
     watcher.status = check.status
-
-    grade: MessageGrade | None = None
-
-    if level < 0:
-        grade = MessageGrade.resolved
-
-    if check.status == Status.down:
-        grade = MessageGrade.critical
-    
-    if check.status == Status.latency:
-        grade = MessageGrade.warning
-
-    if not grade:
-        raise KeyError(f"[{check.status}] status가 정의되지 않았습니다.")
+    grade, channels, formats = route
 
     message = make_message_text(watcher.template, check, grade)
     
     title = f"[{watcher.sign}] {grade.upper()}"
+
+    # 채널별 포맷(Slack blocks, HTML 등)은 같은 컴파일된 템플릿으로 렌더링
+    template = _compiled(watcher.template)
+    config = {fmt: render(fmt, template, check, grade) for fmt in formats}
     
     return (
-        Message(grade=grade, title=title, body=message),
-        notifiers[check.status]
+        Message(grade=grade, title=title, body=message, config=config),
+        channels
     )
 
-def make_message_text(template: str, result: BaseCheckResult, grade: str):
-    data = result.model_dump(mode='json')
-    return f"{grade.upper()} ISSUE: Your Service {result.status.name.upper()}.\n\n{template.format(**data)}"
+def _compiled(template: CompiledTemplate | str) -> CompiledTemplate:
+    if isinstance(template, CompiledTemplate):
+        return template
+    return compile_template(template)
+
+def make_message_text(template: CompiledTemplate | str, result: BaseCheckResult, grade: str):
+    return render_plain(_compiled(template), result, grade)
+
+
+class AlertDispatcher:
+    """알림 큐 및 전송 워커
+
+    체크 결과 처리 경로는 라우팅 테이블 조회와 큐 적재만 수행하고,
+    실제 전송은 백그라운드 워커가 담당한다.
+    """
+    def __init__(self, routes: RoutingTable | None = None, maxsize: int = 1000) -> None:
+        self.routes = routes if routes is not None else default_routes()
+        self.queue: asyncio.Queue[tuple[Message, tuple[Notifier, ...]]] = asyncio.Queue(maxsize)
+        self._task: asyncio.Task | None = None
+
+    def submit(self, watcher: BaseWatcher, check: BaseCheckResult) -> Message | None:
+        """상태 변화가 있으면 알림을 큐에 적재"""
+        message, channels = set_alert(watcher, check, self.routes)
+        if message is None or not channels:
+            return message
+
+        try:
+            self.queue.put_nowait((message, channels))
+        except asyncio.QueueFull:
+            logger.warning(f"Alert queue is full. Dropped: {message.title}")
+        return message
+
+    async def _send(self, notifier: Notifier, message: Message) -> None:
+        try:
+            await notifier.asend(message)
+        except Exception as e:
+            logger.error(f"Failed to send alert via {notifier.__class__.__name__}: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            message, channels = await self.queue.get()
+            try:
+                await asyncio.gather(*[self._send(n, message) for n in channels])
+            finally:
+                self.queue.task_done()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, drain: bool = True) -> None:
+        """워커 중지 (drain=True면 남은 알림을 모두 전송한 뒤 중지)"""
+        if drain and self._task and not self._task.done():
+            await self.queue.join()
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await NotifierRegistry().aclose()
 
 
 if __name__ == "__main__":
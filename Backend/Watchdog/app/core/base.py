@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Protocol
 
 from app.core.models import Status, BaseCheckResult, BaseConfig, Message
+from app.core.template import template_for
 from app.utils.server_logger import CustomLogger
 
 
@@ -13,7 +14,7 @@ class BaseWatcher(ABC):
         self.config = config
         self.max_retries = max_retries
         self.backoff = backoff
-        self.template = self.make_template()
+        self.template = template_for(self)
         self.sign = self._signature()
         self.logger = CustomLogger(self.config.name+"_watcher") if self.config.name else CustomLogger("unknown_watcher")
     
@@ -22,6 +22,16 @@ class DBConfig(BaseConfig):
     db_name: str
 
 
+class SimConfig(BaseConfig):
+    seed: int | None = Field(default=None)
+    latency_ms: float = Field(default=10)  # 응답 시간 중앙값
+    sigma: float = Field(default=0.5)  # 로그정규분포 sigma
+    failure_rate: float = Field(default=0.0)
+    latency: float = Field(default=30)  # 이 시간(초) 이상이면 latency 상태
+    outages: list[tuple[float, float, str]] = Field(default=[])  # (시작, 끝, "down" 또는 "latency") - 시뮬레이션 시각
+    realtime: bool = Field(default=False)  # True면 응답 시간만큼 실제로 대기
+
+
 class Status(enum.IntEnum):
     normal=0
     latency=1
@@ -33,6 +43,7 @@ class BaseCheckResult(BaseModel):
     status: Status
     message: str | None = Field(default=None)
     error_message: str | None = Field(default=None)
+    loop_lag: float | None = Field(default=None)  # 체크 중 이벤트 루프가 멈춰 있던 시간 (latency가 부풀었을 때만)
 
 
 class WebCheckResult(BaseCheckResult):
@@ -50,6 +61,11 @@ class DBCheckResult(BaseCheckResult):
     error_code: str | None = Field(default=None)
 
 
+class SimCheckResult(BaseCheckResult):
+    latency: float | None = Field(default=None)
+    sim_time: float | None = Field(default=None)
+
+
 class WorkerCheckResult(BaseCheckResult):
     name: str
 
@@ -1,17 +1,155 @@
+import asyncio
+import smtplib
+import logging
+import threading
+import httpx
+from email.message import EmailMessage
+
 from app.core.base import Notifier, Message
 
+logger = logging.getLogger("Notifier")
+
 
 class EmailNotifier(Notifier):
+    """SMTP 연결을 재사용하는 이메일 알림 채널
+
+    host가 지정되지 않으면 콘솔 출력으로 대체한다.
+    """
+    message_format = "html"
+
+    def __init__(
+        self,
+        host: str | None = None,
+        port: int = 587,
+        username: str | None = None,
+        password: str | None = None,
+        sender: str | None = None,
+        recipients: list[str] | None = None,
+        timeout: float = 10,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self.recipients = recipients or []
+        self.timeout = timeout
+        self._smtp: smtplib.SMTP | None = None
+        self._lock = threading.Lock()
+
+    def _session(self) -> smtplib.SMTP:
+        """열려 있는 SMTP 세션 반환 (끊긴 경우에만 재연결)"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout) # type: ignore
+        smtp.starttls()
+        if self.username and self.password:
+            smtp.login(self.username, self.password)
+        self._smtp = smtp
+        return smtp
+
+    def _build(self, msg: Message) -> EmailMessage:
+        mail = EmailMessage()
+        mail["Subject"] = msg.title or msg.grade.upper()
+        mail["From"] = self.sender or ""
+        mail["To"] = ", ".join(self.recipients)
+        mail.set_content(msg.body)
+        if msg.config and msg.config.get(self.message_format):
+            mail.add_alternative(msg.config[self.message_format], subtype="html")
+        return mail
+
     def send(self, msg: Message) -> None:
-        print(f"sending email...\ntitle: {msg.title}\n{msg.body}\n")
-    
+        if not self.host or not self.recipients:
+            print(f"sending email...\ntitle: {msg.title}\n{msg.body}\n")
+            return
+
+        # 하나의 SMTP 세션을 여러 스레드가 동시에 사용하지 않도록 직렬화
+        with self._lock:
+            try:
+                self._session().send_message(self._build(msg))
+            except (smtplib.SMTPException, OSError) as e:
+                # 세션이 끊긴 경우 한 번만 재연결 후 재시도
+                logger.warning(f"SMTP send failed, reconnecting: {e}")
+                self._smtp = None
+                self._session().send_message(self._build(msg))
+
     async def asend(self, msg: Message) -> None:
-        print(f"sending email...\ntitle: {msg.title}\n{msg.body}\n")
+        if not self.host or not self.recipients:
+            print(f"sending email...\ntitle: {msg.title}\n{msg.body}\n")
+            return
+
+        await asyncio.get_running_loop().run_in_executor(None, self.send, msg)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._smtp = None
+
+    async def aclose(self) -> None:
+        self.close()
 
 
 class SlackNotifier(Notifier):
+    """HTTP 커넥션 풀을 재사용하는 Slack 웹훅 알림 채널
+
+    webhook_url이 지정되지 않으면 콘솔 출력으로 대체한다.
+    """
+    message_format = "slack"
+
+    def __init__(self, webhook_url: str | None = None, timeout: float = 10) -> None:
+        self.webhook_url = webhook_url
+        self.timeout = timeout
+        self._client: httpx.Client | None = None
+        self._aclient: httpx.AsyncClient | None = None
+
+    def _session(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout)
+        return self._client
+
+    def _asession(self) -> httpx.AsyncClient:
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(timeout=self.timeout)
+        return self._aclient
+
+    def _payload(self, msg: Message) -> dict:
+        if msg.config and msg.config.get(self.message_format):
+            return msg.config[self.message_format]
+        return {"text": msg.body}
+
     def send(self, msg: Message):
-        print(f"sending slack alert...\n{msg.body}\n")
-    
+        if not self.webhook_url:
+            print(f"sending slack alert...\n{msg.body}\n")
+            return
+
+        response = self._session().post(self.webhook_url, json=self._payload(msg))
+        response.raise_for_status()
+
     async def asend(self, msg: Message):
-        print(f"sending slack alert...\n{msg.body}\n")
\ No newline at end of file
+        if not self.webhook_url:
+            print(f"sending slack alert...\n{msg.body}\n")
+            return
+
+        response = await self._asession().post(self.webhook_url, json=self._payload(msg))
+        response.raise_for_status()
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        self.close()
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
@@ -0,0 +1,80 @@
+"""
+server_type별 설정 생성 및 Watcher 클래스 등록
+
+Watcher 모듈은 해당 타입의 서버가 처음 생성될 때 import 하므로
+사용하지 않는 의존성(sqlalchemy, httpx 등)은 로드되지 않는다.
+"""
+import importlib
+from typing import Callable
+
+from app.core.base import BaseWatcher
+from app.core.models import BaseConfig, WebConfig, DBConfig, SimConfig
+
+
+def _web_config(server_data: dict) -> WebConfig:
+    return WebConfig(
+        name=server_data.get('name', 'Unknown'),
+        endpoint=f"{server_data.get('url', '')}{f":{server_data.get('port')}" if server_data.get('port') else ""}{server_data.get('endpoint', '')}",
+        latency=int(server_data.get('latency', 30)),
+        auth_key=server_data.get('auth_key')
+    )
+
+def _db_config(server_data: dict) -> DBConfig:
+    return DBConfig(
+        name=server_data.get('name', 'Unknown'),
+        host=server_data.get('host', 'localhost'),
+        port=int(server_data.get('poert', server_data.get('port', 5432))),
+        username=server_data.get('username', ''),
+        password=server_data.get('password', ''),
+        dbms=server_data.get('dbms', 'postgresql'),
+        db_name=server_data.get('db_name', '')
+    )
+
+def _sim_config(server_data: dict) -> SimConfig:
+    return SimConfig(
+        name=server_data.get('name', 'Unknown'),
+        seed=server_data.get('seed'),
+        latency_ms=float(server_data.get('latency_ms', 10)),
+        sigma=float(server_data.get('sigma', 0.5)),
+        failure_rate=float(server_data.get('failure_rate', 0.0)),
+        latency=float(server_data.get('latency', 30)),
+        outages=[
+            (float(outage[0]), float(outage[1]), outage[2] if len(outage) > 2 else "down")
+            for outage in server_data.get('outages', [])
+        ],
+        realtime=bool(server_data.get('realtime', False))
+    )
+
+
+ConfigFactory = Callable[[dict], BaseConfig]
+
+# server_type -> (설정 생성 함수, 모듈, 클래스 이름)
+WATCHER_TYPES: dict[str, tuple[ConfigFactory, str, str]] = {
+    "web": (_web_config, "app.core.web_watcher", "WebWatcher"),
+    "db": (_db_config, "app.core.db_watcher", "DBWatcher"),
+    # 소켓 없이 동작하는 가상 서버 (벤치마크/테스트용)
+    "sim": (_sim_config, "app.core.sim_watcher", "SimulatedWatcher"),
+}
+_classes: dict[str, type[BaseWatcher]] = {}
+
+
+def register_watcher(server_type: str, make_config: ConfigFactory, module_name: str, class_name: str) -> None:
+    """server_type 추가"""
+    WATCHER_TYPES[server_type] = (make_config, module_name, class_name)
+    _classes.pop(server_type, None)
+
+def watcher_class(server_type: str) -> type[BaseWatcher]:
+    cls = _classes.get(server_type)
+    if cls is None:
+        _, module_name, class_name = WATCHER_TYPES[server_type]
+        cls = _classes[server_type] = getattr(importlib.import_module(module_name), class_name)
+    return cls
+
+def build_config(server_data: dict) -> BaseConfig:
+    """서버 데이터로부터 Watcher 설정 생성"""
+    make_config = WATCHER_TYPES[server_data['server_type']][0]
+    return make_config(server_data)
+
+def create_watcher(server_data: dict) -> BaseWatcher:
+    """서버 데이터로부터 Watcher 인스턴스 생성"""
+    return watcher_class(server_data['server_type'])(build_config(server_data))
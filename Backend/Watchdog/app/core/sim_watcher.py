@@ -0,0 +1,126 @@
+"""
+네트워크 없이 동작하는 가상 서버 Watcher
+
+server_type "sim"으로 등록되어 있어 MonitorService에 일반 서버처럼 추가할 수 있다.
+응답 시간은 서버별 seed로 만든 로그정규분포를 따르고, outages에 지정한 구간에는
+down(또는 latency) 상태를 돌려준다. 구간은 모듈 전역 clock(시뮬레이션 시각) 기준이다.
+
+    clock.configure(speed=60)     # 실제 1초에 시뮬레이션 60초 진행
+    clock.configure(manual=True)  # advance()로만 시각 진행 (결정적 테스트용)
+
+configure()한 설정은 환경 변수(CLOCK_ENV)에도 기록되어, 이후에 시작되는 샤드 워커
+프로세스가 같은 기준 시각과 속도를 이어받는다. advance()는 현재 프로세스에만 적용된다.
+
+realtime이 False(기본값)이면 응답 시간을 실제로 기다리지 않으므로
+스케줄러/상태 반영/저장 경로의 처리량만 측정할 수 있다.
+"""
+import asyncio
+import logging
+import os
+import random
+import time
+import zlib
+from math import log
+
+from app.core.base import BaseWatcher
+from app.core.models import SimCheckResult, SimConfig, Status, BaseCheckResult
+
+logger = logging.getLogger("SimulatedWatcher")
+
+# "speed,manual,origin" (origin은 time.monotonic 기준이므로 같은 호스트의 프로세스끼리 공유 가능)
+CLOCK_ENV = "WATCHDOG_SIM_CLOCK"
+
+
+class SimClock:
+    """시뮬레이션 시각 (초, 0부터 시작)"""
+
+    def __init__(self, speed: float = 1.0, manual: bool = False, origin: float | None = None) -> None:
+        self.configure(speed, manual, origin)
+
+    def configure(self, speed: float = 1.0, manual: bool = False, origin: float | None = None) -> None:
+        """시각을 0으로 되돌리고 진행 방식 변경 (origin: 시각 0에 해당하는 time.monotonic 값)"""
+        self.speed = speed
+        self.manual = manual
+        self._origin = time.monotonic() if origin is None else origin
+        self._offset = 0.0
+        os.environ[CLOCK_ENV] = f"{speed!r},{int(manual)},{self._origin!r}"
+
+    @classmethod
+    def inherited(cls) -> "SimClock":
+        """부모 프로세스가 configure()한 설정으로 만든 clock (없으면 기본값)"""
+        value = os.environ.get(CLOCK_ENV)
+        if value:
+            try:
+                speed, manual, origin = value.split(",")
+                return cls(float(speed), manual == "1", float(origin))
+            except ValueError:
+                logger.warning(f"Ignoring invalid {CLOCK_ENV}={value!r}")
+        return cls()
+
+    def now(self) -> float:
+        elapsed = 0.0 if self.manual else (time.monotonic() - self._origin) * self.speed
+        return elapsed + self._offset
+
+    def advance(self, seconds: float) -> None:
+        self._offset += seconds
+
+
+clock = SimClock.inherited()
+
+
+class SimulatedWatcher(BaseWatcher):
+    def __init__(self, config: SimConfig) -> None:
+        # 재시도 간 대기 없음 (실제 시간이 흐르지 않도록)
+        super().__init__(config, 3, 0)
+        self.config: SimConfig
+        seed = config.seed if config.seed is not None else zlib.crc32((config.name or "").encode("utf-8"))
+        self._rng = random.Random(seed)
+        self._mu = log(max(config.latency_ms, 1e-6) / 1000)
+
+    def _scripted_status(self, now: float) -> Status | None:
+        for start, end, kind in self.config.outages:
+            if start <= now < end:
+                return Status.latency if kind == "latency" else Status.down
+        return None
+
+    def _simulate(self) -> tuple[SimCheckResult, float]:
+        now = clock.now()
+        latency = self._rng.lognormvariate(self._mu, self.config.sigma) if self.config.latency_ms > 0 else 0.0
+
+        status = self._scripted_status(now)
+        if status is None:
+            if self._rng.random() < self.config.failure_rate:
+                status = Status.down
+            elif latency >= self.config.latency:
+                status = Status.latency
+            else:
+                status = Status.normal
+
+        result = SimCheckResult(
+            status=status,
+            latency=None if status == Status.down else latency,
+            sim_time=now,
+            error_message="simulated outage" if status == Status.down else None
+        )
+        return result, latency
+
+    def check_server(self) -> BaseCheckResult:
+        result, latency = self._simulate()
+        if self.config.realtime:
+            time.sleep(latency)
+        return result
+
+    async def acheck_server(self) -> BaseCheckResult:
+        result, latency = self._simulate()
+        if self.config.realtime:
+            await asyncio.sleep(latency)
+        return result
+
+    def _check_result(self, result: BaseCheckResult) -> BaseCheckResult:
+        return result
+
+    async def cleanup(self) -> None:
+        ...
+
+    def make_template(self) -> str:
+        return """sim time: {sim_time}\nstatus: {status}\nmessage: {message}\nlatency: {latency}"""
@@ -0,0 +1,126 @@
+import enum
+import html
+import string
+from typing import Any, Callable, Iterable
+
+from app.core.models import BaseCheckResult
+
+
+def _value(value: Any) -> Any:
+    # model_dump(mode='json')과 동일하게 Enum은 값으로 출력
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+class CompiledTemplate:
+    """make_template() 문자열을 미리 파싱해 둔 렌더러
+
+    결과 모델 전체를 덤프하지 않고 템플릿에 필요한 필드만 읽어서 렌더링한다.
+    """
+    __slots__ = ("source", "fields", "_format")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        parts = list(string.Formatter().parse(source))
+        self.fields: tuple[str, ...] = tuple(dict.fromkeys(
+            field for _, field, _, _ in parts if field
+        ))
+
+        # 필드 이름을 위치 인자로 바꾼 포맷 문자열 (렌더링은 str.format 한 번으로 처리)
+        position = {field: i for i, field in enumerate(self.fields)}
+        out = []
+        for literal, field, spec, conversion in parts:
+            out.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            out.append("{" + str(position[field]))
+            if conversion:
+                out.append("!" + conversion)
+            if spec:
+                out.append(":" + spec)
+            out.append("}")
+        self._format = "".join(out)
+
+    def values(self, result: BaseCheckResult) -> dict[str, Any]:
+        """템플릿 필드 값만 추출"""
+        return {field: _value(getattr(result, field, None)) for field in self.fields}
+
+    def render(self, result: BaseCheckResult) -> str:
+        return self._format.format(*[_value(getattr(result, field, None)) for field in self.fields])
+
+
+_compiled: dict[Any, CompiledTemplate] = {}
+
+def compile_template(source: str) -> CompiledTemplate:
+    """템플릿 문자열 컴파일 (같은 문자열은 한 번만 파싱)"""
+    template = _compiled.get(source)
+    if template is None:
+        template = _compiled[source] = CompiledTemplate(source)
+    return template
+
+def template_for(watcher: Any) -> CompiledTemplate:
+    """Watcher 클래스별 컴파일된 템플릿 반환"""
+    cls = type(watcher)
+    template = _compiled.get(cls)
+    if template is None:
+        template = _compiled[cls] = compile_template(watcher.make_template())
+    return template
+
+
+# 출력 포맷
+def _headline(result: BaseCheckResult, grade: str) -> str:
+    return f"{grade.upper()} ISSUE: Your Service {result.status.name.upper()}."
+
+def render_plain(template: CompiledTemplate, result: BaseCheckResult, grade: str) -> str:
+    return f"{_headline(result, grade)}\n\n{template.render(result)}"
+
+def render_slack(template: CompiledTemplate, result: BaseCheckResult, grade: str) -> dict:
+    fields = [
+        {"type": "mrkdwn", "text": f"*{name}*\n{value}"}
+        for name, value in template.values(result).items()
+    ]
+    return {
+        "text": _headline(result, grade),
+        "blocks": [
+            {"type": "header", "text": {"type": "plain_text", "text": _headline(result, grade)}},
+            {"type": "section", "fields": fields},
+        ],
+    }
+
+def render_html(template: CompiledTemplate, result: BaseCheckResult, grade: str) -> str:
+    rows = "".join(
+        f"<tr><th>{html.escape(name)}</th><td>{html.escape(str(value))}</td></tr>"
+        for name, value in template.values(result).items()
+    )
+    return f"<h3>{html.escape(_headline(result, grade))}</h3><table>{rows}</table>"
+
+
+Formatter = Callable[[CompiledTemplate, BaseCheckResult, str], Any]
+
+FORMATTERS: dict[str, Formatter] = {
+    "plain": render_plain,
+    "slack": render_slack,
+    "html": render_html,
+}
+
+def register_format(name: str, formatter: Formatter) -> None:
+    """출력 포맷 추가"""
+    FORMATTERS[name] = formatter
+
+def render(fmt: str, template: CompiledTemplate, result: BaseCheckResult, grade: str) -> Any:
+    formatter = FORMATTERS.get(fmt)
+    if formatter is None:
+        raise KeyError(f"[{fmt}] 출력 포맷이 정의되지 않았습니다.")
+    return formatter(template, result, grade)
+
+def render_digest(
+    items: Iterable[tuple[CompiledTemplate, BaseCheckResult]],
+    title: str = "Watchdog digest"
+) -> str:
+    """여러 서버의 결과를 하나의 메시지로 묶어서 렌더링"""
+    sections = [
+        f"[{result.status.name.upper()}]\n{template.render(result)}"
+        for template, result in items
+    ]
+    return f"{title} ({len(sections)} servers)\n\n" + "\n\n".join(sections)
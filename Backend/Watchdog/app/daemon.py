@@ -0,0 +1,188 @@
+"""
+GUI 없이 MonitorService를 실행하는 데몬 진입점
+
+    python -m app.daemon [--data-dir DIR] [--pid-file PATH] [--interval SEC] [--log-level LEVEL]
+                         [--metrics-port PORT] [--metrics-host HOST] [--workers N]
+                         [--node-id ID] [--cluster-db PATH] [--replicas N] [--quorum N]
+                         [--max-checks-per-second RATE] [--slow-callback-seconds SEC] [--phase-timing]
+
+flet을 import하지 않으므로 디스플레이가 없는 서버에서도 실행할 수 있다.
+SIGTERM/SIGINT를 받으면 현재 체크 주기를 정리하고 상태를 저장한 뒤 종료한다.
+"""
+import os
+import sys
+import signal
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+logger = logging.getLogger("Daemon")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="watchdog-daemon", description="Watchdog headless monitoring daemon")
+    parser.add_argument("--data-dir", type=Path, help="데이터 디렉토리 (기본값: WATCHDOG_HOME 또는 ~/.watchdog)")
+    parser.add_argument("--pid-file", type=Path, help="PID 파일 경로 (기본값: <data-dir>/watchdog.pid)")
+    parser.add_argument("--interval", type=float, help="체크 주기 (초)")
+    parser.add_argument("--log-level", default=None, help="로그 레벨 (기본값: settings.LOG_LEVEL)")
+    parser.add_argument("--metrics-port", type=int, help="Prometheus 메트릭 엔드포인트 포트 (기본값: settings.METRICS_PORT)")
+    parser.add_argument("--metrics-host", help="메트릭 엔드포인트 바인드 주소 (기본값: settings.METRICS_HOST)")
+    parser.add_argument("--workers", type=int, help="체크 워커 프로세스 수 (0이면 단일 프로세스, 기본값: settings.MONITOR_WORKERS)")
+    parser.add_argument("--node-id", help="클러스터 노드 id (지정하면 같은 cluster-db를 쓰는 노드끼리 서버를 나눠서 모니터링)")
+    parser.add_argument("--cluster-db", type=Path, help="클러스터 coordination SQLite 파일 (기본값: settings.CLUSTER_DB_FILE)")
+    parser.add_argument("--replicas", type=int, help="서버 하나를 관측하는 노드 수 (기본값: settings.CLUSTER_REPLICAS)")
+    parser.add_argument("--quorum", type=int, help="down 판정에 필요한 관측 노드 수 (기본값: settings.CLUSTER_QUORUM)")
+    parser.add_argument("--max-checks-per-second", type=float, help="전체 체크 속도 한도 (기본값: settings.SCHEDULER_MAX_CHECKS_PER_SECOND)")
+    parser.add_argument("--slow-callback-seconds", type=float, help="이 시간 이상 이벤트 루프를 점유한 콜백 기록 (기본값: settings.LOOP_SLOW_CALLBACK_SECONDS)")
+    parser.add_argument("--phase-timing", action="store_true", help="모니터 주기 단계별 시간 측정 (기본값: settings.PHASE_TIMING_ENABLED)")
+    return parser.parse_args(argv)
+
+
+class PidFile:
+    """중복 실행 방지용 PID 파일"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _running_pid(self) -> int | None:
+        try:
+            pid = int(self.path.read_text().strip())
+        except (OSError, ValueError):
+            return None
+        if pid == os.getpid():
+            return None
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return None
+        except PermissionError:
+            # 다른 사용자의 프로세스가 실행 중
+            return pid
+        return pid
+
+    def acquire(self) -> None:
+        pid = self._running_pid()
+        if pid is not None:
+            raise RuntimeError(f"Watchdog daemon is already running (pid {pid}, {self.path})")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(f"{os.getpid()}\n")
+        os.replace(tmp_path, self.path)
+
+    def release(self) -> None:
+        try:
+            if int(self.path.read_text().strip()) == os.getpid():
+                self.path.unlink()
+        except (OSError, ValueError):
+            pass
+
+
+def _install_signal_handlers(stop_event: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows 등 add_signal_handler 미지원 환경
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop_event.set))
+
+
+async def run(
+    interval: float | None = None,
+    metrics_port: int | None = None,
+    metrics_host: str | None = None,
+    workers: int | None = None,
+    node_id: str | None = None,
+    cluster_db: Path | None = None,
+    replicas: int | None = None,
+    quorum: int | None = None,
+    max_rate: float | None = None,
+    slow_callback_seconds: float | None = None,
+    phase_timing: bool = False
+) -> int:
+    """모니터링을 시작하고 종료 신호를 받을 때까지 대기"""
+    from app.services.monitor_service import MonitorService
+
+    monitor = MonitorService()
+    if interval is not None:
+        monitor.check_interval = interval
+    if metrics_port is not None:
+        monitor.metrics_port = metrics_port
+    if metrics_host is not None:
+        monitor.metrics_host = metrics_host
+    if workers is not None:
+        monitor.workers = workers
+    if node_id is not None:
+        monitor.node_id = node_id
+    if cluster_db is not None:
+        monitor.cluster_db = cluster_db.expanduser().resolve()
+    if replicas is not None:
+        monitor.replicas = replicas
+    if quorum is not None:
+        monitor.quorum.quorum = quorum
+    if max_rate is not None:
+        monitor.scheduler.max_rate = max_rate
+    if slow_callback_seconds is not None:
+        monitor.slow_callback_threshold = slow_callback_seconds
+    if phase_timing:
+        monitor.set_phase_timing(True)
+
+    stop_event = asyncio.Event()
+    _install_signal_handlers(stop_event)
+
+    try:
+        await monitor.start()
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+
+    logger.info(f"Watchdog daemon running (pid {os.getpid()}, {len(monitor.watchers)} servers)")
+
+    # 모니터링 루프가 스스로 종료된 경우(연속 에러 등)에도 빠져나옴
+    stop_task = asyncio.create_task(stop_event.wait())
+    await asyncio.wait(
+        [stop_task, monitor.main_task], # type: ignore
+        return_when=asyncio.FIRST_COMPLETED
+    )
+    stop_task.cancel()
+
+    logger.info("Shutting down...")
+    await monitor.stop()
+    await asyncio.get_running_loop().run_in_executor(None, monitor.server_service.flush)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    # 설정 모듈이 데이터 경로를 계산하기 전에 적용해야 함
+    if args.data_dir is not None:
+        os.environ["WATCHDOG_HOME"] = str(args.data_dir.expanduser().resolve())
+
+    from app.config.settings import USER_DATA_DIR, LOG_LEVEL
+
+    logging.basicConfig(
+        level=(args.log_level or LOG_LEVEL).upper(),
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    )
+
+    pid_file = PidFile(args.pid_file or USER_DATA_DIR / "watchdog.pid")
+    try:
+        pid_file.acquire()
+    except RuntimeError as e:
+        logger.error(str(e))
+        return 1
+
+    try:
+        return asyncio.run(run(
+            args.interval, args.metrics_port, args.metrics_host,
+            args.workers, args.node_id, args.cluster_db, args.replicas, args.quorum,
+            args.max_checks_per_second, args.slow_callback_seconds, args.phase_timing
+        ))
+    finally:
+        pid_file.release()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,9 +22,9 @@ def main(page: ft.Page):
     app_state = AppState()
     server_service = ServerService()
     
-    # 초기 데이터 로드
+    # 초기 데이터 로드 (AppState가 상태를 직접 갱신하므로 사본을 보관)
     initial_servers = {
-        s['id']: s for s in server_service.get_all_servers()
+        s['id']: s.copy() for s in server_service.get_all_servers()
     }
     app_state.set_servers(initial_servers)
     
@@ -36,6 +36,9 @@ def main(page: ft.Page):
             app_state.update_server(data['id'], data)
         elif event_type == "delete":
             app_state.remove_server(data['id'])
+        elif event_type == "batch_update":
+            for server in data:
+                app_state.update_server(server['id'], server)
     
     server_service.add_listener(sync_server_change)
     
@@ -0,0 +1,178 @@
+"""
+여러 Watchdog 노드 간 서버 분배
+
+노드들은 같은 SQLite 파일(coordination store)에 heartbeat를 기록하고,
+살아 있는 노드 목록으로 consistent-hash ring을 만들어 서버 담당 노드를 정한다.
+노드가 heartbeat를 멈추면 node_timeout 이후 다른 노드들의 ring에서 빠지고,
+그 노드가 맡던 서버만 나머지 노드에 다시 분배된다.
+"""
+import asyncio
+import bisect
+import hashlib
+import logging
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from app.utils.storage import SQLiteDatabase
+
+logger = logging.getLogger("Cluster")
+
+_SQL = {
+    "heartbeat": (
+        "INSERT INTO cluster_nodes (node_id, address, started_at, heartbeat) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(node_id) DO UPDATE SET address=excluded.address, heartbeat=excluded.heartbeat"
+    ),
+    "live": "SELECT node_id FROM cluster_nodes WHERE heartbeat >= ? ORDER BY node_id",
+    "leave": "DELETE FROM cluster_nodes WHERE node_id = ?",
+    "prune": "DELETE FROM cluster_nodes WHERE heartbeat < ?",
+}
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+class HashRing:
+    """가상 노드를 사용하는 consistent-hash ring"""
+
+    def __init__(self, nodes: List[str] | Tuple[str, ...] = (), vnodes: int = 64) -> None:
+        self.vnodes = vnodes
+        self.nodes: Tuple[str, ...] = tuple(sorted(set(nodes)))
+        points = sorted(
+            (_hash(f"{node}#{i}"), node)
+            for node in self.nodes
+            for i in range(vnodes)
+        )
+        self._keys = [point for point, _ in points]
+        self._owners = [node for _, node in points]
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def owner(self, key: str) -> Optional[str]:
+        if not self._keys:
+            return None
+        index = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._owners[index]
+
+    def owners(self, key: str, count: int) -> List[str]:
+        """key를 담당하는 노드부터 ring을 따라 서로 다른 노드 count개"""
+        if not self._keys:
+            return []
+        count = min(count, len(self.nodes))
+        found: List[str] = []
+        index = bisect.bisect(self._keys, _hash(key))
+        for step in range(len(self._keys)):
+            node = self._owners[(index + step) % len(self._keys)]
+            if node not in found:
+                found.append(node)
+                if len(found) == count:
+                    break
+        return found
+
+
+class ClusterStore:
+    """노드 목록/heartbeat 저장소 (여러 프로세스가 같은 SQLite 파일 공유)"""
+
+    def __init__(self, db_file: Path) -> None:
+        self.db = SQLiteDatabase.open(db_file)
+
+    def heartbeat(self, node_id: str, address: str, started_at: float, now: float) -> None:
+        self.db.write(_SQL["heartbeat"], [(node_id, address, started_at, now)])
+
+    def live_nodes(self, now: float, timeout: float) -> List[str]:
+        return [row[0] for row in self.db.query(_SQL["live"], (now - timeout,))]
+
+    def leave(self, node_id: str) -> None:
+        self.db.write(_SQL["leave"], [(node_id,)])
+
+    def prune(self, before: float) -> None:
+        self.db.write(_SQL["prune"], [(before,)])
+
+
+class ClusterNode:
+    """현재 프로세스를 클러스터 노드로 등록하고 담당 서버를 판단"""
+
+    def __init__(
+        self, node_id: str, db_file: Path,
+        heartbeat_interval: float = 5, node_timeout: float = 15,
+        vnodes: int = 64, replicas: int = 1
+    ) -> None:
+        self.node_id = node_id
+        self.replicas = replicas
+        self.address = f"{socket.gethostname()}:{os.getpid()}"
+        self.store = ClusterStore(db_file)
+        self.heartbeat_interval = heartbeat_interval
+        self.node_timeout = node_timeout
+        self.vnodes = vnodes
+        self.started_at = time.time()
+        self.ring = HashRing((node_id,), vnodes)
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[HashRing, HashRing], None]] = []
+
+    def add_listener(self, callback: Callable[[HashRing, HashRing], None]) -> None:
+        """멤버십 변경 시 (이전 ring, 새 ring)으로 호출"""
+        self._listeners.append(callback)
+
+    def owners(self, server_id: str) -> List[str]:
+        """서버를 관측하는 노드 목록 (첫 번째가 상태 판정을 담당하는 primary)"""
+        return self.ring.owners(server_id, self.replicas)
+
+    def owns(self, server_id: str) -> bool:
+        if self.replicas == 1:
+            return self.ring.owner(server_id) == self.node_id
+        return self.node_id in self.owners(server_id)
+
+    def is_primary(self, server_id: str) -> bool:
+        return self.ring.owner(server_id) == self.node_id
+
+    def _beat(self) -> List[str]:
+        now = time.time()
+        self.store.heartbeat(self.node_id, self.address, self.started_at, now)
+        # 오래전에 죽은 노드 행 정리
+        self.store.prune(now - self.node_timeout * 20)
+        return self.store.live_nodes(now, self.node_timeout)
+
+    def _update_ring(self, nodes: List[str]) -> None:
+        if self.node_id not in nodes:
+            nodes = nodes + [self.node_id]
+        if tuple(sorted(nodes)) == self.ring.nodes:
+            return
+
+        previous, self.ring = self.ring, HashRing(nodes, self.vnodes)
+        logger.info(f"Cluster membership changed: {list(previous.nodes)} -> {list(self.ring.nodes)}")
+        for listener in self._listeners:
+            try:
+                listener(previous, self.ring)
+            except Exception as e:
+                logger.error(f"Error in cluster listener: {e}")
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._update_ring(await loop.run_in_executor(None, self._beat))
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Joined cluster as '{self.node_id}' ({len(self.ring)} nodes)")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                self._update_ring(await loop.run_in_executor(None, self._beat))
+            except Exception as e:
+                logger.error(f"Cluster heartbeat failed: {type(e).__name__}: {e}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # 정상 종료 시 바로 빠져서 다른 노드가 timeout을 기다리지 않도록 함
+        await asyncio.get_running_loop().run_in_executor(None, self.store.leave, self.node_id)
+        logger.info(f"Left cluster as '{self.node_id}'")
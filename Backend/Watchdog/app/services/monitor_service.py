@@ -1,17 +1,46 @@
 import asyncio
 import time
 import logging
-from typing import Any, Dict, Set, Optional, Tuple
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Optional, Tuple
 
 from app.services.server_service import ServerService
 from app.core.base import BaseWatcher
-from app.core.web_watcher import WebWatcher
-from app.core.db_watcher import DBWatcher
-from app.core.models import WebConfig, DBConfig, Status, MessageGrade, BaseCheckResult
+from app.core.models import Status, MessageGrade, BaseCheckResult
+from app.core.registry import WATCHER_TYPES, build_config, create_watcher
+from app.services.shard_engine import ShardedEngine, RemoteWatcher, CheckRecord
+from app.services.cluster import ClusterNode, HashRing
+from app.services.quorum import QuorumAggregator, ObservationStore, Verdict, signature_key
+from app.services.scheduler import AdaptiveScheduler, TICK_RESOLUTION
 from app.utils.server_logger import CustomLogger, LogManager
+from app.utils.history_archive import CheckHistoryBuffer, HistoryArchive
+from app.utils.rollup import Downsampler, RollupStore
+from app.utils.metrics import MonitorMetrics, MetricsServer
+from app.utils.loop_monitor import LoopLagSampler, SlowCallbackMonitor
+from app.config.settings import (
+    HISTORY_DIR, HISTORY_WINDOW_SECONDS, HISTORY_CODEC, HISTORY_RETENTION_SECONDS,
+    ROLLUP_RETENTION_SECONDS, ROLLUP_FLUSH_SECONDS, SQLITE_DB_FILE, STORAGE_BACKEND, METRICS_HOST, METRICS_PORT, MONITOR_WORKERS,
+    CLUSTER_NODE_ID, CLUSTER_DB_FILE, CLUSTER_HEARTBEAT_SECONDS, CLUSTER_NODE_TIMEOUT_SECONDS,
+    CLUSTER_REPLICAS, CLUSTER_QUORUM, QUORUM_MAX_RETRIES,
+    SCHEDULER_MIN_INTERVAL, SCHEDULER_MAX_INTERVAL, SCHEDULER_BACKOFF, SCHEDULER_MAX_CHECKS_PER_SECOND,
+    SCHEDULER_FLAP_WINDOW_SECONDS, SCHEDULER_FLAP_THRESHOLD, SCHEDULER_OVERRUN_POLICY, SCHEDULER_FIRST_CHECK_SPREAD,
+    LOOP_LAG_SAMPLE_SECONDS, LOOP_LAG_FLAG_SECONDS, LOOP_SLOW_CALLBACK_SECONDS,
+    PHASE_TIMING_ENABLED, PHASE_TIMING_LOG_SECONDS, ALERTS_ENABLED
+)
+
+if TYPE_CHECKING:
+    from app.core.alert import AlertDispatcher
 
 logger = logging.getLogger("MonitorService")
-log_manager = LogManager()
+
+# Watcher 체크 결과 -> 서버 상태
+STATUS_MAP = {
+    Status.normal: "active",
+    Status.latency: "warning",
+    Status.down: "inactive"
+}
+# 서버 상태 -> Watcher 체크 결과 (알림 라우팅용)
+CHECK_STATUS = {status: check for check, status in STATUS_MAP.items()}
 
 class MonitorService:
     """서버 모니터링 서비스 (Singleton)"""
@@ -31,24 +60,85 @@ class MonitorService:
         self.is_running = False
         self.watchers: Dict[str, BaseWatcher] = {}
         self.logger = CustomLogger("MonitorService")
+        self.log_manager = LogManager()
         self.logger.info(MessageGrade.start, "Initialized!")
             
         self.server_service = ServerService()
         self.check_interval = 30  # 30초마다 체크
         self.main_task: Optional[asyncio.Task] = None
         self.semaphore: asyncio.Semaphore = asyncio.Semaphore(5)
-        self._last_server_ids: Set[str] = set()
+
+        # 서버별 체크 주기 (check_interval 기준으로 상태에 따라 늘리거나 줄임)
+        self.scheduler = AdaptiveScheduler(
+            self.check_interval, SCHEDULER_MIN_INTERVAL, SCHEDULER_MAX_INTERVAL, SCHEDULER_BACKOFF,
+            SCHEDULER_MAX_CHECKS_PER_SECOND, SCHEDULER_FLAP_WINDOW_SECONDS, SCHEDULER_FLAP_THRESHOLD,
+            SCHEDULER_OVERRUN_POLICY, SCHEDULER_FIRST_CHECK_SPREAD
+        )
+
+        # 워커 프로세스 수 (0이면 현재 프로세스의 이벤트 루프에서 모든 체크 수행)
+        self.workers = MONITOR_WORKERS
+        self.engine: Optional[ShardedEngine] = None
+
+        # 클러스터 노드 id (None이면 모든 서버를 이 노드가 담당)
+        self.node_id = CLUSTER_NODE_ID
+        self.cluster_db = CLUSTER_DB_FILE
+        self.cluster: Optional[ClusterNode] = None
+
+        # 다중 관측 판정 (replicas > 1인 클러스터 모드에서만 사용)
+        self.replicas = CLUSTER_REPLICAS
+        self.quorum = QuorumAggregator(CLUSTER_QUORUM)
+        self.observation_store: Optional[ObservationStore] = None
+        # 이번 주기의 관측 결과: server_id -> (status, latency, result, error_message)
+        self._observations: Dict[str, Tuple[Status, Optional[float], Optional[BaseCheckResult], Optional[str]]] = {}
+        self.verdicts: Dict[str, Verdict] = {}  # primary로 판정한 서버의 최근 판정
+        # 진행 중인 체크 (server_id -> Task, 워커 프로세스 모드에서는 결과를 기다리는 Future)
+        # 같은 서버를 동시에 두 번 체크하지 않음
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._remote_batches: Set[asyncio.Task] = set()  # 워커 프로세스에 보낸 체크 요청
+        self.merged_checks = 0  # 진행 중인 체크에 합쳐진 수동 체크 요청 수
+        # ServerService 변경 이벤트 큐 (다른 스레드에서 추가될 수 있으므로 deque 사용)
+        self._changes: deque[Tuple[str, Dict]] = deque()
         
         # 메모리 캐시 및 I/O 최적화
         self.status_cache: Dict[str, str] = {}  # server_id -> status
         self.dirty_servers: Set[str] = set()  # 변경된 서버 ID
+        self.transitions: List[Tuple[str, Optional[str], str, float]] = []  # 저장 대기 중인 상태 변화 이력
+
+        # 체크 결과 장기 보관 (구간마다 압축 아카이브로 내보냄)
+        self.history = CheckHistoryBuffer(time.time())
+        self.history_archive = HistoryArchive(HISTORY_DIR, HISTORY_CODEC)
+        self.history_window = HISTORY_WINDOW_SECONDS
+        # 집계는 SQLite 저장소에만 보관 (JSON 저장소를 사용하면 집계하지 않음)
+        self.rollups = Downsampler()
+        self.rollup_store = RollupStore(SQLITE_DB_FILE) if STORAGE_BACKEND == "sqlite" else None
+        self.last_rollup_flush = time.monotonic()
+
+        # Prometheus 메트릭 (metrics_port가 None이면 엔드포인트를 열지 않음)
+        self.metrics = MonitorMetrics()
+        self.metrics_host = METRICS_HOST
+        self.metrics_port = METRICS_PORT
+        self.metrics_server: Optional[MetricsServer] = None
+        # 주기 단계별 시간 측정 (비활성화 시 비용 거의 없음)
+        self.phases = self.metrics.phases
+        self.phases.enabled = PHASE_TIMING_ENABLED
+        self.phase_log_interval = PHASE_TIMING_LOG_SECONDS
+        self.last_phase_log = time.monotonic()
+
+        # 이벤트 루프 지연 (체크 latency 신뢰도 판단용)
+        self.loop_lag = LoopLagSampler(LOOP_LAG_SAMPLE_SECONDS)
+        self.lag_flag_threshold = LOOP_LAG_FLAG_SECONDS
+        self.inflated_checks = 0
+        # 느린 콜백 탐지 (None이면 비활성화)
+        self.slow_callback_threshold = LOOP_SLOW_CALLBACK_SECONDS
+        self.slow_callbacks: Optional[SlowCallbackMonitor] = None
         self.last_save_time = time.time()
         self.save_interval = 300  # 5분
         self.save_threshold = 10  # 10건 변경 시 저장
         
-        # 동기화용 Lock
-        self.watchers_lock = asyncio.Lock()
-        
+        # 상태 변화 알림 (체크 경로에서는 라우팅 테이블 조회와 큐 적재만, 전송은 백그라운드 워커)
+        self.alerts_enabled = ALERTS_ENABLED
+        self.alerts: Optional["AlertDispatcher"] = None
+
         # 이벤트 리스너
         self.listeners = []
         
@@ -59,63 +149,99 @@ class MonitorService:
 
         logger.debug("initialized!!")
     
-    def _on_server_data_changed(self, event_type: str, server_data: Dict):
-        """서버 데이터 변경 시 호출되는 콜백"""
+    def _on_server_data_changed(self, event_type: str, server_data: Any):
+        """서버 데이터 변경 시 호출되는 콜백
+
+        Watcher 목록은 여기서 직접 바꾸지 않고 변경 큐에 넣어 두며,
+        모니터링 루프의 _sync_servers가 다음 주기 시작 시 순서대로 반영한다.
+        """
         if not self.is_running:
             return
 
+        if event_type == "batch_update":
+            # 상태 저장으로 인한 이벤트가 대부분이므로 모니터링 여부가 바뀐 서버만 큐에 넣음
+            self._changes.extend(
+                (event_type, server) for server in server_data
+                if server.get('is_monitoring_enabled', True) != (server['id'] in self.watchers)
+            )
+        else:
+            self._changes.append((event_type, server_data))
+
+    def _apply_change(
+        self, watchers: Dict[str, BaseWatcher], event_type: str,
+        server_data: Dict, retired: List[BaseWatcher]
+    ) -> None:
+        """변경 이벤트 하나를 watchers 사본에 반영 (교체/제거된 Watcher는 retired에 모음)"""
         server_id = server_data['id']
         server_name = server_data.get('name', 'Unknown')
         is_enabled = server_data.get('is_monitoring_enabled', True)
 
-        logger.info(f"Server data changed: {event_type} - {server_name} (Enabled: {is_enabled})")
+        if event_type == "delete" or not is_enabled or not self._owns(server_id):
+            watcher = watchers.pop(server_id, None)
+            if watcher is None:
+                return
+            retired.append(watcher)
+            reason = (
+                "deleted server" if event_type == "delete"
+                else "disabled" if not is_enabled
+                else "assigned to another node"
+            )
+            watcher.logger.info(MessageGrade.etc, f"Removed watcher ({reason}): {server_name}")
+            logger.info(f"Removed watcher ({reason}): {server_name}")
+            # 삭제된 서버의 진행 중인 집계는 버리고, 비활성화/반납된 서버는 지금까지의 집계를 저장
+            self.rollups.forget(server_id, keep=event_type != "delete")
+            if event_type == "delete":
+                self.status_cache.pop(server_id, None)
+                self.dirty_servers.discard(server_id)
+            return
 
-        if event_type == "delete":
-            if server_id in self.watchers:
-                self.watchers[server_id].logger.info(
-                    MessageGrade.etc,
-                    f"Removed watcher for deleted server: {server_name}"
-                )
-                
-                del self.watchers[server_id]
-                if server_id in self.status_cache:
-                    del self.status_cache[server_id]
-                logger.info(f"Removed watcher for deleted server: {server_name}")
-
-        elif event_type == "add":
-            if is_enabled and server_id not in self.watchers:
-                watcher = self._create_watcher(server_data)
-                if watcher:
-                    self.watchers[server_id] = watcher
-                    self.status_cache[server_id] = server_data.get('status', 'active')
-                    watcher.logger.info(
-                        MessageGrade.etc,
-                        f"Added watcher for new server: {server_name}"
-                    )
-                    logger.info(f"Added watcher for new server: {server_name}")
-
-        elif event_type == "update":
-            # 모니터링 비활성화된 경우 제거
-            if not is_enabled:
-                if server_id in self.watchers:
-                    self.watchers[server_id].logger.info(
-                        MessageGrade.etc,
-                        f"Removed watcher (disabled): {server_name}"
-                    )
-                    del self.watchers[server_id]
-                    logger.info(f"Removed watcher (disabled): {server_name}")
-            else:
-                # 활성화 상태인 경우 Watcher 재생성 및 교체
-                # (설정이 변경되었을 수 있으므로 무조건 재생성)
-                watcher = self._create_watcher(server_data)
-                if watcher:
-                    self.watchers[server_id] = watcher
-                    # 상태 캐시는 유지하거나 초기화 (여기서는 유지)
-                    # watcher.logger.info(
-                    #     MessageGrade.etc,
-                    #     f"Updated watcher for server: {server_name}"
-                    # )
-                    # logger.info(f"Updated watcher for server: {server_name}")
+        # 상태 일괄 저장(batch_update)과 add는 설정 변경이 아니므로 없는 경우에만 생성
+        # update는 설정이 변경되었을 수 있으므로 Watcher 재생성 (상태 캐시는 유지)
+        if event_type != "update" and server_id in watchers:
+            return
+
+        watcher = self._create_watcher(server_data)
+        if watcher is None:
+            logger.warning(f"Failed to add server '{server_name}' to monitoring")
+            return
+
+        previous = watchers.get(server_id)
+        watchers[server_id] = watcher
+        if previous is not None:
+            retired.append(previous)
+            # 변경된 설정으로 바로 다시 체크
+            self.scheduler.reset(server_id)
+            return
+
+        self.status_cache.setdefault(server_id, server_data.get('status', 'active'))
+        watcher.logger.info(MessageGrade.etc, f"Added watcher for server: {server_name}")
+        logger.info(f"Server '{server_name}' (ID: {server_id}) added to monitoring")
+
+    @property
+    def quorum_mode(self) -> bool:
+        return self.cluster is not None and self.cluster.replicas > 1
+
+    def _owns(self, server_id: str) -> bool:
+        """클러스터 모드에서 이 노드가 담당하는 서버인지 여부"""
+        return self.cluster is None or self.cluster.owns(server_id)
+
+    def _on_membership_changed(self, previous: HashRing, ring: HashRing):
+        """클러스터 노드 구성이 바뀌면 다음 주기에 담당 서버 재계산"""
+        self._changes.append(("rebalance", {}))
+
+    def _rebalance(self, watchers: Dict[str, BaseWatcher], retired: List[BaseWatcher]) -> None:
+        """현재 ring 기준으로 담당 서버 추가/반납"""
+        for server_id in [server_id for server_id in watchers if not self._owns(server_id)]:
+            watcher = watchers.pop(server_id)
+            retired.append(watcher)
+            self.rollups.forget(server_id)
+            self.status_cache.pop(server_id, None)
+            self.dirty_servers.discard(server_id)
+            logger.info(f"Handed off server '{watcher.config.name}' to node {self.cluster.ring.owner(server_id)}") # type: ignore
+
+        for server in self.server_service.get_all_servers():
+            if server['id'] not in watchers and server.get('is_monitoring_enabled', True):
+                self._apply_change(watchers, "add", server, retired)
 
     def add_listener(self, callback):
         """상태 변경 리스너 추가"""
@@ -129,11 +255,29 @@ class MonitorService:
             
     def _notify_listeners(self, server_id: str, status: str):
         """리스너들에게 상태 변경 알림"""
+        started = self.phases.start()
         for listener in self.listeners:
             try:
                 listener(server_id, status)
             except Exception as e:
                 logger.error(f"Error in listener: {e}")
+        self.phases.stop("listeners", started)
+
+    def set_phase_timing(self, enabled: bool) -> None:
+        """단계별 시간 측정 켜기/끄기 (켤 때 이전 기록은 초기화)"""
+        if enabled and not self.phases.enabled:
+            self.phases.reset()
+            self.last_phase_log = time.monotonic()
+        self.phases.enabled = enabled
+
+    def _log_phase_timing(self):
+        """단계별 측정 요약을 주기적으로 로그 뷰에 기록"""
+        if not self.phases.enabled or time.monotonic() - self.last_phase_log < self.phase_log_interval:
+            return
+        self.last_phase_log = time.monotonic()
+        stats = self.phases.stats()
+        if stats:
+            self.logger.info(MessageGrade.etc, {"phase_timing_ms": stats})
 
     async def start(self):
         """모니터링 시작"""
@@ -142,15 +286,35 @@ class MonitorService:
             return
         
         try:
-            await log_manager.start()
+            await self.log_manager.start()
             self.is_running = True
+            self.scheduler.base_interval = self.check_interval
+            if self.node_id:
+                self.cluster = ClusterNode(
+                    self.node_id, self.cluster_db,
+                    CLUSTER_HEARTBEAT_SECONDS, CLUSTER_NODE_TIMEOUT_SECONDS,
+                    replicas=self.replicas
+                )
+                self.cluster.add_listener(self._on_membership_changed)
+                await self.cluster.start()
+                if self.quorum_mode:
+                    self.observation_store = ObservationStore(self.cluster_db)
+            if self.workers > 0:
+                self.engine = ShardedEngine(
+                    self.workers, max_retries=QUORUM_MAX_RETRIES if self.quorum_mode else None
+                )
             self._load_servers()
             
-            # 서버가 0개인 경우 예외 발생
-            if len(self.watchers) == 0:
+            # 서버가 0개인 경우 예외 발생 (클러스터 모드에서는 다른 노드가 모두 담당할 수 있음)
+            if len(self.watchers) == 0 and self.cluster is None:
                 self.is_running = False
-                await log_manager.stop()
+                self.engine = None
+                await self.log_manager.stop()
                 raise ValueError("모니터링할 서버가 없습니다. 먼저 서버를 추가해주세요.")
+
+            if self.engine is not None:
+                await self.engine.start()
+                await self.engine.apply(self.watchers)
             
             self.logger.info(
                 MessageGrade.start,
@@ -158,6 +322,19 @@ class MonitorService:
             )
             logger.info(f"Monitoring started with {len(self.watchers)} servers")
             
+            await self._start_metrics_server()
+
+            if self.alerts_enabled:
+                # 알림 채널(httpx, smtplib)은 알림을 사용할 때만 import
+                from app.core.alert import AlertDispatcher
+                self.alerts = AlertDispatcher()
+                self.alerts.start()
+
+            self.loop_lag.start()
+            if self.slow_callback_threshold is not None:
+                self.slow_callbacks = SlowCallbackMonitor(self.slow_callback_threshold)
+                self.slow_callbacks.install()
+
             # 메인 모니터링 루프 시작
             self.main_task = asyncio.create_task(self._monitor_loop())
             
@@ -184,6 +361,37 @@ class MonitorService:
                 pass
             except Exception as e:
                 logger.error(f"Error while cancelling monitor task: {e}")
+
+        # 진행 중인 체크 취소 (Watcher 정리 전에 끝나야 함)
+        inflight = list(self._remote_batches) + list(self._inflight.values())
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
+        self._inflight.clear()
+
+        # 마지막 주기에서 쌓인 알림까지 전송
+        if self.alerts is not None:
+            await self.alerts.stop()
+            self.alerts = None
+
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+            self.metrics_server = None
+
+        await self.loop_lag.stop()
+        if self.slow_callbacks is not None:
+            self.slow_callbacks.uninstall()
+
+        if self.engine is not None:
+            await self.engine.stop()
+            self.engine = None
+
+        if self.cluster is not None:
+            await self.cluster.stop()
+            self.cluster = None
+        self.observation_store = None
+        self._observations.clear()
+        self.verdicts.clear()
         
         # Watcher 리소스 정리 (DB 연결 종료 등)
         for watcher in self.watchers.values():
@@ -193,40 +401,78 @@ class MonitorService:
                 except Exception as e:
                     logger.error(f"Failed to cleanup watcher: {e}")
 
-        self.watchers.clear()
+        self.watchers = {}
+        self.scheduler.retain(())
+        self._changes.clear()
         self.status_cache.clear()
         self.dirty_servers.clear()
+        self.transitions.clear()
         
         self.logger.info(
             MessageGrade.stop,
             "Monitoring stopped"
         )
-        await log_manager.stop()
+        await self.log_manager.stop()
         logger.info("Monitoring stopped")
     
+    async def _start_metrics_server(self):
+        """메트릭 엔드포인트 시작 (실패해도 모니터링은 계속)"""
+        if self.metrics_port is None or self.metrics_server is not None:
+            return
+        self._publish_metrics()
+        server = MetricsServer(self.metrics, self.metrics_host, self.metrics_port)
+        try:
+            await server.start()
+        except OSError as e:
+            logger.error(f"Failed to start metrics endpoint on {self.metrics_host}:{self.metrics_port}: {e}")
+            return
+        self.metrics_server = server
+
+    def _publish_metrics(self):
+        """스크레이프 응답으로 사용할 메트릭 스냅샷 갱신"""
+        self.metrics.publish(
+            {server_id: watcher.config.name or "" for server_id, watcher in self.watchers.items()},
+            {
+                "watchdog_monitored_servers": ("Number of monitored servers", len(self.watchers)),
+                "watchdog_pending_server_changes": ("Server change events waiting to be applied", len(self._changes)),
+                "watchdog_dirty_servers": ("Servers whose status is not saved yet", len(self.dirty_servers)),
+                "watchdog_pending_transitions": ("Status transitions waiting to be saved", len(self.transitions)),
+                "watchdog_history_buffered_samples": ("Check results waiting to be archived", len(self.history)),
+                "watchdog_last_save_timestamp_seconds": ("Unix time of the last state save", self.last_save_time),
+                "watchdog_inflight_checks": ("Checks currently running", len(self._inflight)),
+                "watchdog_event_loop_lag_p99_seconds": ("p99 event loop lag over the sample window", self.loop_lag.stats()["p99"]),
+            },
+            {
+                "watchdog_skipped_checks_total": ("Scheduled checks skipped because the previous check was still running", self.scheduler.skipped_busy),
+                "watchdog_merged_checks_total": ("Manual check requests served by an in-flight check", self.merged_checks),
+                "watchdog_inflated_checks_total": ("Checks whose measured latency includes event loop lag", self.inflated_checks),
+            }
+        )
+
     def _load_servers(self):
         """서버 목록 로드 및 Watcher 생성"""
         try:
             servers = self.server_service.get_all_servers()
             
-            # is_monitoring_enabled가 True인 서버만 필터링
+            # is_monitoring_enabled가 True이고 이 노드가 담당하는 서버만 필터링
             enabled_servers = [
                 s for s in servers 
-                if s.get('is_monitoring_enabled', True)
+                if s.get('is_monitoring_enabled', True) and self._owns(s['id'])
             ]
             
             success_count = 0
             fail_count = 0
+            watchers = dict(self.watchers)
             
             for server in enabled_servers:
                 server_id = server['id']
                 server_name = server.get('name', 'Unknown')
                 
-                if server_id not in self.watchers:
+                if server_id not in watchers:
                     try:
                         watcher = self._create_watcher(server)
                         if watcher:
-                            self.watchers[server_id] = watcher
+                            watchers[server_id] = watcher
                             # 초기 상태 캐시
                             self.status_cache[server_id] = server.get('status', 'active')
                             success_count += 1
@@ -241,7 +487,7 @@ class MonitorService:
                         logger.error(f"Exception while creating watcher for '{server_name}': {e}")
                         fail_count += 1
             
-            self._last_server_ids = set(s['id'] for s in enabled_servers)
+            self.watchers = watchers
             
             if success_count > 0:
                 logger.info(f"Loaded {success_count} watchers successfully")
@@ -253,35 +499,23 @@ class MonitorService:
             raise
     
     def _create_watcher(self, server_data: Dict) -> Optional[BaseWatcher]:
-        """서버 데이터로부터 Watcher 인스턴스 생성"""
+        """서버 데이터로부터 Watcher 인스턴스 생성 (샤딩 모드에서는 워커 프로세스용 대리 객체)"""
         server_type = server_data.get('server_type')
         server_name = server_data.get('name', 'Unknown')
+
+        if server_type not in WATCHER_TYPES:
+            logger.warning(f"Unknown server type '{server_type}' for server '{server_name}'")
+            return None
         
         try:
-            if server_type == 'web':
-                config = WebConfig(
-                    name=server_name,
-                    endpoint=f"{server_data.get('url', '')}{f":{server_data.get('port')}" if server_data.get('port') else ""}{server_data.get('endpoint', '')}",
-                    latency=int(server_data.get('latency', 30)),
-                    auth_key=server_data.get('auth_key')
-                )
-                return WebWatcher(config)
-            
-            elif server_type == 'db':
-                config = DBConfig(
-                    name=server_name,
-                    host=server_data.get('host', server_data.get('host', 'localhost')),
-                    port=int(server_data.get('poert', server_data.get('port', 5432))),
-                    username=server_data.get('username', server_data.get('username', '')),
-                    password=server_data.get('password', server_data.get('password', '')),
-                    dbms=server_data.get('dbms', server_data.get('dbms', 'postgresql')),
-                    db_name=server_data.get('db_name', server_data.get('db_name', ''))
-                )
-                return DBWatcher(config)
-            
-            else:
-                logger.warning(f"Unknown server type '{server_type}' for server '{server_name}'")
-                return None
+            if self.engine is not None:
+                return RemoteWatcher(server_data, build_config(server_data)) # type: ignore
+
+            watcher = create_watcher(server_data)
+            if self.quorum_mode:
+                # 일시적인 장애는 다른 노드의 관측으로 확인하므로 재시도를 줄임
+                watcher.max_retries = min(watcher.max_retries, QUORUM_MAX_RETRIES)
+            return watcher
             
         except KeyError as e:
             logger.error(f"Missing required field {e} for server '{server_name}'")
@@ -297,46 +531,80 @@ class MonitorService:
         """메인 모니터링 루프"""
         consecutive_errors = 0
         max_consecutive_errors = 5
+        next_cycle: Optional[float] = None
         
         try:
             while self.is_running:
                 try:
-                    # 서버 목록 동기화
+                    cycle_start = time.monotonic()
+                    if next_cycle is not None:
+                        self.metrics.observe_lag(max(0.0, cycle_start - next_cycle))
+
+                    # 서버 변경 사항 반영
+                    started = self.phases.start()
                     await self._sync_servers()
+                    self.phases.stop("sync", started)
                     
-                    # Watchers의 스냅샷 획득 (동기화 이슈 방지)
-                    async with self.watchers_lock:
-                        current_watchers = dict(self.watchers)
+                    # watchers는 교체만 되고 수정되지 않으므로 참조가 곧 스냅샷
+                    started = self.phases.start()
+                    current_watchers = self.watchers
                     
                     # 서버가 0개인 경우 대기만 수행
                     if not current_watchers:
                         # print("[DEBUG] No servers to monitor, waiting...")  # 과도한 로그 방지
+                        self._publish_metrics()
+                        next_cycle = time.monotonic() + self.check_interval
                         await asyncio.sleep(self.check_interval)
                         continue
                     
-                    # 스냅샷으로 체크 수행 (Lock 없이)
-                    tasks = [
-                        self._check_server(server_id, watcher)
-                        for server_id, watcher in current_watchers.items()
-                    ]
-                    
-                    # 모든 체크 결과 수집 (예외도 포함)
-                    async with self.semaphore:
-                        results = await asyncio.gather(*tasks, return_exceptions=True)
-                    
-                    # 실패한 체크 확인
-                    failed_checks = sum(1 for r in results if isinstance(r, Exception))
-                    if failed_checks > 0:
-                        logger.warning(f"{failed_checks}/{len(tasks)} server checks failed")
+                    # 체크 주기가 된 서버만 수행 (이전 체크가 아직 진행 중인 서버는 건너뜀)
+                    due = self.scheduler.due(current_watchers, cycle_start, self._inflight)
+                    self.phases.stop("snapshot", started)
+                    if due:
+                        if self.engine is not None:
+                            # 워커 프로세스에 체크 요청 (결과는 도착하는 대로 반영)
+                            started = self.phases.start()
+                            batch = self._dispatch_remote(due)
+                            self.phases.stop("dispatch", started)
+
+                            # 로컬 모드와 같이 다음 tick 전까지만 기다림
+                            wait_until = self.scheduler.next_wakeup(time.monotonic(), self.check_interval)
+                            await asyncio.wait([batch], timeout=max(0.0, wait_until - time.monotonic()))
+                        else:
+                            # 스냅샷으로 체크 수행 (Lock 없이)
+                            started = self.phases.start()
+                            tasks = [self._dispatch(server_id, current_watchers[server_id]) for server_id in due]
+                            self.phases.stop("dispatch", started)
+                            
+                            # 다음 tick 전까지만 기다리고, 느린 체크는 백그라운드에서 계속 진행
+                            wait_until = self.scheduler.next_wakeup(time.monotonic(), self.check_interval)
+                            done, pending = await asyncio.wait(tasks, timeout=max(0.0, wait_until - time.monotonic()))
+                            
+                            # 실패한 체크 확인
+                            failed_checks = sum(1 for t in done if not t.cancelled() and t.exception() is not None)
+                            if failed_checks > 0:
+                                logger.warning(f"{failed_checks}/{len(tasks)} server checks failed")
+                            if pending:
+                                logger.debug(f"{len(pending)}/{len(tasks)} server checks still running")
+
+                        if self.quorum_mode:
+                            await self._resolve_quorum()
+
+                        self.metrics.observe_cycle(time.monotonic() - cycle_start)
+                        self._publish_metrics()
                     
                     # 조건부 저장
+                    started = self.phases.start()
                     await self._conditional_save()
+                    self.phases.stop("conditional_save", started)
+                    self._log_phase_timing()
                     
                     # 에러 카운터 리셋 (정상 실행 완료)
                     consecutive_errors = 0
                     
-                    # 다음 체크까지 대기
-                    await asyncio.sleep(self.check_interval)
+                    # 다음 체크 대상이 생길 때까지 대기 (서버 변경은 최대 check_interval 안에 반영)
+                    next_cycle = self.scheduler.next_wakeup(time.monotonic(), self.check_interval)
+                    await asyncio.sleep(max(0.0, next_cycle - time.monotonic()))
                     
                 except asyncio.CancelledError:
                     logger.info("Monitor loop cancelled")
@@ -359,128 +627,254 @@ class MonitorService:
             logger.info("Monitor loop finished. Saving final states...")
             try:
                 await self._save_states()
+                await self._export_rollups(force=True)
+                await self._export_history(force=True)
+                await asyncio.get_running_loop().run_in_executor(None, self.server_service.flush)
                 await self.logger.log_manager._save_to_json()
             except Exception as e:
                 logger.error(f"Failed to save states on loop exit: {e}")
     
     async def _sync_servers(self):
-        """서버 목록 동기화 (안전하게)"""
-        try:
-            current_servers = self.server_service.get_all_servers()
-            
-            # is_monitoring_enabled가 True인 서버만 필터링
-            enabled_servers = [
-                s for s in current_servers 
-                if s.get('is_monitoring_enabled', True)
-            ]
-            
-            current_ids = set(s['id'] for s in enabled_servers)
-            
-            async with self.watchers_lock:
-                # 현재 Watchers의 복사본 생성
-                new_watchers = dict(self.watchers)
-                
-                # 삭제된 서버 또는 비활성화된 서버 제거
-                removed_ids = set(new_watchers.keys()) - current_ids
-                for server_id in removed_ids:
-                    del new_watchers[server_id]
-                    # 캐시에서도 제거
-                    self.status_cache.pop(server_id, None)
-                    self.dirty_servers.discard(server_id)
-                    logger.info(f"Server {server_id} removed from monitoring")
-                
-                # 새로 추가된 서버 또는 활성화된 서버 등록
-                for server in enabled_servers:
-                    server_id = server['id']
-                    server_name = server.get('name', 'Unknown')
-                    
-                    if server_id not in new_watchers:
-                        try:
-                            watcher = self._create_watcher(server)
-                            if watcher:
-                                new_watchers[server_id] = watcher
-                                self.status_cache[server_id] = server.get('status', 'active')
-                                watcher.logger.info(
-                                    MessageGrade.etc,
-                                    f"Added watcher for server: {server_name}"
-                                )
-                                logger.warning(f"Server '{server_name}' (ID: {server_id}) added to monitoring")
-                            else:
-                                logger.warning(f"Failed to add server '{server_name}' to monitoring")
-                        except Exception as e:
-                            logger.error(f"Failed to add server '{server_name}': {e}")
-                
-                # 원자적으로 교체
-                self.watchers = new_watchers
-                self._last_server_ids = current_ids
-                
-        except Exception as e:
-            logger.error(f"Failed to sync servers: {e}")
-            # 동기화 실패해도 기존 watchers는 유지
+        """쌓인 서버 변경 이벤트만 반영 (변경이 없으면 아무 작업도 하지 않음)
+
+        watchers는 copy-on-write로 관리한다. 변경이 있을 때만 사본을 만들어 반영한 뒤
+        통째로 교체하므로, 체크 루프는 복사 없이 현재 dict를 그대로 사용할 수 있다.
+        """
+        if not self._changes:
+            return
+
+        new_watchers = dict(self.watchers)
+        retired: List[BaseWatcher] = []
+        while self._changes:
+            event_type, server_data = self._changes.popleft()
+            try:
+                if event_type == "rebalance":
+                    self._rebalance(new_watchers, retired)
+                    continue
+                self._apply_change(new_watchers, event_type, server_data, retired)
+            except Exception as e:
+                logger.error(f"Failed to apply server change ({event_type}): {type(e).__name__}: {e}")
+
+        # 원자적으로 교체
+        self.watchers = new_watchers
+        self.scheduler.retain(new_watchers)
+        if self.engine is not None:
+            await self.engine.apply(new_watchers)
+
+        # 교체/제거된 Watcher 리소스 정리 (DB 연결 종료 등)
+        for watcher in retired:
+            if hasattr(watcher, 'cleanup'):
+                try:
+                    await watcher.cleanup()
+                except Exception as e:
+                    logger.error(f"Failed to cleanup watcher: {e}")
     
+    def _dispatch(self, server_id: str, watcher: BaseWatcher) -> asyncio.Future:
+        """체크 시작 (이미 진행 중이면 새로 시작하지 않고 진행 중인 Task 반환)"""
+        task = self._inflight.get(server_id)
+        if task is not None:
+            return task
+
+        if self.engine is not None:
+            self._dispatch_remote([server_id])
+            return self._inflight[server_id]
+
+        task = asyncio.create_task(self._check_server(server_id, watcher))
+        self._inflight[server_id] = task
+        task.add_done_callback(lambda t: self._inflight.pop(server_id, None) if self._inflight.get(server_id) is t else None)
+        return task
+
+    def _dispatch_remote(self, server_ids: List[str]) -> asyncio.Task:
+        """워커 프로세스에 체크 요청을 보내고 전체 응답을 기다리는 Task 반환
+
+        서버마다 Future를 _inflight에 등록하고, 결과가 도착하는 대로 반영한 뒤 해당 서버만 해제한다.
+        """
+        loop = asyncio.get_running_loop()
+        futures: Dict[str, asyncio.Future] = {}
+        for server_id in server_ids:
+            futures[server_id] = self._inflight[server_id] = loop.create_future()
+
+        def release(server_id: str) -> None:
+            future = futures.pop(server_id, None)
+            if future is None:
+                return
+            if self._inflight.get(server_id) is future:
+                del self._inflight[server_id]
+            if not future.done():
+                future.set_result((server_id, None))
+
+        def on_records(records: List[CheckRecord]) -> None:
+            try:
+                self._apply_records(records)
+            finally:
+                for record in records:
+                    release(record[0])
+
+        def finish(task: asyncio.Task) -> None:
+            # 전송부터 마지막 응답까지 (결과 반영 시간 포함, dispatch는 전송만 측정)
+            self.phases.stop("remote_batch", started)
+            self._remote_batches.discard(task)
+            # 결과 없이 끝난 서버 (워커 재시작, 삭제 등)
+            for server_id in list(futures):
+                release(server_id)
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(f"Remote check batch failed: {type(task.exception()).__name__}: {task.exception()}")
+
+        started = self.phases.start()
+        batch = asyncio.ensure_future(self.engine.run_cycle(server_ids, on_records)) # type: ignore
+        self._remote_batches.add(batch)
+        batch.add_done_callback(finish)
+        return batch
+
+    async def check_now(self, server_id: str) -> Optional[Any]:
+        """즉시 체크 (GUI 수동 체크 등)
+
+        체크가 이미 진행 중이면 새 요청을 보내지 않고 그 결과를 기다린다.
+        워커 프로세스 모드에서는 결과가 상태에만 반영되고 None을 반환한다.
+        """
+        watcher = self.watchers.get(server_id)
+        if watcher is None or not self.is_running:
+            return None
+
+        if server_id in self._inflight:
+            self.merged_checks += 1
+        # 호출한 쪽이 취소되어도 진행 중인 체크는 계속
+        outcome = await asyncio.shield(self._dispatch(server_id, watcher))
+        if self.quorum_mode:
+            await self._resolve_quorum()
+        return outcome[1] if outcome is not None else None
+
     async def _check_server(self, server_id: str, watcher: BaseWatcher) -> Tuple[str, Optional[Any]]:
         """개별 서버 헬스체크"""
         try:
+            started = time.monotonic()
             result = await watcher.acheck()
-            
-            # 상태 매핑
-            status_map = {
-                Status.normal: "active",
-                Status.latency: "warning",
-                Status.down: "inactive"
-            }
-            
-            new_status = status_map.get(result.status, "active")
-            old_status = self.status_cache.get(server_id)
-            
-            # 상태가 변경된 경우만 처리
-            if old_status != new_status:
-                self._update_change(server_id, old_status, new_status, watcher, result)
-            
+            self._flag_loop_lag(watcher, result, started)
+            self._handle_result(server_id, watcher, result.status, getattr(result, "latency", None), result)
             return (server_id, result)
             
         except asyncio.TimeoutError:
             msg = f"Timeout checking server {server_id} ({watcher.config.name})"
             logger.error(msg)
             # 타임아웃 시 inactive로 처리
-            old_status = self.status_cache.get(server_id)
-            new_status = "inactive"
-            
-            if old_status != new_status:
-                self._update_change(server_id, old_status, new_status, watcher, error_message=msg)
-                
+            self._handle_result(server_id, watcher, Status.down, None, error_message=msg)
             return (server_id, None)
         except ConnectionError as e:
             msg = f"Connection error for server {server_id} ({watcher.config.name}): {e}"
             logger.error(msg)
-            old_status = self.status_cache.get(server_id)
-            new_status = "inactive"
-            
-            if old_status != new_status:
-                self._update_change(server_id, old_status, new_status, watcher, error_message=msg)
-                
+            self._handle_result(server_id, watcher, Status.down, None, error_message=msg)
             return (server_id, None)
         except Exception as e:
             msg = f"Unexpected error checking server {server_id} ({watcher.config.name}): {type(e).__name__}: {e}"
             logger.error(msg)
-            
             # 예기치 않은 에러도 서버 다운으로 간주
-            old_status = self.status_cache.get(server_id)
-            new_status = "inactive"
-            
-            if old_status != new_status:
-                self._update_change(server_id, old_status, new_status, watcher, error_message=msg)
-                
+            self._handle_result(server_id, watcher, Status.down, None, error_message=msg)
             return (server_id, None)
+
+    def _flag_loop_lag(self, watcher: BaseWatcher, result: BaseCheckResult, started: float) -> None:
+        """체크하는 동안 이벤트 루프가 멈춰 있었으면 결과에 표시 (측정된 latency에 지연이 포함됨)"""
+        stall = self.loop_lag.stall_between(started, time.monotonic())
+        if stall < self.lag_flag_threshold:
+            return
+        self.inflated_checks += 1
+        result.loop_lag = round(stall, 4)
+        logger.debug(
+            f"Check of {watcher.config.name} includes {stall * 1000:.0f} ms of event loop lag "
+            f"(measured latency {getattr(result, 'latency', None)})"
+        )
+
+    def _handle_result(
+        self, server_id: str, watcher: BaseWatcher, status: Status, latency: float | None,
+        result: BaseCheckResult | None = None, error_message: str | None = None
+    ) -> None:
+        """체크 결과 반영 (quorum 모드에서는 관측만 모으고 판정은 주기 끝에 수행)"""
+        self._record_check(server_id, status, latency)
+        self.scheduler.observe(server_id, status, time.monotonic())
+
+        if self.quorum_mode:
+            self._observations[server_id] = (status, latency, result, error_message)
+            return
+
+        new_status = STATUS_MAP[status]
+        old_status = self.status_cache.get(server_id)
+        # 상태가 변경된 경우만 처리
+        if old_status != new_status:
+            self._update_change(server_id, old_status, new_status, watcher, result, error_message)
     
+    def _apply_records(self, records: List[CheckRecord]) -> None:
+        """워커 프로세스의 체크 결과 배치 반영"""
+        for server_id, status_value, latency, detail in records:
+            watcher = self.watchers.get(server_id)
+            if watcher is None:
+                # 결과가 도착하기 전에 삭제/비활성화된 서버
+                continue
+
+            self._handle_result(server_id, watcher, Status(status_value), latency, error_message=detail)
+
+    async def _resolve_quorum(self):
+        """이번 주기 관측 결과를 공유하고, primary로 담당하는 서버의 상태를 판정"""
+        if not self._observations or self.cluster is None or self.observation_store is None:
+            return
+
+        observations, self._observations = self._observations, {}
+        now = time.time()
+        keys: Dict[str, str] = {}
+        for server_id in observations:
+            watcher = self.watchers.get(server_id)
+            if watcher is not None:
+                keys[server_id] = signature_key(watcher.sign)
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.observation_store.record, self.cluster.node_id, [
+            (keys[server_id], observations[server_id][0].value, observations[server_id][1], now)
+            for server_id in keys
+        ])
+
+        primary = [server_id for server_id in keys if self.cluster.is_primary(server_id)]
+        if not primary:
+            return
+
+        # 안정적인 서버는 각 노드에서 최대 주기까지 backoff되므로, 가장 긴 주기 안의 관측은 모두 유효
+        since = now - (self.scheduler.slowest_interval + TICK_RESOLUTION + self.cluster.heartbeat_interval)
+        found = await loop.run_in_executor(
+            None, self.observation_store.fetch, [keys[server_id] for server_id in primary], since
+        )
+        for server_id in primary:
+            # ring에 아직 반영되지 않았거나 담당이 아닌 노드의 관측은 제외
+            owners = self.cluster.owners(server_id)
+            votes = [o for o in found.get(keys[server_id], []) if o.node_id in owners]
+            verdict = self.quorum.verdict(votes, len(owners))
+            self.verdicts[server_id] = verdict
+
+            new_status = STATUS_MAP[verdict.status]
+            old_status = self.status_cache.get(server_id)
+            if old_status == new_status:
+                continue
+
+            status, _, result, error_message = observations[server_id]
+            if verdict.degraded or verdict.status != status:
+                # 로컬 관측과 판정이 다르면 판정 근거를 기록
+                result, error_message = None, verdict.message
+            self._update_change(server_id, old_status, new_status, self.watchers[server_id], result, error_message)
+
+    def _record_check(self, server_id: str, status: Status, latency: float | None) -> None:
+        """체크 결과를 원본 기록과 집계에 누적"""
+        now = time.time()
+        self.history.record(server_id, now, status.value, latency)
+        if self.rollup_store is not None:
+            self.rollups.record(server_id, now, status == Status.down, latency)
+        self.metrics.observe_check(server_id, status, latency)
+
     def _update_change(
         self, server_id: str, old_status: str | None,
         new_status: str, watcher: BaseWatcher,
         result: BaseCheckResult | None = None,
         error_message: str | None = None
     ) -> None:
+        started = self.phases.start()
         self.status_cache[server_id] = new_status
         self.dirty_servers.add(server_id)
+        self.transitions.append((server_id, old_status, new_status, time.time()))
 
         detail = result.model_dump() if result else error_message
         if isinstance(detail, dict):
@@ -494,9 +888,34 @@ class MonitorService:
         if new_status == "warning":
             event = MessageGrade.warning
 
+        notify_started = self.phases.start()
         watcher.logger.info(event, detail)
+        self._submit_alert(watcher, old_status, new_status, result, error_message)
+        self.phases.stop("notify", notify_started)
         logger.info(f"Server {server_id} ({watcher.config.name}) status changed: {old_status} -> {new_status}")
         self._notify_listeners(server_id, new_status)
+        self.phases.stop("update_change", started)
+
+    def _submit_alert(
+        self, watcher: BaseWatcher, old_status: str | None, new_status: str,
+        result: BaseCheckResult | None, error_message: Any
+    ) -> None:
+        """상태 변화 알림을 큐에 적재"""
+        if self.alerts is None:
+            return
+
+        status = CHECK_STATUS[new_status]
+        if result is None or result.status != status:
+            # 워커 프로세스 결과, 에러, quorum 판정 등은 상태와 메시지만으로 알림
+            if isinstance(error_message, dict):
+                error_message = error_message.get("error_message")
+            result = BaseCheckResult(status=status, error_message=error_message)
+        # 라우팅 기준은 저장된 이전 상태 (재시작 직후에도 같은 변화를 다시 알리지 않음)
+        watcher.status = CHECK_STATUS.get(old_status, Status.normal) # type: ignore
+        try:
+            self.alerts.submit(watcher, result)
+        except Exception as e:
+            logger.error(f"Failed to queue alert for {watcher.config.name}: {type(e).__name__}: {e}")
 
     async def _conditional_save(self):
         """조건부 파일 저장"""
@@ -506,41 +925,113 @@ class MonitorService:
         # 조건: 시간 경과 또는 변경 건수 초과
         if (time_elapsed >= self.save_interval or 
             len(self.dirty_servers) >= self.save_threshold):
-            await self._save_states()
+            with self.metrics.timed("save_states"):
+                await self._save_states()
+
+        await self._export_rollups()
+        await self._export_history()
+
+    async def _export_rollups(self, force: bool = False):
+        """끝난 집계 구간 저장
+
+        진행 중인 구간은 ROLLUP_FLUSH_SECONDS마다(force면 바로) 현재까지의 집계를 저장한다.
+        """
+        if self.rollup_store is None:
+            return
+        flush_open = force or time.monotonic() - self.last_rollup_flush >= ROLLUP_FLUSH_SECONDS
+        if flush_open:
+            self.last_rollup_flush = time.monotonic()
+        buckets = self.rollups.drain(include_open=flush_open)
+        if not buckets:
+            return
+        try:
+            with self.metrics.timed("rollups"):
+                await asyncio.get_running_loop().run_in_executor(None, self.rollup_store.write, buckets)
+        except Exception as e:
+            logger.error(f"Failed to save rollups: {type(e).__name__}: {e}")
+
+    async def _export_history(self, force: bool = False):
+        """체크 기록 구간이 끝났으면 압축 아카이브로 내보냄
+
+        내보낼 때마다 보관 기간이 지난 원본 기록과 집계도 정리한다.
+        """
+        now = time.time()
+        if not force and now - self.history.window_start < self.history_window:
+            return
+        if not len(self.history):
+            self.history.window_start = now
+            return
+
+        start = self.history.window_start
+        columns = self.history.drain(now)
+        try:
+            with self.metrics.timed("history"):
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.history_archive.write_window, columns, start, now
+                )
+        except Exception as e:
+            logger.error(f"Failed to export check history: {type(e).__name__}: {e}")
+
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.history_archive.purge, now - HISTORY_RETENTION_SECONDS)
+            if self.rollup_store is not None:
+                await loop.run_in_executor(None, self.rollup_store.purge, ROLLUP_RETENTION_SECONDS, now)
+            if self.observation_store is not None:
+                await loop.run_in_executor(None, self.observation_store.prune, now - self.history_window)
+        except Exception as e:
+            logger.error(f"Failed to purge expired check history: {type(e).__name__}: {e}")
+
+    def get_history(self, server_id: str, start: float | None = None, end: float | None = None) -> List:
+        """원본 체크 기록 조회 (보관 기간 내)"""
+        return self.history_archive.query(server_id, start, end)
+
+    def get_rollups(
+        self, server_id: str, start: float, end: float,
+        resolution: Optional[int] = None
+    ) -> List[Dict]:
+        """집계 조회 (해상도 미지정 시 구간 길이에 맞춰 자동 선택, SQLite 저장소에서만 지원)"""
+        if self.rollup_store is None:
+            return []
+        return self.rollup_store.query(server_id, start, end, resolution)
     
     async def _save_states(self):
         """변경된 상태를 파일에 저장"""
+        if self.transitions:
+            transitions, self.transitions = self.transitions, []
+            try:
+                self.server_service.record_transitions(transitions)
+            except Exception as e:
+                logger.error(f"Failed to save status transitions: {type(e).__name__}: {e}")
+
         if not self.dirty_servers:
             return
         
-        # 백그라운드에서 I/O 수행
         dirty_copy = set(self.dirty_servers)
-        success_count = 0
-        fail_count = 0
-        
-        for server_id in dirty_copy:
-            status = self.status_cache.get(server_id)
-            if status:
-                try:
-                    self.server_service.update_server(server_id, {"status": status})
-                    success_count += 1
-                except FileNotFoundError as e:
-                    logger.error(f"Server data file not found while saving {server_id}: {e}")
-                    fail_count += 1
-                except PermissionError as e:
-                    logger.error(f"Permission denied while saving {server_id}: {e}")
-                    fail_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to save status for {server_id}: {type(e).__name__}: {e}")
-                    fail_count += 1
+        updates = {
+            server_id: {"status": self.status_cache[server_id]}
+            for server_id in dirty_copy
+            if self.status_cache.get(server_id)
+        }
+
+        # 변경된 서버 상태를 한 번의 파일 쓰기로 저장
+        saved_count = 0
+        try:
+            saved_count = len(self.server_service.update_many(updates))
+        except FileNotFoundError as e:
+            logger.error(f"Server data file not found while saving states: {e}")
+        except PermissionError as e:
+            logger.error(f"Permission denied while saving states: {e}")
+        except Exception as e:
+            logger.error(f"Failed to save states: {type(e).__name__}: {e}")
         
         self.dirty_servers.clear()
         self.last_save_time = time.time()
         
-        if success_count > 0:
-            logger.info(f"States saved to file ({success_count} servers)")
-        if fail_count > 0:
-            logger.warning(f"Failed to save {fail_count} server states")
+        if saved_count > 0:
+            logger.info(f"States saved to file ({saved_count} servers)")
+        if saved_count < len(updates):
+            logger.warning(f"Failed to save {len(updates) - saved_count} server states")
     
     def get_status(self) -> Dict:
         """현재 모니터링 상태 반환"""
@@ -549,4 +1040,21 @@ class MonitorService:
             "monitored_servers": len(self.watchers),
             "dirty_servers": len(self.dirty_servers),
             "last_save": self.last_save_time,
+            "last_cycle_seconds": self.metrics.last_cycle_seconds,
+            "scheduler_lag_seconds": self.metrics.last_lag_seconds,
+            "node_id": self.cluster.node_id if self.cluster is not None else None,
+            "cluster_nodes": list(self.cluster.ring.nodes) if self.cluster is not None else [],
+            "degraded_servers": sum(1 for verdict in self.verdicts.values() if verdict.degraded),
+            "scheduler": self.scheduler.stats(),
+            "inflight_checks": len(self._inflight),
+            "failed_shards": self.engine.failed_shards if self.engine is not None else [],
+            "merged_checks": self.merged_checks,
+            "event_loop_lag": self.loop_lag.stats(),
+            "inflated_checks": self.inflated_checks,
+            "slow_callbacks": self.slow_callbacks.top(5) if self.slow_callbacks is not None else [],
+            "phase_timing_ms": self.phases.stats() if self.phases.enabled else None,
+            "metrics_endpoint": (
+                f"http://{self.metrics_server.host}:{self.metrics_server.port}/metrics"
+                if self.metrics_server is not None else None
+            ),
         }
@@ -0,0 +1,96 @@
+"""
+여러 관측 지점(vantage point)의 체크 결과를 모아 서버 상태를 판정
+
+같은 서버를 담당하는 노드들은 각자의 체크 결과를 observations 테이블에 기록하고,
+담당 노드 중 첫 번째(primary)만 결과를 모아 상태 변화/알림을 처리한다.
+관측 결과는 Watcher 설정 signature의 해시로 묶으므로, 설정이 서로 다른 관측은 섞이지 않는다.
+
+판정:
+    - down 관측이 quorum 이상이면 down
+    - down 관측이 일부만 있으면 degraded path (경고로 처리)
+    - 그 외에는 관측된 상태 중 가장 나쁜 상태
+"""
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from app.core.models import Status
+from app.utils.storage import SQLiteDatabase
+
+_SQL = {
+    "upsert": (
+        "INSERT INTO observations (signature, node_id, status, latency, ts) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(signature, node_id) DO UPDATE SET status=excluded.status, latency=excluded.latency, ts=excluded.ts"
+    ),
+    "prune": "DELETE FROM observations WHERE ts < ?",
+}
+
+# SQLite 변수 개수 제한을 넘지 않도록 IN 절을 나눠서 조회
+_CHUNK = 500
+
+
+def signature_key(signature: tuple | None) -> str:
+    """BaseCheckResult.signature (Watcher 설정) -> 프로세스/노드에 관계없이 같은 키"""
+    return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()
+
+
+class Observation(NamedTuple):
+    node_id: str
+    status: Status
+    latency: float | None
+    timestamp: float
+
+
+class Verdict(NamedTuple):
+    status: Status
+    degraded: bool
+    down_votes: int
+    total: int
+    message: str
+
+
+class QuorumAggregator:
+    def __init__(self, quorum: int = 2) -> None:
+        self.quorum = quorum
+
+    def verdict(self, observations: List[Observation], vantage_points: int) -> Verdict:
+        """vantage_points: 이 서버를 관측하기로 한 노드 수 (quorum은 이 수를 넘지 않음)"""
+        quorum = max(1, min(self.quorum, vantage_points))
+        down = [o.node_id for o in observations if o.status == Status.down]
+        total = len(observations)
+
+        if len(down) >= quorum:
+            return Verdict(Status.down, False, len(down), total,
+                           f"down confirmed by {len(down)}/{total} vantage points ({', '.join(down)})")
+        if down:
+            return Verdict(Status.latency, True, len(down), total,
+                           f"degraded path: {len(down)}/{total} vantage points report down ({', '.join(down)}), quorum is {quorum}")
+
+        worst = max((o.status for o in observations), default=Status.normal)
+        return Verdict(worst, False, 0, total, f"{worst.name} from {total} vantage points")
+
+
+class ObservationStore:
+    """노드 간 공유되는 관측 결과 저장소"""
+
+    def __init__(self, db_file: Path) -> None:
+        self.db = SQLiteDatabase.open(db_file)
+
+    def record(self, node_id: str, rows: Iterable[Tuple[str, int, float | None, float]]) -> None:
+        """(signature key, status, latency, timestamp) 목록 기록"""
+        self.db.write(_SQL["upsert"], [(key, node_id, status, latency, ts) for key, status, latency, ts in rows])
+
+    def fetch(self, keys: List[str], since: float) -> Dict[str, List[Observation]]:
+        found: Dict[str, List[Observation]] = {}
+        for i in range(0, len(keys), _CHUNK):
+            chunk = keys[i:i + _CHUNK]
+            sql = (
+                "SELECT signature, node_id, status, latency, ts FROM observations "
+                f"WHERE ts >= ? AND signature IN ({','.join('?' * len(chunk))})"
+            )
+            for key, node_id, status, latency, ts in self.db.query(sql, (since, *chunk)):
+                found.setdefault(key, []).append(Observation(node_id, Status(status), latency, ts))
+        return found
+
+    def prune(self, before: float) -> None:
+        self.db.write(_SQL["prune"], [(before,)])
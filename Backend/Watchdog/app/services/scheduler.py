@@ -0,0 +1,229 @@
+"""
+서버 상태에 따라 체크 주기를 조절하는 스케줄러
+
+- 안정적인 active 서버: 체크할 때마다 주기를 backoff 배수만큼 늘려 max_interval까지
+- warning/inactive 서버와 최근 상태가 자주 바뀐(flapping) 서버: min_interval
+- 전체 체크 속도는 max_rate(checks/sec) token bucket으로 제한하고,
+  한도에 걸려 밀린 서버는 오래 기다린 순서대로 다음 tick에 수행한다.
+
+다음 체크 시각은 체크가 끝난 시각이 아니라 예정 시각(deadline) + 주기로 계산하므로
+체크 소요 시간이나 루프 지연이 누적되지 않는다. 서버마다 id 해시로 정한 위상(phase)만큼
+체크를 늦춰서 주기 전체에 고르게 분산한다. 첫 체크는 min(주기, first_check_spread) 안에
+분산해서 바로 시작하고, 남은 위상은 두 번째 체크 시각에 더한다 (주기가 길어도 콜드 스타트가 느려지지 않음).
+
+예정 시각을 이미 지나친 경우(overrun) 처리:
+    skip      놓친 슬롯은 버리고 다음 슬롯에 체크
+    coalesce  놓친 슬롯을 한 번으로 합쳐 바로 체크한 뒤 주기 유지
+    catch_up  놓친 슬롯을 연달아 체크 (최대 MAX_CATCH_UP회, 그 이상은 coalesce)
+"""
+import math
+import zlib
+from collections import deque
+from typing import Container, Dict, Iterable, List, Optional
+
+from app.core.models import Status
+
+# 깨어나는 간격의 최소값 (due 시각이 조금씩 다른 서버를 한 번에 모아서 체크)
+TICK_RESOLUTION = 0.5
+# 처음 등록된 서버의 첫 체크를 분산하는 최대 구간 (초)
+FIRST_CHECK_SPREAD = 5.0
+OVERRUN_POLICIES = ("skip", "coalesce", "catch_up")
+MAX_CATCH_UP = 3
+# 설정 변경 등으로 위상과 관계없이 바로 체크할 서버의 due 값
+_IMMEDIATE = float("-inf")
+
+
+def phase_of(server_id: str, interval: float) -> float:
+    """서버별 고정 위상 (0 <= phase < interval)"""
+    return zlib.crc32(server_id.encode("utf-8")) / 2**32 * interval
+
+
+class AdaptiveScheduler:
+    def __init__(
+        self,
+        base_interval: float = 30,
+        min_interval: float = 5,
+        max_interval: float = 300,
+        backoff: float = 1.5,
+        max_rate: Optional[float] = None,
+        flap_window: float = 600,
+        flap_threshold: int = 3,
+        overrun_policy: str = "coalesce",
+        first_check_spread: float = FIRST_CHECK_SPREAD,
+    ) -> None:
+        if overrun_policy not in OVERRUN_POLICIES:
+            raise ValueError(f"overrun_policy must be one of {OVERRUN_POLICIES}")
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_rate = max_rate
+        self.flap_window = flap_window
+        self.flap_threshold = flap_threshold
+        self.overrun_policy = overrun_policy
+        self.first_check_spread = first_check_spread
+        self.missed_slots = 0  # overrun으로 놓친 슬롯 수
+        self.skipped_busy = 0  # 이전 체크가 아직 진행 중이라 건너뛴 횟수
+
+        self._due: Dict[str, float] = {}  # server_id -> 다음 체크 시각 (monotonic)
+        self._scheduled: Dict[str, float] = {}  # 체크 중인 서버의 예정 시각
+        self._behind: Dict[str, int] = {}  # catch_up 중 남은 슬롯 수
+        self._shift: Dict[str, float] = {}  # 첫 체크 후 두 번째 체크 시각에 더할 나머지 위상
+        self._interval: Dict[str, float] = {}
+        self._last: Dict[str, Status] = {}
+        self._flips: Dict[str, deque[float]] = {}  # 최근 상태 변화 시각
+        self._tokens = 0.0
+        self._refilled_at: Optional[float] = None
+
+    def _fast(self) -> float:
+        return min(self.min_interval, self.base_interval)
+
+    def _slow(self) -> float:
+        return max(self.max_interval, self.base_interval)
+
+    def _refill(self, now: float) -> None:
+        if self.max_rate is None:
+            return
+        # 최대 1초 분량까지만 모아둠 (max_rate < 1이어도 체크 1회 분량은 모일 수 있도록)
+        capacity = max(1.0, self.max_rate)
+        if self._refilled_at is None:
+            self._tokens = capacity
+        else:
+            self._tokens = min(capacity, self._tokens + (now - self._refilled_at) * self.max_rate)
+        self._refilled_at = now
+
+    def due(self, server_ids: Iterable[str], now: float, busy: Container[str] = ()) -> List[str]:
+        """지금 체크할 서버 목록 (처음 보는 서버는 first_check_spread 안의 위상만큼 뒤에 첫 체크 예약)
+
+        busy: 체크가 진행 중인 서버. 중복 체크하지 않고, 진행 중인 체크가 끝나면
+        그 결과로 다음 체크 시각이 정해진다.
+        """
+        overdue = []
+        for server_id in server_ids:
+            due_at = self._due.get(server_id)
+            if due_at is None:
+                phase = phase_of(server_id, min(self.base_interval, self.first_check_spread))
+                self._shift[server_id] = phase_of(server_id, self.base_interval) - phase
+                due_at = self._due[server_id] = now + phase
+            if due_at <= now:
+                if server_id in busy:
+                    self.skipped_busy += 1
+                    self._due[server_id] = now + self._interval.get(server_id, self.base_interval)
+                    continue
+                overdue.append((due_at, server_id))
+
+        if self.max_rate is not None:
+            self._refill(now)
+            allowed = int(self._tokens)
+            if len(overdue) > allowed:
+                overdue.sort()
+                del overdue[allowed:]
+            self._tokens -= len(overdue)
+
+        for due_at, server_id in overdue:
+            self._scheduled[server_id] = now if due_at == _IMMEDIATE else due_at
+            # 체크가 실패해서 observe가 호출되지 않아도 다시 시도되도록 임시 due 설정
+            self._due[server_id] = now + self._interval.get(server_id, self.base_interval)
+        return [server_id for _, server_id in overdue]
+
+    def observe(self, server_id: str, status: Status, now: float) -> None:
+        """체크 결과로 다음 체크 시각 결정"""
+        previous = self._last.get(server_id)
+        self._last[server_id] = status
+
+        flips = self._flips.get(server_id)
+        if previous is not None and previous != status:
+            if flips is None:
+                flips = self._flips[server_id] = deque()
+            flips.append(now)
+        if flips:
+            while flips and flips[0] < now - self.flap_window:
+                flips.popleft()
+            if not flips:
+                del self._flips[server_id]
+
+        if status != Status.normal or (flips is not None and len(flips) >= self.flap_threshold):
+            interval = self._fast()
+        elif previous != Status.normal:
+            # 복구 직후 또는 처음 체크한 서버는 기본 주기부터 다시 늘려감
+            interval = self.base_interval
+        else:
+            interval = min(self._interval.get(server_id, self.base_interval) * self.backoff, self._slow())
+
+        self._interval[server_id] = interval
+        scheduled = self._scheduled.pop(server_id, now) + self._shift.pop(server_id, 0.0)
+        self._due[server_id] = self._next_deadline(server_id, scheduled, interval, now)
+
+    def _next_deadline(self, server_id: str, scheduled: float, interval: float, now: float) -> float:
+        deadline = scheduled + interval
+        if deadline > now:
+            self._behind.pop(server_id, None)
+            return deadline
+
+        # 체크가 주기보다 오래 걸렸거나 루프가 밀림
+        missed = math.floor((now - scheduled) / interval)
+        if self.overrun_policy == "catch_up":
+            behind = self._behind.get(server_id)
+            if behind is None:
+                self.missed_slots += missed
+                behind = min(missed, MAX_CATCH_UP)
+            if behind > 0:
+                self._behind[server_id] = behind - 1
+                return deadline
+            self._behind.pop(server_id, None)
+        else:
+            self.missed_slots += missed
+
+        if self.overrun_policy == "skip":
+            return scheduled + (missed + 1) * interval
+        return now
+
+    def forget(self, server_id: str) -> None:
+        """삭제된 서버의 스케줄 제거"""
+        self._due.pop(server_id, None)
+        self._scheduled.pop(server_id, None)
+        self._behind.pop(server_id, None)
+        self._shift.pop(server_id, None)
+        self._interval.pop(server_id, None)
+        self._last.pop(server_id, None)
+        self._flips.pop(server_id, None)
+
+    def reset(self, server_id: str) -> None:
+        """설정이 변경된 서버를 처음부터 다시 스케줄 (다음 tick에 바로 체크)"""
+        self.forget(server_id)
+        self._due[server_id] = _IMMEDIATE
+
+    def retain(self, server_ids: Iterable[str]) -> None:
+        keep = set(server_ids)
+        for server_id in [server_id for server_id in self._due if server_id not in keep]:
+            self.forget(server_id)
+
+    def next_wakeup(self, now: float, limit: float) -> float:
+        """다음 체크 시각 (최대 limit초 후, 서버 추가 등은 이 간격 안에 반영됨)"""
+        wakeup = min(self._due.values(), default=now + limit)
+        if self.max_rate is not None and self._tokens < 1 and any(due <= now for due in self._due.values()):
+            # 한도에 걸려 밀린 서버가 있으면 token이 찰 때 깨어남
+            wakeup = max(wakeup, now + (1 - self._tokens) / self.max_rate)
+        return min(max(wakeup, now + TICK_RESOLUTION), now + limit)
+
+    @property
+    def slowest_interval(self) -> float:
+        """backoff로 늘어날 수 있는 가장 긴 체크 주기"""
+        return self._slow()
+
+    def interval_of(self, server_id: str) -> float:
+        return self._interval.get(server_id, self.base_interval)
+
+    def stats(self) -> Dict:
+        """스케줄된 체크 속도와 주기 분포"""
+        intervals = [self._interval.get(server_id, self.base_interval) for server_id in self._due]
+        return {
+            "probe_rate": round(sum(1 / interval for interval in intervals), 3),
+            "max_rate": self.max_rate,
+            "fast": sum(1 for interval in intervals if interval <= self._fast()),
+            "backed_off": sum(1 for interval in intervals if interval > self.base_interval),
+            "flapping": sum(1 for flips in self._flips.values() if len(flips) >= self.flap_threshold),
+            "overrun_policy": self.overrun_policy,
+            "missed_slots": self.missed_slots,
+            "skipped_busy": self.skipped_busy,
+        }
@@ -2,14 +2,33 @@ import json
 import uuid
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from app.config import SERVERS_DATA_FILE, SERVER_STATUS
+from app.config import SERVERS_DATA_FILE, SERVER_STATUS, SAVE_DEBOUNCE_SECONDS, STORAGE_BACKEND
 from app.utils.server_logger import FileManager
 
 logger = logging.getLogger("ServerService")
 
 
+def _duplicate_key(server: Dict) -> Optional[Tuple]:
+    """중복 판별 키 생성"""
+    server_type = server.get('server_type')
+
+    # Web 서버: URL + Endpoint로 비교
+    if server_type == 'web':
+        return ('web', server.get('url'), server.get('endpoint'))
+
+    # DB 서버: DBMS + Host + Port + DB_NAME으로 비교
+    if server_type == 'db':
+        port = server.get('port')
+        return (
+            'db', server.get('dbms'), server.get('host'),
+            str(port) if port is not None else None, server.get('db_name')
+        )
+
+    return None
+
+
 class ServerService:
     """서버 데이터 관리 서비스 (Singleton)"""
     
@@ -25,21 +44,74 @@ class ServerService:
         if self._initialized:
             return
 
-        self.file_manager = FileManager(SERVERS_DATA_FILE, "servers")
+        # 저장은 백그라운드에서 모아서 수행 (GUI 스레드를 막지 않음)
+        self.file_manager = FileManager(
+            SERVERS_DATA_FILE, "servers",
+            debounce=SAVE_DEBOUNCE_SECONDS, backend=STORAGE_BACKEND
+        )
         self.listeners = []  # 리스너 목록
         self._initialized = True
-        self.servers: List[Dict] = []
+
+        # id -> 서버 데이터 (입력 순서 유지)
+        self._servers: Dict[str, Dict] = {}
+        # 보조 인덱스 (값은 순서를 유지하는 id 집합)
+        self._by_type: Dict[str, Dict[str, None]] = {}
+        self._by_status: Dict[str, Dict[str, None]] = {}
+        self._by_key: Dict[Tuple, str] = {}
+        # 변경 시마다 증가하는 버전과 get_all_servers() 스냅샷 캐시 (내부 dict의 사본)
+        self.version = 0
+        self._snapshot: Optional[Tuple[Dict, ...]] = None
+
         servers = self.file_manager.load()
         
         if isinstance(servers, list):
-            self.servers = servers
+            for server in servers:
+                self._insert(server)
+    
+    @property
+    def servers(self) -> List[Dict]:
+        """저장용 서버 목록"""
+        return list(self._servers.values())
+
+    def _index(self, server: Dict) -> None:
+        server_id = server["id"]
+        self._by_type.setdefault(server.get("server_type"), {})[server_id] = None # type: ignore
+        self._by_status.setdefault(server.get("status"), {})[server_id] = None # type: ignore
+        key = _duplicate_key(server)
+        if key is not None:
+            self._by_key.setdefault(key, server_id)
+
+    def _unindex(self, server: Dict) -> None:
+        server_id = server["id"]
+        self._by_type.get(server.get("server_type"), {}).pop(server_id, None) # type: ignore
+        self._by_status.get(server.get("status"), {}).pop(server_id, None) # type: ignore
+        key = _duplicate_key(server)
+        if key is not None and self._by_key.get(key) == server_id:
+            del self._by_key[key]
+
+    def _touch(self) -> None:
+        self.version += 1
+        self._snapshot = None
+
+    def _insert(self, server: Dict) -> None:
+        self._servers[server["id"]] = server
+        self._index(server)
+        self._touch()
+
+    def _apply(self, server: Dict, updates: Dict, timestamp: str) -> None:
+        """서버 데이터 변경 및 인덱스 갱신"""
+        self._unindex(server)
+        server.update(updates)
+        server["updated_at"] = timestamp
+        self._index(server)
+        self._touch()
     
     def add_listener(self, callback):
         """데이터 변경 리스너 추가"""
         if callback not in self.listeners:
             self.listeners.append(callback)
             
-    def _notify_listeners(self, event_type: str, server_data: Dict):
+    def _notify_listeners(self, event_type: str, server_data: Dict | List[Dict]):
         """리스너들에게 변경 알림"""
         for listener in self.listeners:
             try:
@@ -47,6 +119,37 @@ class ServerService:
             except Exception as e:
                 logger.error(f"Error in server service listener: {e}")
     
+    def _persist(self, changed: Optional[List[Dict]] = None, deleted: Optional[List[str]] = None):
+        """변경 내용 저장 (행 단위 저장소는 변경된 행만, JSON은 전체 목록)"""
+        if not self.file_manager.supports_rows:
+            self.file_manager.save(self.servers)
+            return
+
+        if changed:
+            self.file_manager.upsert(changed)
+        if deleted:
+            self.file_manager.delete(deleted)
+
+    def record_transitions(self, transitions: List[Tuple[str, Optional[str], str, float]]):
+        """상태 변화 이력 기록 (이력을 지원하는 저장소에서만 저장)"""
+        storage = self.file_manager.storage
+        if transitions and hasattr(storage, "record_transitions"):
+            storage.record_transitions(transitions) # type: ignore
+
+    def get_status_history(
+        self, server_id: str, since: Optional[float] = None,
+        until: Optional[float] = None, limit: Optional[int] = None
+    ) -> List[Dict]:
+        """서버 상태 변화 이력 조회 (최신순)"""
+        storage = self.file_manager.storage
+        if not hasattr(storage, "query_transitions"):
+            return []
+        return storage.query_transitions(server_id, since, until, limit) # type: ignore
+
+    def flush(self):
+        """대기 중인 저장 작업을 즉시 파일에 기록"""
+        self.file_manager.flush()
+    
     def _generate_id(self) -> str:
         """고유한 UUID 생성"""
         return str(uuid.uuid4())
@@ -56,39 +159,40 @@ class ServerService:
         return datetime.now().isoformat()
     
     def get_all_servers(self) -> List[Dict]:
-        """모든 서버 목록 반환"""
-        return self.servers.copy()
+        """모든 서버 목록 반환
+
+        인덱스가 참조하는 내부 dict 대신 사본을 반환한다. 사본은 변경이 있을 때까지
+        호출 간에 공유되므로, 수정하려면 다시 복사해서 사용한다.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(server.copy() for server in self._servers.values())
+        return list(self._snapshot)
     
     def get_server_by_id(self, server_id: str) -> Optional[Dict]:
         """ID로 특정 서버 조회"""
-        for server in self.servers:
-            if server.get("id") == server_id:
-                return server.copy()
-        return None
+        server = self._servers.get(server_id)
+        return server.copy() if server else None
     
     def _check_duplicate(self, server_data: Dict) -> Optional[Dict]:
         """중복 서버 검사"""
-        server_type = server_data.get('server_type')
-        
-        for server in self.servers:
-            if server.get('server_type') != server_type:
-                continue
-            
-            # Web 서버: URL + Endpoint로 비교
-            if server_type == 'web':
-                if (server.get('url') == server_data.get('url') and 
-                    server.get('endpoint') == server_data.get('endpoint')):
-                    return server
-            
-            # DB 서버: Host + Port + DB_NAME으로 비교
-            elif server_type == 'db':
-                if (server.get('DBMS') == server_data.get('dbms') and
-                    server.get('HOST') == server_data.get('host') and 
-                    server.get('PORT') == server_data.get('port') and
-                    server.get('DB_NAME') == server_data.get('db_name')):
-                    return server
-        
-        return None
+        key = _duplicate_key(server_data)
+        if key is None:
+            return None
+
+        server_id = self._by_key.get(key)
+        return self._servers.get(server_id) if server_id else None
+
+    def _new_server(self, server_data: Dict) -> Dict:
+        # ID와 타임스탬프 자동 생성
+        timestamp = self._get_timestamp()
+        return {
+            "id": self._generate_id(),
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "status": SERVER_STATUS["ACTIVE"],  # 기본 상태
+            "is_monitoring_enabled": True,  # 기본값: 모니터링 활성화
+            **server_data
+        }
     
     def add_server(self, server_data: Dict) -> Dict:
         """새 서버 추가"""
@@ -97,57 +201,99 @@ class ServerService:
         if duplicate:
             raise ValueError(f"동일한 서버가 이미 존재합니다: {duplicate.get('name', 'Unknown')}")
         
-        # ID와 타임스탬프 자동 생성
-        new_server = {
-            "id": self._generate_id(),
-            "created_at": self._get_timestamp(),
-            "updated_at": self._get_timestamp(),
-            "status": SERVER_STATUS["ACTIVE"],  # 기본 상태
-            "is_monitoring_enabled": True,  # 기본값: 모니터링 활성화
-            **server_data
-        }
+        new_server = self._new_server(server_data)
         
-        self.servers.append(new_server)
-        self.file_manager.save(self.servers)
+        self._insert(new_server)
+        self._persist(changed=[new_server])
         
-        self._notify_listeners("add", new_server)
-        return new_server.copy()
+        added_server = new_server.copy()
+        self._notify_listeners("add", added_server)
+        return added_server
+
+    def add_many(self, servers_data: List[Dict]) -> List[Dict]:
+        """여러 서버를 한 번에 추가 (대량 등록용, 파일은 한 번만 저장)"""
+        # 기존 서버 및 입력 목록 내부 중복을 먼저 모두 검사 (일부만 추가되는 상황 방지)
+        batch_keys = set()
+        for server_data in servers_data:
+            duplicate = self._check_duplicate(server_data)
+            key = _duplicate_key(server_data)
+            if duplicate or (key is not None and key in batch_keys):
+                name = (duplicate or server_data).get('name', 'Unknown')
+                raise ValueError(f"동일한 서버가 이미 존재합니다: {name}")
+            if key is not None:
+                batch_keys.add(key)
+
+        new_servers = []
+        for server_data in servers_data:
+            new_server = self._new_server(server_data)
+            self._insert(new_server)
+            new_servers.append(new_server)
+
+        if new_servers:
+            self._persist(changed=new_servers)
+
+        added_servers = [s.copy() for s in new_servers]
+        for added_server in added_servers:
+            self._notify_listeners("add", added_server)
+        return added_servers
     
     def update_server(self, server_id: str, updates: Dict) -> Optional[Dict]:
         """서버 정보 업데이트"""
-        for i, server in enumerate(self.servers):
-            if server.get("id") == server_id:
-                # 기존 데이터 업데이트
-                self.servers[i].update(updates)
-                # updated_at 갱신
-                self.servers[i]["updated_at"] = self._get_timestamp()
-                
-                self.file_manager.save(self.servers)
-                
-                updated_server = self.servers[i].copy()
-                self._notify_listeners("update", updated_server)
-                return updated_server
+        server = self._servers.get(server_id)
+        if server is None:
+            return None
+
+        self._apply(server, updates, self._get_timestamp())
+        
+        self._persist(changed=[server])
         
-        return None
+        updated_server = server.copy()
+        self._notify_listeners("update", updated_server)
+        return updated_server
+
+    def update_many(self, updates: Dict[str, Dict]) -> List[Dict]:
+        """여러 서버 정보를 한 번에 업데이트
+
+        메모리에 모두 반영한 뒤 파일은 한 번만 저장하고,
+        리스너에는 변경된 서버 목록을 담은 "batch_update" 이벤트를 한 번만 보낸다.
+        """
+        if not updates:
+            return []
+
+        timestamp = self._get_timestamp()
+        updated_servers = []
+        for server_id, changes in updates.items():
+            server = self._servers.get(server_id)
+            if server is None:
+                continue
+
+            self._apply(server, changes, timestamp)
+            updated_servers.append(server.copy())
+
+        if not updated_servers:
+            return []
+
+        self._persist(changed=updated_servers)
+
+        self._notify_listeners("batch_update", updated_servers)
+        return updated_servers
     
     def delete_server(self, server_id: str) -> bool:
         """서버 삭제"""
-        initial_length = len(self.servers)
-        deleted_server = next((s for s in self.servers if s.get("id") == server_id), None)
-        self.servers = [s for s in self.servers if s.get("id") != server_id]
-        
-        if len(self.servers) < initial_length:
-            self.file_manager.save(self.servers)
-            if deleted_server:
-                self._notify_listeners("delete", deleted_server)
-            return True
-        
-        return False
+        deleted_server = self._servers.pop(server_id, None)
+        if deleted_server is None:
+            return False
+
+        self._unindex(deleted_server)
+        self._touch()
+        self._persist(deleted=[server_id])
+        self._notify_listeners("delete", deleted_server)
+        return True
     
     def get_servers_by_type(self, server_type: str) -> List[Dict]:
         """타입별로 서버 목록 조회"""
-        return [s.copy() for s in self.servers if s.get("server_type") == server_type]
+        return [self._servers[i].copy() for i in self._by_type.get(server_type, {})]
     
     def get_servers_by_status(self, status: str) -> List[Dict]:
         """상태별로 서버 목록 조회"""
-        return [s.copy() for s in self.servers if s.get("status") == status]
+        return [self._servers[i].copy() for i in self._by_status.get(status, {})]
@@ -0,0 +1,533 @@
+"""
+멀티 프로세스 샤딩 모니터링 엔진
+
+서버 id의 crc32 해시로 N개의 워커 프로세스에 서버를 나눠 맡긴다.
+각 워커는 자신의 이벤트 루프와 Watcher를 가지고 체크를 수행하며,
+부모 프로세스(MonitorService)에는 Pipe로 압축된 결과 배치만 돌려준다.
+
+결과 배치 항목: (server_id, Status 값, latency, detail)
+    detail은 워커 기준으로 상태가 바뀐 경우에만 포함된다 (로그/알림용 결과 dump 또는 에러 메시지).
+
+메시지 형식: 부모 -> 워커 (command, request_id, payload), 워커 -> 부모 (kind, request_id, body)
+    check 요청의 결과는 끝나는 대로 RESULT_BATCH_SECONDS 단위로 모아 "records"로 보내고,
+    마지막에 "reply"로 완료를 알린다. 느린 서버가 같은 배치의 다른 서버 결과를 붙잡지 않는다.
+    워커는 HEARTBEAT_SECONDS마다 "alive"를 보내며, WORKER_TIMEOUT 동안 아무 메시지도 없으면
+    부모가 멈춘 워커로 보고 재시작한다.
+"""
+import asyncio
+import functools
+import logging
+import signal
+import threading
+import time
+import zlib
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.models import BaseConfig, Status
+from app.core.template import compile_template
+from app.utils.server_logger import CustomLogger
+
+logger = logging.getLogger("ShardEngine")
+
+CheckRecord = Tuple[str, int, Optional[float], Any]
+
+# 워커가 죽었을 때 다시 띄우는 최대 횟수와 재시도 간 대기 (초, 매번 2배)
+MAX_RESTART_ATTEMPTS = 3
+RESTART_BACKOFF = 0.5
+# 워커가 끝난 체크 결과를 모아서 보내는 간격 (초)
+RESULT_BATCH_SECONDS = 0.05
+# 워커 생존 신호 간격과, 아무 메시지도 없을 때 멈춘 것으로 보는 시간 (초)
+HEARTBEAT_SECONDS = 1.0
+WORKER_TIMEOUT = 30.0
+
+
+def shard_of(server_id: str, shards: int) -> int:
+    """프로세스와 실행 시점에 관계없이 같은 값을 주는 서버 -> 샤드 매핑"""
+    return zlib.crc32(server_id.encode("utf-8")) % shards
+
+
+class RemoteWatcher:
+    """워커 프로세스에서 실행되는 Watcher의 부모 프로세스 쪽 대리 객체
+
+    상태 변화 로그/알림에 필요한 config.name, logger, status, template만 가진다.
+    (실제 체크 결과는 워커에 있으므로 알림은 상태와 에러 메시지만으로 렌더링)
+    """
+    template = compile_template("status: {status}\nmessage: {message}\nerror: {error_message}")
+
+    def __init__(self, server_data: Dict, config: BaseConfig) -> None:
+        self.server_data = server_data
+        self.config = config
+        self.logger = CustomLogger(config.name + "_watcher") if config.name else CustomLogger("unknown_watcher")
+        # BaseWatcher._signature()와 같은 값 (관측 결과 연관용)
+        self.sign = tuple(sorted(config.model_dump().items()))
+        # 알림 라우팅에 사용하는 마지막 상태 (set_alert가 갱신)
+        self.status = Status.normal
+
+
+# 워커 프로세스
+class _ShardWorker:
+    def __init__(self, conn: Connection, index: int, concurrency: int, max_retries: Optional[int]) -> None:
+        self.conn = conn
+        self.index = index
+        self.max_retries = max_retries
+        self.watchers: Dict[str, Any] = {}
+        self.last_status: Dict[str, int] = {}
+        self.semaphore = asyncio.Semaphore(concurrency)
+        # server_id -> 진행 중인 체크 (삭제/교체 시 취소)
+        self.running: Dict[str, asyncio.Task] = {}
+        self.requests: Set[asyncio.Task] = set()
+
+    def _send(self, kind: str, request_id: int, body: Any = None) -> None:
+        try:
+            self.conn.send((kind, request_id, body))
+        except OSError:
+            # 부모 프로세스 종료 (serve의 recv가 곧 끝남)
+            pass
+
+    async def serve(self) -> None:
+        loop = asyncio.get_running_loop()
+        heartbeat = asyncio.create_task(self._heartbeat())
+        while True:
+            try:
+                command, request_id, payload = await loop.run_in_executor(None, self.conn.recv)
+            except (EOFError, OSError):
+                # 부모 프로세스 종료
+                break
+
+            if command == "check":
+                # payload: 체크할 server_id 목록 (None이면 전체), 체크는 백그라운드에서 진행하고 다음 명령을 바로 받음
+                task = asyncio.create_task(self._run_checks(request_id, payload))
+                self.requests.add(task)
+                task.add_done_callback(self.requests.discard)
+            elif command == "assign":
+                await self._assign(payload)
+                self._send("reply", request_id, len(self.watchers))
+            elif command == "remove":
+                await self._remove(payload)
+                self._send("reply", request_id, len(self.watchers))
+            elif command == "stop":
+                for task in list(self.requests):
+                    task.cancel()
+                await self._remove(list(self.watchers))
+                self._send("reply", request_id, 0)
+                break
+        heartbeat.cancel()
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            self._send("alive", 0)
+
+    async def _run_checks(self, request_id: int, server_ids: Optional[List[str]]) -> None:
+        """체크를 동시에 시작하고, 끝난 결과를 RESULT_BATCH_SECONDS마다 모아서 전송"""
+        started = time.perf_counter()
+        targets = self.watchers if server_ids is None else {
+            server_id: self.watchers[server_id] for server_id in server_ids if server_id in self.watchers
+        }
+        outbox: List[CheckRecord] = []
+        tasks = []
+        for server_id, watcher in targets.items():
+            if server_id in self.running:
+                continue
+            task = self.running[server_id] = asyncio.create_task(self._check(server_id, watcher))
+            task.add_done_callback(functools.partial(self._collect, server_id, outbox))
+            tasks.append(task)
+
+        try:
+            if tasks:
+                done = asyncio.gather(*tasks, return_exceptions=True)
+                while not done.done():
+                    await asyncio.wait([done], timeout=RESULT_BATCH_SECONDS)
+                    if outbox:
+                        self._send("records", request_id, outbox[:])
+                        outbox.clear()
+        finally:
+            if outbox:
+                self._send("records", request_id, outbox)
+            self._send("reply", request_id, time.perf_counter() - started)
+
+    def _collect(self, server_id: str, outbox: List[CheckRecord], task: asyncio.Task) -> None:
+        if self.running.get(server_id) is task:
+            del self.running[server_id]
+        if not task.cancelled():
+            outbox.append(task.result())
+
+    async def _cancel_check(self, server_id: str) -> None:
+        task = self.running.pop(server_id, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _assign(self, servers: List[Dict]) -> None:
+        from app.core.registry import create_watcher
+
+        for server_data in servers:
+            server_id = server_data['id']
+            try:
+                watcher = create_watcher(server_data)
+            except Exception as e:
+                logger.error(f"[shard {self.index}] Failed to create watcher for '{server_data.get('name')}': {type(e).__name__}: {e}")
+                await self._remove([server_id])
+                continue
+            if self.max_retries is not None:
+                watcher.max_retries = min(watcher.max_retries, self.max_retries)
+
+            previous = self.watchers.get(server_id)
+            self.watchers[server_id] = watcher
+            if previous is not None:
+                await self._cancel_check(server_id)
+                await self._cleanup(previous)
+
+    async def _remove(self, server_ids: List[str]) -> None:
+        for server_id in server_ids:
+            self.last_status.pop(server_id, None)
+            watcher = self.watchers.pop(server_id, None)
+            if watcher is not None:
+                await self._cancel_check(server_id)
+                await self._cleanup(watcher)
+
+    async def _cleanup(self, watcher: Any) -> None:
+        try:
+            await watcher.cleanup()
+        except Exception as e:
+            logger.error(f"[shard {self.index}] Failed to cleanup watcher: {e}")
+
+    async def _check(self, server_id: str, watcher: Any) -> CheckRecord:
+        detail: Any = None
+        latency = None
+        try:
+            async with self.semaphore:
+                result = await watcher.acheck()
+            status = result.status.value
+            latency = getattr(result, "latency", None)
+            if self.last_status.get(server_id) != status:
+                detail = result.model_dump()
+        except asyncio.TimeoutError:
+            status = Status.down.value
+            detail = f"Timeout checking server {server_id} ({watcher.config.name})"
+        except ConnectionError as e:
+            status = Status.down.value
+            detail = f"Connection error for server {server_id} ({watcher.config.name}): {e}"
+        except Exception as e:
+            status = Status.down.value
+            detail = f"Unexpected error checking server {server_id} ({watcher.config.name}): {type(e).__name__}: {e}"
+
+        self.last_status[server_id] = status
+        return (server_id, status, latency, detail)
+
+
+def _worker_main(conn: Connection, index: int, concurrency: int, max_retries: Optional[int]) -> None:
+    # 종료는 부모 프로세스가 stop 명령으로 처리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_ShardWorker(conn, index, concurrency, max_retries).serve())
+
+
+# 부모 프로세스
+class _WorkerHandle:
+    def __init__(self, index: int, process: mp.process.BaseProcess, conn: Connection, loop: asyncio.AbstractEventLoop) -> None:
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.loop = loop
+        # 재시작을 모두 실패한 샤드 (요청을 보내지 않음)
+        self.failed = False
+        # 마지막으로 워커 메시지를 받은 시각 (reader 스레드가 갱신)
+        self.last_seen = time.monotonic()
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._streams: Dict[int, Callable[[List[CheckRecord]], None]] = {}
+        self._reader = threading.Thread(target=self._read, name=f"watchdog-shard-{index}-reader", daemon=True)
+        self._reader.start()
+
+    def send(self, command: str, payload: Any = None, on_records: Optional[Callable[[List[CheckRecord]], None]] = None) -> asyncio.Future:
+        """명령 전송 (이벤트 루프 스레드에서 호출, 응답은 반환한 Future로 전달)
+
+        on_records: check 요청의 중간 결과 배치를 받을 콜백
+        """
+        future = self.loop.create_future()
+        self._next_id += 1
+        try:
+            self.conn.send((command, self._next_id, payload))
+        except OSError as e:
+            future.set_exception(e)
+            return future
+        self._pending[self._next_id] = future
+        if on_records is not None:
+            self._streams[self._next_id] = on_records
+        return future
+
+    def _read(self) -> None:
+        """워커 메시지를 받아 이벤트 루프로 넘기는 스레드 (워커가 종료되면 대기 중인 요청을 실패 처리)"""
+        error: BaseException
+        try:
+            while True:
+                message = self.conn.recv()
+                self.last_seen = time.monotonic()
+                self.loop.call_soon_threadsafe(self._deliver, message)
+        except (EOFError, OSError) as e:
+            error = e
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘
+            return
+        except Exception as e:
+            error = EOFError(f"{type(e).__name__}: {e}")
+        finally:
+            self.conn.close()
+        try:
+            self.loop.call_soon_threadsafe(self.abort, error)
+        except RuntimeError:
+            pass
+
+    def _deliver(self, message: Tuple[str, int, Any]) -> None:
+        kind, request_id, body = message
+        if kind == "records":
+            stream = self._streams.get(request_id)
+            if stream is not None and body:
+                try:
+                    stream(body)
+                except Exception as e:
+                    logger.error(f"Failed to apply results from shard worker {self.index}: {type(e).__name__}: {e}")
+        elif kind == "reply":
+            self._streams.pop(request_id, None)
+            future = self._pending.pop(request_id, None)
+            if future is not None and not future.done():
+                future.set_result(body)
+        # "alive"는 last_seen 갱신만
+
+    def abort(self, error: BaseException) -> None:
+        """응답을 기다리는 요청을 모두 실패 처리"""
+        pending, self._pending = self._pending, {}
+        self._streams.clear()
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def wait(self, future: asyncio.Future) -> Any:
+        """응답 대기 (WORKER_TIMEOUT 동안 워커 메시지가 없으면 TimeoutError)"""
+        try:
+            while True:
+                try:
+                    return await asyncio.wait_for(asyncio.shield(future), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if time.monotonic() - self.last_seen > WORKER_TIMEOUT:
+                        raise
+        except BaseException:
+            future.cancel()
+            raise
+
+
+class ShardedEngine:
+    """MonitorService가 사용하는 워커 프로세스 풀"""
+
+    def __init__(self, workers: int, concurrency: int = 100, max_retries: Optional[int] = None) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.size = workers
+        self.concurrency = concurrency
+        # 지정 시 워커의 Watcher 재시도 횟수 상한
+        self.max_retries = max_retries
+        self._ctx = mp.get_context("spawn")
+        self._workers: List[_WorkerHandle] = []
+        # server_id -> 워커에 전달한 RemoteWatcher (교체 여부는 객체 동일성으로 판단)
+        self._assigned: Dict[str, RemoteWatcher] = {}
+        self.last_cycle_seconds: List[float] = []
+        # 샤드 번호 -> 진행 중인 재시작 (동시에 실패한 요청이 한 번만 재시작하도록)
+        self._restarting: Dict[int, "asyncio.Task[None]"] = {}
+
+    def _spawn(self, index: int) -> _WorkerHandle:
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main, args=(child_conn, index, self.concurrency, self.max_retries),
+            name=f"watchdog-shard-{index}", daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _WorkerHandle(index, process, parent_conn, asyncio.get_running_loop())
+
+    async def start(self) -> None:
+        self._workers = [self._spawn(i) for i in range(self.size)]
+        logger.info(f"Started {self.size} shard workers")
+
+    async def _request(
+        self, worker: _WorkerHandle, command: str, payload: Any = None,
+        on_records: Optional[Callable[[List[CheckRecord]], None]] = None
+    ) -> Any:
+        if worker.failed:
+            return None
+        return await self._finish(worker, worker.send(command, payload, on_records))
+
+    async def _finish(self, worker: _WorkerHandle, future: asyncio.Future) -> Any:
+        """응답 대기, 워커가 죽었거나 멈췄으면 재시작하고 None 반환"""
+        try:
+            return await worker.wait(future)
+        except asyncio.TimeoutError:
+            logger.error(f"Shard worker {worker.index} sent nothing for {WORKER_TIMEOUT:g}s, restarting")
+        except (EOFError, OSError) as e:
+            logger.error(f"Shard worker {worker.index} failed ({type(e).__name__}: {e}), restarting")
+        await self._restart(worker)
+        return None
+
+    async def _restart(self, worker: _WorkerHandle) -> None:
+        """죽은 워커를 다시 띄우고 해당 샤드의 서버를 재할당"""
+        task = self._restarting.get(worker.index)
+        if task is None:
+            if worker.index >= len(self._workers) or self._workers[worker.index] is not worker:
+                # 다른 요청이 이미 교체함
+                return
+            task = self._restarting[worker.index] = asyncio.create_task(self._respawn(worker))
+            task.add_done_callback(lambda _: self._restarting.pop(worker.index, None))
+        await asyncio.shield(task)
+
+    async def _respawn(self, worker: _WorkerHandle) -> None:
+        """MAX_RESTART_ATTEMPTS번까지 backoff 후 재시작, 모두 실패하면 샤드를 failed로 표시"""
+        delay = RESTART_BACKOFF
+        current = worker
+        for attempt in range(1, MAX_RESTART_ATTEMPTS + 1):
+            self._discard(current)
+            await asyncio.sleep(delay)
+            delay *= 2
+
+            current = self._spawn(worker.index)
+            self._workers[worker.index] = current
+            servers = [
+                remote.server_data for server_id, remote in self._assigned.items()
+                if shard_of(server_id, self.size) == worker.index
+            ]
+            if not servers:
+                return
+            try:
+                await current.wait(current.send("assign", servers))
+                return
+            except (EOFError, OSError) as e:
+                logger.error(
+                    f"Shard worker {worker.index} failed on assign "
+                    f"(attempt {attempt}/{MAX_RESTART_ATTEMPTS}, {type(e).__name__}: {e})"
+                )
+
+        self._discard(current)
+        current.failed = True
+        logger.error(f"Shard worker {worker.index} marked as failed after {MAX_RESTART_ATTEMPTS} restart attempts")
+
+    @staticmethod
+    def _discard(worker: _WorkerHandle) -> None:
+        # Pipe는 reader 스레드가 EOF를 받은 뒤 닫음
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.abort(EOFError(f"shard worker {worker.index} was restarted"))
+
+    async def apply(self, watchers: Dict[str, Any]) -> None:
+        """watchers 목록과 워커 할당을 맞춤 (추가/변경/삭제된 서버만 전달)"""
+        assign: Dict[int, List[Dict]] = {}
+        remove: Dict[int, List[str]] = {}
+
+        for server_id, remote in watchers.items():
+            if self._assigned.get(server_id) is not remote:
+                assign.setdefault(shard_of(server_id, self.size), []).append(remote.server_data)
+        for server_id in self._assigned.keys() - watchers.keys():
+            remove.setdefault(shard_of(server_id, self.size), []).append(server_id)
+
+        if not assign and not remove:
+            return
+
+        requests = [self._request(self._workers[i], "remove", ids) for i, ids in remove.items()]
+        requests += [self._request(self._workers[i], "assign", servers) for i, servers in assign.items()]
+        await asyncio.gather(*requests)
+        self._assigned = dict(watchers)
+
+    async def resize(self, workers: int) -> None:
+        """워커 수 변경 (해시 결과가 바뀐 서버만 이동)"""
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if workers == self.size:
+            return
+
+        old_size = self.size
+        moves = {
+            server_id: (shard_of(server_id, old_size), shard_of(server_id, workers))
+            for server_id in self._assigned
+        }
+        moves = {server_id: shards for server_id, shards in moves.items() if shards[0] != shards[1]}
+
+        # 옮겨갈 서버를 기존 워커에서 먼저 제거
+        remove: Dict[int, List[str]] = {}
+        for server_id, (old, _) in moves.items():
+            remove.setdefault(old, []).append(server_id)
+        await asyncio.gather(*(self._request(self._workers[i], "remove", ids) for i, ids in remove.items()))
+
+        if workers > old_size:
+            self._workers.extend(self._spawn(i) for i in range(old_size, workers))
+        else:
+            for worker in self._workers[workers:]:
+                await self._shutdown(worker)
+            del self._workers[workers:]
+
+        self.size = workers
+
+        assign: Dict[int, List[Dict]] = {}
+        for server_id, (_, new) in moves.items():
+            assign.setdefault(new, []).append(self._assigned[server_id].server_data)
+        await asyncio.gather(*(self._request(self._workers[i], "assign", servers) for i, servers in assign.items()))
+        logger.info(f"Resized shard workers {old_size} -> {workers} ({len(moves)} servers moved)")
+
+    def run_cycle(
+        self, server_ids: Optional[List[str]] = None,
+        on_records: Optional[Callable[[List[CheckRecord]], None]] = None
+    ) -> Awaitable[List[CheckRecord]]:
+        """워커에 체크 요청을 바로 보내고, 모든 워커가 끝날 때까지 기다리는 awaitable 반환
+
+        server_ids 미지정 시 전체. on_records를 지정하면 결과를 도착하는 대로 전달하고,
+        지정하지 않으면 모든 결과를 모아서 반환한다.
+        """
+        records: List[CheckRecord] = []
+        if on_records is None:
+            on_records = records.extend
+        if server_ids is None:
+            targets: Dict[int, Optional[List[str]]] = {worker.index: None for worker in self._workers}
+        else:
+            targets = {}
+            for server_id in server_ids:
+                targets.setdefault(shard_of(server_id, self.size), []).append(server_id) # type: ignore
+        sent = [
+            (self._workers[i], self._workers[i].send("check", ids, on_records))
+            for i, ids in targets.items() if not self._workers[i].failed
+        ]
+        return self._gather_cycle(sent, records)
+
+    async def _gather_cycle(self, sent: List[Tuple[_WorkerHandle, asyncio.Future]], records: List[CheckRecord]) -> List[CheckRecord]:
+        replies = await asyncio.gather(*(self._finish(worker, future) for worker, future in sent))
+        self.last_cycle_seconds = [elapsed or 0.0 for elapsed in replies]
+        return records
+
+    async def _shutdown(self, worker: _WorkerHandle) -> None:
+        if worker.failed:
+            return
+        try:
+            await asyncio.wait_for(worker.send("stop"), timeout=10)
+        except (asyncio.TimeoutError, EOFError, OSError):
+            pass
+        await asyncio.get_running_loop().run_in_executor(None, worker.process.join, 5)
+        if worker.process.is_alive():
+            worker.process.kill()
+
+    async def stop(self) -> None:
+        for task in list(self._restarting.values()):
+            task.cancel()
+        await asyncio.gather(*self._restarting.values(), return_exceptions=True)
+        await asyncio.gather(*(self._shutdown(worker) for worker in self._workers))
+        self._workers = []
+        self._assigned = {}
+        logger.info("Stopped shard workers")
+
+    @property
+    def failed_shards(self) -> List[int]:
+        """재시작을 모두 실패해 체크하지 못하는 샤드 번호"""
+        return [worker.index for worker in self._workers if worker.failed]
+
+    def counts(self) -> List[int]:
+        """워커별 담당 서버 수"""
+        counts = [0] * self.size
+        for server_id in self._assigned:
+            counts[shard_of(server_id, self.size)] += 1
+        return counts
@@ -0,0 +1,340 @@
+"""
+체크 결과 장기 보관용 압축 컬럼 아카이브
+
+시간 구간(window)마다 하나의 파일을 만들고, 파일 안에는 서버별로
+timestamp / status / latency 컬럼을 인코딩한 뒤 하나의 블록으로 압축해서 저장한다.
+
+파일 구조:
+    MAGIC(4) | header 길이(uint32) | header(zlib 압축 JSON) | 서버별 압축 블록...
+
+- timestamp: ms 단위. 대부분의 체크는 일정 주기로 수행되므로 주기(header)만 기록하고,
+  예상 시각(직전 시각 + 주기)과 허용 오차 이상 차이 나는 값만 예외로 저장한다.
+  (예외 전까지 주기대로 찍힌 개수, 실제 차이) varint 쌍의 나열.
+  주기대로 복원된 시각은 실제 시각과 최대 허용 오차(주기의 1/10, 최대 1초)만큼 다를 수 있다.
+- status: (값, 연속 개수) varint 쌍 (run-length)
+- latency: 상대 오차 LATENCY_ACCURACY 이내의 로그 간격 bucket 번호 uint8 배열 (0은 값 없음)
+
+zlib은 LZ 매칭 대신 run-length 위주(Z_RLE)로 압축한다. 값이 잡음에 가까운 latency 컬럼은
+긴 반복이 거의 없어서 이쪽이 더 작다.
+"""
+import os
+import json
+import lzma
+import mmap
+import zlib
+import struct
+import math
+import bisect
+import threading
+from array import array
+from itertools import groupby
+from pathlib import Path
+from typing import NamedTuple
+
+MAGIC = b"WDC2"
+_HEADER_LEN = struct.Struct("<I")
+
+# 예상 시각과 이 이내로 차이 나는 timestamp는 주기대로 찍힌 것으로 간주
+_TS_TOLERANCE_MS = 1000
+# latency bucket: 상대 오차 LATENCY_ACCURACY 이내 (0.1ms 미만은 가장 작은 bucket)
+# 5%면 0.1ms ~ 수십만 초가 uint8 하나에 들어감
+LATENCY_ACCURACY = 0.05
+_LATENCY_GAMMA = (1 + LATENCY_ACCURACY) / (1 - LATENCY_ACCURACY)
+_LATENCY_LOG_GAMMA = math.log(_LATENCY_GAMMA)
+_LATENCY_FLOOR = 0.0001
+_LATENCY_MAX_BUCKET = 0xFF
+
+def _zlib_compress(data: bytes) -> bytes:
+    compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, zlib.Z_RLE)
+    return compressor.compress(data) + compressor.flush()
+
+
+_CODECS = {
+    "zlib": (_zlib_compress, zlib.decompress),
+    "lzma": (lambda b: lzma.compress(b, preset=6), lzma.decompress),
+}
+
+
+class HistorySample(NamedTuple):
+    timestamp: float
+    status: int
+    latency: float | None
+
+
+class CheckHistoryBuffer:
+    """아카이브로 내보내기 전까지 체크 결과를 서버별 컬럼 배열로 누적"""
+
+    def __init__(self, window_start: float = 0.0) -> None:
+        self.window_start = window_start
+        self._columns: dict[str, tuple[array, array, array]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, server_id: str, timestamp: float, status: int, latency: float | None) -> None:
+        columns = self._columns.get(server_id)
+        if columns is None:
+            columns = self._columns[server_id] = (array("d"), array("b"), array("d"))
+        columns[0].append(timestamp)
+        columns[1].append(status)
+        columns[2].append(latency if latency is not None else float("nan"))
+        self._count += 1
+
+    def drain(self, window_start: float) -> dict[str, tuple[array, array, array]]:
+        """누적된 컬럼을 꺼내고 새 구간 시작"""
+        columns, self._columns = self._columns, {}
+        self._count = 0
+        self.window_start = window_start
+        return columns
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _varints(data: bytes) -> list[int]:
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value // 2 if not value & 1 else -(value + 1) // 2
+
+
+def _latency_bucket(value: float) -> int:
+    if value != value:
+        return 0
+    index = math.ceil(math.log(max(value, _LATENCY_FLOOR) / _LATENCY_FLOOR) / _LATENCY_LOG_GAMMA)
+    return min(_LATENCY_MAX_BUCKET, index + 1)
+
+
+def _bucket_latency(bucket: int) -> float | None:
+    if bucket == 0:
+        return None
+    # (gamma^(i-1), gamma^i] 구간의 대표값 (LatencySketch와 같은 방식)
+    return _LATENCY_FLOOR * 2 * _LATENCY_GAMMA ** (bucket - 1) / (_LATENCY_GAMMA + 1)
+
+
+def _encode_timestamps(timestamps: array) -> tuple[int, int, bytes]:
+    """(첫 시각 ms, 주기 ms, 예외 목록)"""
+    ms = [round(ts * 1000) for ts in timestamps]
+    deltas = sorted(b - a for a, b in zip(ms, ms[1:]))
+    interval = deltas[len(deltas) // 2] if deltas else 0
+    tolerance = min(_TS_TOLERANCE_MS, interval // 10)
+
+    out = bytearray()
+    run = 0
+    prev = ms[0]
+    for value in ms[1:]:
+        expected = prev + interval
+        if abs(value - expected) <= tolerance:
+            run += 1
+            prev = expected
+        else:
+            _put_varint(out, run)
+            _put_varint(out, _zigzag(value - expected))
+            run = 0
+            prev = value
+    _put_varint(out, run)
+    return ms[0], interval, bytes(out)
+
+
+def _decode_timestamps(t0_ms: int, interval: int, data: bytes) -> list[float]:
+    values = _varints(data)
+    timestamps = [t0_ms / 1000]
+    ms = t0_ms
+    for i in range(0, len(values), 2):
+        for _ in range(values[i]):
+            ms += interval
+            timestamps.append(ms / 1000)
+        if i + 1 < len(values):
+            ms += interval + _unzigzag(values[i + 1])
+            timestamps.append(ms / 1000)
+    return timestamps
+
+
+def _encode_statuses(statuses: array) -> bytes:
+    out = bytearray()
+    for value, run in groupby(statuses):
+        _put_varint(out, _zigzag(value))
+        _put_varint(out, sum(1 for _ in run))
+    return bytes(out)
+
+
+def _decode_statuses(data: bytes) -> list[int]:
+    values = _varints(data)
+    statuses = []
+    for i in range(0, len(values), 2):
+        statuses.extend([_unzigzag(values[i])] * values[i + 1])
+    return statuses
+
+
+def _encode_latencies(latencies: array) -> bytes:
+    return bytes(_latency_bucket(value) for value in latencies)
+
+
+def _decode_latencies(data: bytes) -> list[float | None]:
+    return [_bucket_latency(bucket) for bucket in data]
+
+
+class HistoryArchive:
+    """구간별 압축 아카이브 파일 쓰기/조회"""
+
+    def __init__(self, directory: Path, codec: str = "zlib") -> None:
+        if codec not in _CODECS:
+            raise KeyError(f"UnSupported codec: [{codec}]")
+        self.directory = directory
+        self.codec = codec
+        self._headers: dict[Path, dict] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, start: float, end: float) -> Path:
+        return self.directory / f"checks-{int(start)}-{int(end)}.wdca"
+
+    def files(self, start: float | None = None, end: float | None = None) -> list[Path]:
+        """[start, end] 구간과 겹치는 아카이브 파일 (시간순)"""
+        if not self.directory.exists():
+            return []
+
+        found = []
+        for path in self.directory.glob("checks-*.wdca"):
+            try:
+                _, f_start, f_end = path.stem.split("-")
+                f_start, f_end = int(f_start), int(f_end)
+            except ValueError:
+                continue
+            if start is not None and f_end < int(start):
+                continue
+            if end is not None and f_start > end:
+                continue
+            found.append((f_start, path))
+        return [path for _, path in sorted(found)]
+
+    def write_window(
+        self, columns: dict[str, tuple[array, array, array]],
+        start: float, end: float
+    ) -> Path | None:
+        """한 구간의 컬럼 데이터를 압축 파일로 기록"""
+        if not columns:
+            return None
+
+        compress = _CODECS[self.codec][0]
+        servers = {}
+        blocks = []
+        offset = 0
+        for server_id, (timestamps, statuses, latencies) in columns.items():
+            if not timestamps:
+                continue
+            t0, interval, ts_bytes = _encode_timestamps(timestamps)
+            st_bytes = _encode_statuses(statuses)
+            # 세 컬럼을 하나의 블록으로 압축 (블록별 압축 헤더 비용 절약)
+            block = compress(ts_bytes + st_bytes + _encode_latencies(latencies))
+            servers[server_id] = {
+                "offset": offset,
+                "length": len(block),
+                "columns": [len(ts_bytes), len(st_bytes)],
+                "count": len(timestamps),
+                "t0": t0,
+                "interval": interval,
+                "t_min": round(min(timestamps), 3),
+                "t_max": round(max(timestamps), 3),
+            }
+            blocks.append(block)
+            offset += len(block)
+
+        # header는 codec과 관계없이 zlib (JSON 텍스트는 LZ 매칭이 잘 맞음)
+        header = zlib.compress(json.dumps({
+            "codec": self.codec,
+            "start": start,
+            "end": end,
+            "servers": servers,
+        }, separators=(",", ":")).encode("utf-8"), 9)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(start, end)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER_LEN.pack(len(header)))
+            f.write(header)
+            for block in blocks:
+                f.write(block)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return path
+
+    def _header(self, path: Path, mm: mmap.mmap) -> dict:
+        header = self._headers.get(path)
+        if header is None:
+            magic = mm[:4]
+            if magic != MAGIC:
+                raise ValueError(f"Not a check history archive: {path}")
+            (length,) = _HEADER_LEN.unpack(mm[4:8])
+            header = json.loads(zlib.decompress(mm[8:8 + length]))
+            header["data_offset"] = 8 + length
+            with self._lock:
+                self._headers[path] = header
+        return header
+
+    def query(self, server_id: str, start: float | None = None, end: float | None = None) -> list[HistorySample]:
+        """서버 하나의 [start, end] 구간 기록 조회 (해당 서버 블록만 압축 해제)"""
+        lo = start if start is not None else float("-inf")
+        hi = end if end is not None else float("inf")
+
+        samples: list[HistorySample] = []
+        for path in self.files(start, end):
+            try:
+                with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    header = self._header(path, mm)
+                    info = header["servers"].get(server_id)
+                    if info is None or info["t_max"] < lo or info["t_min"] > hi:
+                        continue
+
+                    decompress = _CODECS[header["codec"]][1]
+                    pos = header["data_offset"] + info["offset"]
+                    block = decompress(mm[pos:pos + info["length"]])
+            except FileNotFoundError:
+                # 조회 중 보관 기간이 지나 삭제된 파일
+                continue
+
+            ts_len, st_len = info["columns"]
+            timestamps = _decode_timestamps(info["t0"], info["interval"], block[:ts_len])
+            statuses = _decode_statuses(block[ts_len:ts_len + st_len])
+            latencies = _decode_latencies(block[ts_len + st_len:])
+            first = bisect.bisect_left(timestamps, lo)
+            last = bisect.bisect_right(timestamps, hi)
+            for i in range(first, last):
+                samples.append(HistorySample(timestamps[i], statuses[i], latencies[i]))
+        return samples
+
+    def purge(self, before: float) -> int:
+        """before 이전에 끝난 구간 파일 삭제"""
+        removed = 0
+        for path in self.files(end=before):
+            try:
+                f_end = int(path.stem.split("-")[2])
+            except (IndexError, ValueError):
+                continue
+            if f_end < before:
+                path.unlink(missing_ok=True)
+                with self._lock:
+                    self._headers.pop(path, None)
+                removed += 1
+        return removed
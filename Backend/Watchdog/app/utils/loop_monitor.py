@@ -0,0 +1,141 @@
+"""
+이벤트 루프 지연 측정 및 느린 콜백 탐지
+
+LoopLagSampler
+    sample_interval마다 깨어나도록 예약하고, 실제로 깨어난 시각과의 차이를 루프 지연(lag)으로 기록한다.
+    지연이 stall_threshold 이상이면 그 시각을 따로 보관해 두어, 체크 구간 동안 루프가 멈춘
+    시간을 stall_between()으로 조회할 수 있다 (체크 latency가 루프 지연으로 부풀었는지 판단).
+
+SlowCallbackMonitor
+    asyncio.events.Handle._run을 감싸서 threshold 이상 실행된 콜백을 이름별로 집계한다.
+    모든 이벤트 루프의 콜백 실행에 비용이 추가되므로 필요할 때만 install 한다.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Callable
+
+from app.utils.metrics import percentile
+
+logger = logging.getLogger("LoopMonitor")
+
+
+class LoopLagSampler:
+    def __init__(self, sample_interval: float = 0.1, window: int = 600, stall_threshold: float = 0.005) -> None:
+        self.sample_interval = sample_interval
+        self.stall_threshold = stall_threshold
+        self._lags: deque[float] = deque(maxlen=window)
+        # (깨어난 시각, 지연) - stall_threshold 이상인 것만
+        self._stalls: deque[tuple[float, float]] = deque(maxlen=window)
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.monotonic() + self.sample_interval
+            await asyncio.sleep(self.sample_interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            self._lags.append(lag)
+            if lag >= self.stall_threshold:
+                self._stalls.append((now, lag))
+
+    def stall_between(self, start: float, end: float) -> float:
+        """start~end(monotonic) 구간에 루프가 멈춰 있던 시간 합계
+
+        지연 하나는 (깨어난 시각 - lag) ~ 깨어난 시각 구간이며, 체크 구간과 겹치는 부분만 더한다.
+        """
+        total = 0.0
+        for woke, lag in reversed(self._stalls):
+            if woke <= start:
+                break
+            total += max(0.0, min(woke, end) - max(woke - lag, start))
+        return total
+
+    def stats(self) -> dict:
+        lags = list(self._lags)
+        return {
+            "samples": len(lags),
+            "p50": round(percentile(lags, 0.5), 4),
+            "p90": round(percentile(lags, 0.9), 4),
+            "p99": round(percentile(lags, 0.99), 4),
+            "max": round(max(lags, default=0.0), 4),
+        }
+
+
+def _callback_name(handle: asyncio.Handle) -> str:
+    callback = handle._callback # type: ignore
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = owner.get_coro()
+        return f"Task {getattr(coro, '__qualname__', repr(coro))}"
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+class SlowCallbackMonitor:
+    """threshold초 이상 루프를 점유한 콜백을 이름별로 집계 (count, total, max)"""
+
+    def __init__(self, threshold: float = 0.05) -> None:
+        self.threshold = threshold
+        self.callbacks: dict[str, list[float]] = {}
+        self._original: Callable | None = None
+
+    @property
+    def installed(self) -> bool:
+        return self._original is not None
+
+    def install(self) -> None:
+        if self._original is not None:
+            return
+        original = self._original = asyncio.events.Handle._run
+        monitor = self
+
+        def _run(handle: asyncio.Handle) -> None:
+            started = time.perf_counter()
+            original(handle)
+            elapsed = time.perf_counter() - started
+            if elapsed >= monitor.threshold:
+                monitor._record(_callback_name(handle), elapsed)
+
+        asyncio.events.Handle._run = _run # type: ignore
+
+    def uninstall(self) -> None:
+        if self._original is not None:
+            asyncio.events.Handle._run = self._original # type: ignore
+            self._original = None
+
+    def _record(self, name: str, elapsed: float) -> None:
+        stat = self.callbacks.get(name)
+        if stat is None:
+            self.callbacks[name] = [1, elapsed, elapsed]
+        else:
+            stat[0] += 1
+            stat[1] += elapsed
+            stat[2] = max(stat[2], elapsed)
+        logger.warning(f"Slow callback {name} blocked the event loop for {elapsed * 1000:.1f} ms")
+
+    def top(self, count: int = 10) -> list[dict]:
+        """루프를 가장 오래 점유한 콜백 순"""
+        ranked = sorted(self.callbacks.items(), key=lambda item: item[1][1], reverse=True)[:count]
+        return [
+            {"callback": name, "count": int(n), "total_seconds": round(total, 4), "max_seconds": round(worst, 4)}
+            for name, (n, total, worst) in ranked
+        ]
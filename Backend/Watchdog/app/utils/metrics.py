@@ -0,0 +1,301 @@
+"""
+Prometheus 텍스트 형식 메트릭
+
+체크 루프가 값을 누적하고 주기마다 publish()로 응답 본문을 미리 만들어 둔다.
+스크레이프 요청은 만들어진 bytes를 그대로 돌려주므로 체크 루프와 경합하지 않는다.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+logger = logging.getLogger("Metrics")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+PHASE_BUCKETS = (0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+def percentile(values: Iterable[float], q: float) -> float:
+    """nearest-rank 백분위수 (값이 없으면 0)"""
+    values = sorted(values)
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, math.ceil(q * len(values)) - 1))]
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def lines(self, name: str, labels: dict[str, str]) -> Iterable[str]:
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f"{name}_bucket{_labels({**labels, 'le': _number(bound)})} {cumulative}"
+        yield f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {self.count}"
+        yield f"{name}_sum{_labels(labels)} {_number(self.sum)}"
+        yield f"{name}_count{_labels(labels)} {self.count}"
+
+
+class PhaseTimers:
+    """모니터 주기 단계별 소요 시간
+
+    누적 히스토그램(count/sum/버킷)과 최근 window개 값(백분위수용)을 함께 기록한다.
+    비활성화 상태에서는 start()가 0.0을 돌려주고 stop()은 바로 반환하므로
+    측정 지점에 남겨 두어도 비용이 거의 없다.
+
+        started = phases.start()
+        ...
+        phases.stop("sync", started)
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 256) -> None:
+        self.enabled = enabled
+        self.window = window
+        self.histograms: dict[str, Histogram] = {}
+        self.recent: dict[str, deque[float]] = {}
+        self.max: dict[str, float] = {}
+
+    def start(self) -> float:
+        return time.perf_counter() if self.enabled else 0.0
+
+    def stop(self, phase: str, started: float) -> None:
+        if not started:
+            return
+        elapsed = time.perf_counter() - started
+        histogram = self.histograms.get(phase)
+        if histogram is None:
+            histogram = self.histograms[phase] = Histogram(PHASE_BUCKETS)
+            self.recent[phase] = deque(maxlen=self.window)
+            self.max[phase] = 0.0
+        histogram.observe(elapsed)
+        self.recent[phase].append(elapsed)
+        if elapsed > self.max[phase]:
+            self.max[phase] = elapsed
+
+    def reset(self) -> None:
+        self.histograms.clear()
+        self.recent.clear()
+        self.max.clear()
+
+    def stats(self) -> dict[str, dict]:
+        """단계별 누적 횟수/합계/최댓값과 최근 값의 p50/p99 (ms)"""
+        result = {}
+        for phase, histogram in self.histograms.items():
+            recent = self.recent[phase]
+            result[phase] = {
+                "count": histogram.count,
+                "total_ms": round(histogram.sum * 1000, 3),
+                "p50_ms": round(percentile(recent, 0.5) * 1000, 3),
+                "p99_ms": round(percentile(recent, 0.99) * 1000, 3),
+                "max_ms": round(self.max[phase] * 1000, 3),
+            }
+        return result
+
+
+class MonitorMetrics:
+    """MonitorService 메트릭 저장소"""
+
+    def __init__(self) -> None:
+        self.server_status: dict[str, int] = {}
+        self.server_latency: dict[str, float] = {}
+        self.latency: dict[str, Histogram] = {}
+        self.checks: dict[tuple[str, str], int] = {}  # (server_id, status name) -> count
+        self.persist: dict[str, Histogram] = {}
+        self.cycle = Histogram(DURATION_BUCKETS)
+        self.scheduler_lag = Histogram(DURATION_BUCKETS)
+        self.phases = PhaseTimers()
+        self.last_cycle_seconds = 0.0
+        self.last_lag_seconds = 0.0
+        self._snapshot = b""
+
+    def observe_check(self, server_id: str, status, latency: float | None) -> None:
+        self.server_status[server_id] = status.value
+        key = (server_id, status.name)
+        self.checks[key] = self.checks.get(key, 0) + 1
+        if latency is None:
+            return
+        self.server_latency[server_id] = latency
+        histogram = self.latency.get(server_id)
+        if histogram is None:
+            histogram = self.latency[server_id] = Histogram()
+        histogram.observe(latency)
+
+    def observe_cycle(self, seconds: float) -> None:
+        self.last_cycle_seconds = seconds
+        self.cycle.observe(seconds)
+
+    def observe_lag(self, seconds: float) -> None:
+        self.last_lag_seconds = seconds
+        self.scheduler_lag.observe(seconds)
+
+    def observe_persist(self, operation: str, seconds: float) -> None:
+        histogram = self.persist.get(operation)
+        if histogram is None:
+            histogram = self.persist[operation] = Histogram(DURATION_BUCKETS)
+        histogram.observe(seconds)
+
+    @contextmanager
+    def timed(self, operation: str) -> Iterator[None]:
+        """with 블록 실행 시간을 저장 작업 시간으로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_persist(operation, time.perf_counter() - start)
+
+    def forget(self, server_ids: Iterable[str]) -> None:
+        """모니터링에서 빠진 서버의 시계열 제거"""
+        for server_id in server_ids:
+            self.server_status.pop(server_id, None)
+            self.server_latency.pop(server_id, None)
+            self.latency.pop(server_id, None)
+        self.checks = {key: count for key, count in self.checks.items() if key[0] in self.server_status}
+
+    def publish(
+        self, names: dict[str, str], gauges: dict[str, tuple[str, float]],
+        counters: dict[str, tuple[str, float]] | None = None
+    ) -> None:
+        """현재 값으로 응답 본문을 만들어 교체 (names: server_id -> 서버 이름, counters: 계속 증가하는 값, 이름은 *_total)"""
+        removed = [server_id for server_id in self.server_status if server_id not in names]
+        if removed:
+            self.forget(removed)
+
+        out: list[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+
+        def server_labels(server_id: str) -> dict[str, str]:
+            return {"server_id": server_id, "name": names.get(server_id, "")}
+
+        header("watchdog_server_status", "gauge", "Last check status (0=normal, 1=latency, 2=down)")
+        for server_id, value in self.server_status.items():
+            out.append(f"watchdog_server_status{_labels(server_labels(server_id))} {value}")
+
+        header("watchdog_server_latency_seconds", "gauge", "Latency of the last successful check")
+        for server_id, value in self.server_latency.items():
+            out.append(f"watchdog_server_latency_seconds{_labels(server_labels(server_id))} {_number(value)}")
+
+        header("watchdog_check_latency_seconds", "histogram", "Check latency")
+        for server_id, histogram in self.latency.items():
+            out.extend(histogram.lines("watchdog_check_latency_seconds", server_labels(server_id)))
+
+        header("watchdog_checks_total", "counter", "Checks performed by result status")
+        for (server_id, status), count in self.checks.items():
+            out.append(f"watchdog_checks_total{_labels({**server_labels(server_id), 'status': status})} {count}")
+
+        header("watchdog_cycle_duration_seconds", "histogram", "Duration of one check cycle")
+        out.extend(self.cycle.lines("watchdog_cycle_duration_seconds", {}))
+
+        header("watchdog_scheduler_lag_seconds", "histogram", "Delay between the scheduled and actual cycle start")
+        out.extend(self.scheduler_lag.lines("watchdog_scheduler_lag_seconds", {}))
+
+        header("watchdog_persist_duration_seconds", "histogram", "Duration of persistence operations")
+        for operation, histogram in self.persist.items():
+            out.extend(histogram.lines("watchdog_persist_duration_seconds", {"operation": operation}))
+
+        if self.phases.histograms:
+            header("watchdog_phase_duration_seconds", "histogram", "Duration of monitor cycle phases")
+            for phase, histogram in self.phases.histograms.items():
+                out.extend(histogram.lines("watchdog_phase_duration_seconds", {"phase": phase}))
+
+        for name, (help_text, value) in gauges.items():
+            header(name, "gauge", help_text)
+            out.append(f"{name} {_number(value)}")
+
+        for name, (help_text, value) in (counters or {}).items():
+            header(name, "counter", help_text)
+            out.append(f"{name} {_number(value)}")
+
+        out.append("")
+        self._snapshot = "\n".join(out).encode("utf-8")
+
+    @property
+    def snapshot(self) -> bytes:
+        return self._snapshot
+
+
+class MetricsServer:
+    """GET /metrics 만 처리하는 최소한의 asyncio HTTP 서버"""
+
+    def __init__(self, metrics: MonitorMetrics, host: str = "127.0.0.1", port: int = 9464) -> None:
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # 헤더는 읽고 버림
+            while (line := await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] in ("GET", "HEAD") and parts[1].split("?")[0] == "/metrics":
+                body = self.metrics.snapshot
+                status = "200 OK"
+                content_type = CONTENT_TYPE
+            else:
+                body = b"Not Found\n"
+                status = "404 Not Found"
+                content_type = "text/plain; charset=utf-8"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+            )
+            if parts and parts[0] != "HEAD":
+                writer.write(body)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
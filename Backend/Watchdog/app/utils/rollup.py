@@ -0,0 +1,265 @@
+"""
+체크 결과 다중 해상도 집계 (1분 / 1시간 / 1일)
+
+원본 체크 결과는 짧게 보관하고, 장기 조회는 구간별 집계 행으로 처리한다.
+각 집계 행은 count / failures / min / max / 합계 와 지연 시간 분위수 추정용
+sketch(로그 간격 히스토그램)를 가진다.
+
+진행 중인 구간도 주기적으로 저장한다. 집계 객체마다 고유한 part 번호가 있어서
+같은 집계를 다시 저장하면 이전 행을 덮어쓰므로, 비정상 종료 시에도 마지막 저장
+시점까지의 집계가 남는다.
+"""
+import json
+import math
+import time
+import threading
+from pathlib import Path
+
+from app.utils.storage import SQLiteDatabase
+
+MINUTE = 60
+HOUR = 3600
+DAY = 86400
+RESOLUTIONS = (MINUTE, HOUR, DAY)
+
+_SQL = {
+    "insert": (
+        "INSERT INTO rollups (server_id, resolution, start, count, failures, min, max, total, sketch, part) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    ),
+    "replace": "DELETE FROM rollups WHERE server_id = ? AND resolution = ? AND start = ? AND part = ?",
+    "query": (
+        "SELECT start, count, failures, min, max, total, sketch FROM rollups "
+        "WHERE server_id = ? AND resolution = ? AND start >= ? AND start < ? ORDER BY start"
+    ),
+    "purge": "DELETE FROM rollups WHERE resolution = ? AND start < ?",
+}
+
+
+class LatencySketch:
+    """상대 오차가 일정한 로그 간격 히스토그램 (분위수 추정 및 병합 가능)"""
+    __slots__ = ("counts", "zeros", "total")
+
+    ACCURACY = 0.01
+    _GAMMA = (1 + ACCURACY) / (1 - ACCURACY)
+    _LOG_GAMMA = math.log(_GAMMA)
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.zeros = 0
+        self.total = 0
+
+    def add(self, value: float) -> None:
+        self.total += 1
+        if value <= 0:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value) / self._LOG_GAMMA)
+        self.counts[index] = self.counts.get(index, 0) + 1
+
+    def merge(self, other: "LatencySketch") -> None:
+        self.total += other.total
+        self.zeros += other.zeros
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+    def quantile(self, q: float) -> float | None:
+        if not self.total:
+            return None
+        rank = q * (self.total - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if rank < seen:
+                return 2 * self._GAMMA ** index / (self._GAMMA + 1)
+        return 2 * self._GAMMA ** max(self.counts) / (self._GAMMA + 1)
+
+    def dumps(self) -> str:
+        return json.dumps([self.zeros, list(self.counts.keys()), list(self.counts.values())])
+
+    @classmethod
+    def loads(cls, text: str) -> "LatencySketch":
+        sketch = cls()
+        zeros, indexes, counts = json.loads(text)
+        sketch.zeros = zeros
+        sketch.counts = dict(zip(indexes, counts))
+        sketch.total = zeros + sum(counts)
+        return sketch
+
+
+class RollupBucket:
+    """한 서버의 한 구간 집계"""
+    __slots__ = ("start", "part", "count", "failures", "min", "max", "total", "sketch")
+
+    def __init__(self, start: int, part: int = 0) -> None:
+        self.start = start
+        self.part = part
+        self.count = 0
+        self.failures = 0
+        self.min: float | None = None
+        self.max: float | None = None
+        self.total = 0.0
+        self.sketch = LatencySketch()
+
+    def add(self, failed: bool, latency: float | None) -> None:
+        self.count += 1
+        if failed:
+            self.failures += 1
+        if latency is None:
+            return
+        self.total += latency
+        self.min = latency if self.min is None else min(self.min, latency)
+        self.max = latency if self.max is None else max(self.max, latency)
+        self.sketch.add(latency)
+
+    def copy(self) -> "RollupBucket":
+        bucket = RollupBucket(self.start, self.part)
+        bucket.merge(self)
+        return bucket
+
+    def merge(self, other: "RollupBucket") -> None:
+        self.count += other.count
+        self.failures += other.failures
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        self.sketch.merge(other.sketch)
+
+    def to_dict(self) -> dict:
+        samples = self.sketch.total
+        return {
+            "start": self.start,
+            "count": self.count,
+            "failures": self.failures,
+            "availability": 1 - self.failures / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / samples if samples else None,
+            "p50": self.sketch.quantile(0.5),
+            "p90": self.sketch.quantile(0.9),
+            "p99": self.sketch.quantile(0.99),
+        }
+
+
+class Downsampler:
+    """체크 결과를 해상도별 열린 구간에 누적하고, 끝난 구간을 내보냄"""
+
+    def __init__(self, resolutions: tuple[int, ...] = RESOLUTIONS) -> None:
+        self.resolutions = resolutions
+        self._open: dict[tuple[str, int], RollupBucket] = {}
+        self._closed: list[tuple[str, int, RollupBucket]] = []
+        # 마지막 저장 이후 값이 바뀐 진행 중인 구간
+        self._dirty: set[tuple[str, int]] = set()
+        # 집계 객체별 저장 행 번호 (0은 part 컬럼이 없던 이전 버전의 행)
+        self._next_part = time.time_ns()
+
+    def record(self, server_id: str, timestamp: float, failed: bool, latency: float | None) -> None:
+        for resolution in self.resolutions:
+            start = int(timestamp // resolution) * resolution
+            key = (server_id, resolution)
+            bucket = self._open.get(key)
+            if bucket is None or bucket.start != start:
+                if bucket is not None:
+                    self._closed.append((server_id, resolution, bucket))
+                self._next_part += 1
+                bucket = self._open[key] = RollupBucket(start, self._next_part)
+            bucket.add(failed, latency)
+            self._dirty.add(key)
+
+    def drain(self, include_open: bool = False) -> list[tuple[str, int, RollupBucket]]:
+        """끝난 구간 꺼내기 (include_open이면 마지막 저장 이후 바뀐 진행 중인 구간의 사본도 포함)"""
+        closed, self._closed = self._closed, []
+        if include_open:
+            # 저장은 다른 스레드에서 수행되므로 계속 누적되는 원본 대신 사본을 넘김
+            closed.extend(
+                (key[0], key[1], self._open[key].copy())
+                for key in self._dirty if key in self._open
+            )
+            self._dirty.clear()
+        return closed
+
+    def forget(self, server_id: str, keep: bool = True) -> None:
+        """더 이상 체크하지 않는 서버의 진행 중인 구간 정리
+
+        keep이면 다음 저장 때 기록되도록 끝난 구간으로 옮기고, 아니면 버린다.
+        """
+        for resolution in self.resolutions:
+            self._dirty.discard((server_id, resolution))
+            bucket = self._open.pop((server_id, resolution), None)
+            if bucket is not None and keep:
+                self._closed.append((server_id, resolution, bucket))
+
+
+class RollupStore:
+    """집계 행 저장소 (SQLite)
+
+    같은 part의 행은 덮어쓰고, 같은 구간 행이 여러 개 있으면 (재시작 등으로 중간에
+    기록된 경우) 조회 시 병합한다.
+    """
+
+    def __init__(self, db_file: Path, max_points: int = 800) -> None:
+        self.db = SQLiteDatabase.open(db_file)
+        self.db.ensure_column("rollups", "part", "INTEGER NOT NULL DEFAULT 0")
+        self.max_points = max_points
+        self._lock = threading.Lock()
+
+    def write(self, buckets: list[tuple[str, int, RollupBucket]]) -> None:
+        rows = [
+            (
+                server_id, resolution, bucket.start, bucket.count, bucket.failures,
+                bucket.min, bucket.max, bucket.total, bucket.sketch.dumps(), bucket.part,
+            )
+            for server_id, resolution, bucket in buckets
+            if bucket.count
+        ]
+        with self._lock:
+            self.db.write_batch([
+                (_SQL["replace"], [(row[0], row[1], row[2], row[9]) for row in rows]),
+                (_SQL["insert"], rows),
+            ])
+
+    def resolution_for(self, start: float, end: float) -> int:
+        """max_points 이하의 행으로 구간을 표현할 수 있는 가장 세밀한 해상도"""
+        for resolution in RESOLUTIONS:
+            if (end - start) / resolution <= self.max_points:
+                return resolution
+        return RESOLUTIONS[-1]
+
+    def query(
+        self, server_id: str, start: float, end: float,
+        resolution: int | None = None
+    ) -> list[dict]:
+        """[start, end) 구간 집계 조회 (해상도 미지정 시 자동 선택)"""
+        if resolution is None:
+            resolution = self.resolution_for(start, end)
+        first = int(start // resolution) * resolution
+
+        buckets: dict[int, RollupBucket] = {}
+        for row_start, count, failures, low, high, total, sketch in self.db.query(
+            _SQL["query"], (server_id, resolution, first, end)
+        ):
+            bucket = RollupBucket(row_start)
+            bucket.count, bucket.failures = count, failures
+            bucket.min, bucket.max, bucket.total = low, high, total
+            bucket.sketch = LatencySketch.loads(sketch)
+
+            existing = buckets.get(row_start)
+            if existing is None:
+                buckets[row_start] = bucket
+            else:
+                existing.merge(bucket)
+
+        return [dict(bucket.to_dict(), resolution=resolution) for bucket in buckets.values()]
+
+    def purge(self, retention: dict[int, float | None], now: float) -> None:
+        """해상도별 보관 기간(초)이 지난 행 삭제 (None이면 영구 보관)"""
+        with self._lock:
+            self.db.write_batch([
+                (_SQL["purge"], [(resolution, now - seconds)])
+                for resolution, seconds in retention.items()
+                if seconds is not None
+            ])
@@ -1,13 +1,17 @@
-import asyncio
 import json
+import asyncio
 import datetime
 from pathlib import Path
 from collections import deque
-from typing import Deque
-from pydantic import BaseModel, Field
+from typing import Any, Deque, Dict, Iterable
+from pydantic import BaseModel, Field, PrivateAttr
 
 from app.core.models import MessageGrade, Status
-from app.config.settings import LOCAL_TZ, DATA_VERSION, LOG_DATA_FILE
+from app.config.settings import (
+    LOCAL_TZ, DATA_VERSION, LOG_DATA_FILE, SQLITE_DB_FILE, STORAGE_BACKEND,
+    LOG_SEGMENT_DIR, LOG_SEGMENT_MAX_BYTES, DEFAULT_USER_SETTINGS
+)
+from app.utils.storage import Storage, JsonStorage, JsonlLogStorage, SQLiteStorage
 
 
 class LogEntry(BaseModel):
@@ -17,11 +21,14 @@ class LogEntry(BaseModel):
     event: MessageGrade   # check_start, check_end, status_change 등
     details: dict | str # 상세 정보
     level: str = "INFO"
+    _text: str | None = PrivateAttr(default=None)
 
     def to_string(self) -> str:
-        """로그를 문자열로 변환 (포맷팅)"""
-        detail_str = json.dumps(self.details, ensure_ascii=False) if isinstance(self.details, dict) else str(self.details)
-        return f"[{self.timestamp}] [{self.level}] [{self.source}] {self.event}: {detail_str}"
+        """로그를 문자열로 변환 (포맷팅, 처음 요청될 때 한 번만 수행)"""
+        if self._text is None:
+            detail_str = json.dumps(self.details, ensure_ascii=False) if isinstance(self.details, dict) else str(self.details)
+            self._text = f"[{self.timestamp}] [{self.level}] [{self.source}] {self.event}: {detail_str}"
+        return self._text
 
 
 class LogManager:
@@ -39,12 +46,25 @@ class LogManager:
             return
         
         self.log: Deque[LogEntry] = deque(maxlen=max_log)
+        # source별 로그 인덱스 (self.log에서 밀려난 로그는 함께 제거)
+        self._by_source: Dict[str, Deque[LogEntry]] = {}
         self._lock = asyncio.Lock()
         self._semaphore = asyncio.Semaphore(5)
         self._initialized = True
         self._running = False
         self.save_interval = 60
-        self._file_manager = FileManager(LOG_DATA_FILE)
+        # 행 단위 저장소는 새 로그만 기록하므로 짧은 주기 또는 flush_batch 건마다 저장
+        self.flush_interval = 2
+        self.flush_batch = 200
+        self.retention_check_interval = 3600
+        self._flush_task: asyncio.Task | None = None
+        self._save_task: asyncio.Task | None = None
+        self._purge_task: asyncio.Task | None = None
+        self._file_manager = FileManager(LOG_DATA_FILE, backend=STORAGE_BACKEND, table="logs")
+        # 행 단위 저장소에서 아직 저장되지 않은 로그
+        self._unsaved: list[LogEntry] = []
+        # 메모리에 올라오지 않은 이전 로그를 이어서 읽기 위한 위치
+        self._history_cursor = None
         self._load_saved_logs()
 
         self.listeners = []
@@ -60,55 +80,210 @@ class LogManager:
                 print(f"Log listener error: {e}")
     
     async def start(self) -> None:
+        if self._running:
+            return
         self._running = True
-        asyncio.create_task(self._periodic_save())
+        self._save_task = asyncio.create_task(self._periodic_save())
+        self._purge_task = asyncio.create_task(self._periodic_purge())
     
     async def stop(self) -> None:
         self._running = False
+        # 대기 중인 주기 작업 취소 (다시 start해도 이전 루프가 남지 않도록)
+        tasks = [task for task in (self._save_task, self._purge_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        if self._flush_task is not None:
+            tasks.append(self._flush_task)
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._save_task = self._purge_task = self._flush_task = None
         await self._save_to_json()  # 종료 시 남아있는 로그 저장
         
-    async def aadd_log(self, **kwargs) -> str:
+    def _append(self, entry: LogEntry) -> None:
+        """로그 추가 및 source 인덱스 갱신"""
+        if self.log.maxlen is not None and len(self.log) >= self.log.maxlen:
+            evicted = self.log[0]
+            index = self._by_source.get(evicted.source)
+            if index and index[0] is evicted:
+                index.popleft()
+                if not index:
+                    del self._by_source[evicted.source]
+
+        self.log.append(entry)
+        index = self._by_source.get(entry.source)
+        if index is None:
+            index = self._by_source[entry.source] = deque()
+        index.append(entry)
+
+    async def aadd_log(self, **kwargs) -> LogEntry:
         data = LogEntry(**kwargs)
         async with self._lock:
-            self.log.append(data)
+            self._append(data)
+            self._unsaved.append(data)
         
         self._notify_listeners(data)
+        self._maybe_flush()
 
-        return data.to_string()
+        return data
     
-    def add_log(self, **kwargs) -> str:
+    def add_log(self, **kwargs) -> LogEntry:
         data = LogEntry(**kwargs)
-        self.log.append(data)
+        self._append(data)
+        self._unsaved.append(data)
 
         self._notify_listeners(data)
+        self._maybe_flush()
         
-        return data.to_string()
+        return data
+
+    def _as_timestamp(self, value: datetime.datetime | str | None) -> str | None:
+        if isinstance(value, datetime.datetime):
+            return value.astimezone(LOCAL_TZ).isoformat(timespec='seconds')
+        return value
+
+    def get_entries(
+        self, source: str, max_count: int = 10,
+        grade: MessageGrade | Iterable[MessageGrade] | None = None,
+        since: datetime.datetime | str | None = None,
+        until: datetime.datetime | str | None = None
+    ) -> list[LogEntry]:
+        """source의 최근 로그를 최신순으로 최대 max_count건 반환 (등급, 시간 범위 필터)"""
+        index = self._by_source.get(source)
+        if not index or max_count <= 0:
+            return []
+
+        grades = None
+        if grade is not None:
+            grades = {grade} if isinstance(grade, MessageGrade) else set(grade)
+        since_ts = self._as_timestamp(since)
+        until_ts = self._as_timestamp(until)
+
+        result = []
+        for entry in reversed(index):
+            if until_ts is not None and entry.timestamp > until_ts:
+                continue
+            # 인덱스는 시간순이므로 범위를 벗어나면 중단
+            if since_ts is not None and entry.timestamp < since_ts:
+                break
+            if grades is not None and entry.event not in grades:
+                continue
+
+            result.append(entry)
+            if len(result) >= max_count:
+                break
+        return result
     
-    def get_logs(self, source: str, max_count: int = 10) -> list[str]:
-        filtered = [
+    def get_logs(
+        self, source: str, max_count: int = 10,
+        grade: MessageGrade | Iterable[MessageGrade] | None = None,
+        since: datetime.datetime | str | None = None,
+        until: datetime.datetime | str | None = None
+    ) -> list[str]:
+        return [
             log.to_string()
-            for log in reversed(self.log) if log.source == source
+            for log in self.get_entries(source, max_count, grade, since, until)
         ]
-        return filtered[:max_count]
     
+    def _maybe_flush(self) -> None:
+        """쌓인 로그가 flush_batch 이상이면 바로 저장 예약"""
+        if len(self._unsaved) < self.flush_batch:
+            return
+        if not self._running:
+            # 주기 저장이 없으므로 바로 저장 (저장되지 않은 로그가 계속 쌓이지 않도록)
+            self._save_now()
+            return
+        if self._flush_task and not self._flush_task.done():
+            return
+        try:
+            self._flush_task = asyncio.get_running_loop().create_task(self._save_to_json())
+        except RuntimeError:
+            # 이벤트 루프 밖에서 호출된 경우 다음 주기 저장에 맡김
+            pass
+
     async def _periodic_save(self) -> None:
+        interval = self.flush_interval if self._file_manager.supports_rows else self.save_interval
         while self._running:
-            await asyncio.sleep(self.save_interval)
+            await asyncio.sleep(interval)
             await self._save_to_json()
+
+    def _retention_days(self) -> int:
+        # user_config가 이 모듈을 import하므로 순환 참조를 피하기 위해 지연 import
+        from app.config.user_config import user_setting
+        days = user_setting.get("log_retention_days")
+        if not isinstance(days, int) or days <= 0:
+            days = DEFAULT_USER_SETTINGS["log_retention_days"]
+        return days
+
+    def purge_expired(self) -> int:
+        """log_retention_days보다 오래된 로그 삭제"""
+        cutoff = datetime.datetime.now(LOCAL_TZ) - datetime.timedelta(days=self._retention_days())
+        return self._file_manager.purge(cutoff.date().isoformat())
+
+    async def _periodic_purge(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._running:
+            try:
+                await loop.run_in_executor(None, self.purge_expired)
+            except Exception as e:
+                print(f"Log retention error: {e}")
+            await asyncio.sleep(self.retention_check_interval)
     
+    def _take_unsaved(self) -> tuple[Any, list[dict]]:
+        """저장 함수와 저장할 데이터 (행 단위 저장소는 새로 추가된 로그만, 그 외에는 전체)"""
+        unsaved, self._unsaved = self._unsaved, []
+        if self._file_manager.supports_rows:
+            return self._file_manager.upsert, [l.model_dump() for l in unsaved]
+        return self._file_manager.save, [l.model_dump() for l in self.log]
+
+    def _save_now(self) -> None:
+        save, data_to_save = self._take_unsaved()
+        if not data_to_save:
+            return
+        try:
+            save(data_to_save)
+        except Exception as e:
+            print(f"Log save error: {e}")
+
     async def _save_to_json(self) -> None:
         loop = asyncio.get_running_loop()
 
         async with self._lock:
-            data_to_save = [l.model_dump() for l in self.log]
+            save, data_to_save = self._take_unsaved()
         
+        if not data_to_save:
+            return
+
         # 별도 스레드에서 파일 쓰기 수행 (Non-blocking)
-        await loop.run_in_executor(None, self._file_manager.save, data_to_save)
+        await loop.run_in_executor(None, save, data_to_save)
     
     def _load_saved_logs(self) -> None:
-        log_list = self._file_manager.load()
-        for item in log_list:
-            self.log.append(LogEntry(**item))
+        """최근 max_log건만 파일 끝에서부터 읽어서 로드"""
+        count = self.log.maxlen or 0
+        if count <= 0:
+            return
+
+        records, self._history_cursor = self._file_manager.read_backwards(count)
+        for item in reversed(records):
+            try:
+                self._append(LogEntry(**item))
+            except ValueError:
+                continue
+
+    def load_history(self, count: int = 100) -> list[LogEntry]:
+        """메모리에 없는 이전 로그를 필요할 때 읽어옴 (호출할수록 더 과거, 오래된 순 정렬)"""
+        if self._history_cursor is None:
+            return []
+
+        records, self._history_cursor = self._file_manager.read_backwards(count, self._history_cursor)
+        history = []
+        for item in reversed(records):
+            try:
+                history.append(LogEntry(**item))
+            except ValueError:
+                continue
+        return history
+
+    def has_more_history(self) -> bool:
+        return self._history_cursor is not None
     
     def get_all_logs(self) -> list[str]:
         result = []
@@ -119,6 +294,7 @@ class LogManager:
         return result
 
     def clear_all_logs(self) -> None:
+        self._unsaved.clear()
         self._file_manager.save([])
 
 
@@ -192,50 +368,66 @@ class CustomLogger:
 
 
 class FileManager:
-    def __init__(self, data_file: Path, source: str = "data") -> None:
+    """데이터 파일 관리 (저장소 백엔드는 backend 값으로 선택)
+
+    - "json": data_file에 JSON 문서로 저장 (table="logs"면 LOG_SEGMENT_DIR의 JSONL 세그먼트)
+    - "sqlite": SQLITE_DB_FILE의 table에 저장하며, 최초 사용 시 data_file 내용을 옮겨옴
+    """
+    def __init__(
+        self, data_file: Path, source: str = "data",
+        debounce: float | None = None, backend: str = "json",
+        table: str | None = None
+    ) -> None:
         self.data_file = data_file
         self.data_version = DATA_VERSION
         self.source = source
-        self._ensure_data_file()
-    
-    def _ensure_data_file(self) -> None:
-        """데이터 파일이 존재하는지 확인하고 없으면 생성"""
-        if not self.data_file.exists():
-            # 디렉토리가 없으면 생성
-            self.data_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # 초기 데이터 구조 생성
-            initial_data = {
-                "version": self.data_version,
-                self.source: []
-            }
-            
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(initial_data, f, ensure_ascii=False, indent=2)
+        self.storage: Storage
+
+        if backend == "sqlite":
+            self.storage = SQLiteStorage(SQLITE_DB_FILE, table or source, data_file, source)
+        elif backend == "json" and table == "logs":
+            self.storage = JsonlLogStorage(LOG_SEGMENT_DIR, LOG_SEGMENT_MAX_BYTES, data_file, source)
+        elif backend == "json":
+            self.storage = JsonStorage(data_file, source, self.data_version, debounce)
+        else:
+            raise KeyError(f"UnSupported storage backend: [{backend}]")
+
+    @property
+    def supports_rows(self) -> bool:
+        """행 단위 저장(upsert/delete) 지원 여부"""
+        return self.storage.supports_rows
 
     def load(self) -> list | dict:
-        """JSON 파일에서 서버 데이터 로드"""
-        try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get(self.source, [])
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"데이터 로드 오류: {e}")
-            return []
+        """저장된 데이터 로드"""
+        return self.storage.load()
     
     def save(self, data: list | dict) -> None:
-        """현재 서버 데이터를 JSON 파일에 저장"""
-        in_data = {
-            "version": self.data_version,
-            self.source: data,
-        }
-        
-        try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(in_data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"데이터 저장 오류: {e}")
-            raise
+        """전체 데이터 저장"""
+        self.storage.save(data)
+
+    def upsert(self, rows: list[dict]) -> None:
+        """변경된 행만 저장 (supports_rows인 경우)"""
+        self.storage.upsert(rows)
+
+    def delete(self, keys: Iterable[Any]) -> None:
+        """행 삭제 (supports_rows인 경우)"""
+        self.storage.delete(keys)
+
+    def flush(self) -> None:
+        """write-behind 대기 중인 데이터를 즉시 기록"""
+        self.storage.flush()
+
+    def read_backwards(self, count: int, cursor: Any = None) -> tuple[list[dict], Any]:
+        """끝에서부터 최대 count건을 최신순으로 읽음 (cursor로 이어서 읽기)"""
+        return self.storage.read_backwards(count, cursor)
+
+    def purge(self, before: str) -> int:
+        """before(ISO 날짜) 이전 데이터 삭제"""
+        return self.storage.purge(before)
     
 
-log_manager = LogManager()
+def __getattr__(name: str) -> Any:
+    # import 시점에 로그 파일을 읽지 않도록 처음 접근할 때 생성
+    if name == "log_manager":
+        return LogManager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
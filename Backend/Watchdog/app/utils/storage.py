@@ -0,0 +1,697 @@
+"""
+FileManager 저장소 백엔드
+
+- JsonStorage: 기존 방식의 JSON 문서 파일 (전체 저장)
+- JsonlLogStorage: 날짜별 JSON Lines 로그 세그먼트 (추가 전용, 보관 기간 삭제)
+- SQLiteStorage: WAL 모드의 SQLite 파일 (행 단위 upsert, 인덱스 조회)
+"""
+import os
+import re
+import time
+import json
+import atexit
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger("Storage")
+
+
+def _snapshot(data: list | dict) -> list | dict:
+    """백그라운드 직렬화 중 원본이 변경되지 않도록 얕은 복사"""
+    if isinstance(data, list):
+        return [dict(item) if isinstance(item, dict) else item for item in data]
+    return dict(data)
+
+
+class DebouncedWriter:
+    """쓰기 요청을 모아서 백그라운드 스레드에서 한 번만 기록하는 write-behind 작성기
+
+    delay 안에 들어온 요청은 마지막 데이터 하나로 합쳐지고,
+    요청이 계속 들어와도 max_delay가 지나면 기록한다.
+    """
+    def __init__(self, write, delay: float = 0.5, max_delay: float | None = None) -> None:
+        self._write = write
+        self.delay = delay
+        self.max_delay = max_delay if max_delay is not None else delay * 10
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending = None
+        self._has_pending = False
+        self._first_at = 0.0
+        self._deadline = 0.0
+        self._thread: threading.Thread | None = None
+        atexit.register(self.flush)
+
+    def submit(self, data) -> None:
+        """쓰기 요청 (즉시 반환)"""
+        with self._cond:
+            now = time.monotonic()
+            if not self._has_pending:
+                self._first_at = now
+            self._pending = data
+            self._has_pending = True
+            self._deadline = min(now + self.delay, self._first_at + self.max_delay)
+
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="DebouncedWriter", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _take(self):
+        """대기 중인 데이터를 꺼냄 (_cond 잠금 상태에서 호출)"""
+        data, self._pending, self._has_pending = self._pending, None, False
+        return data
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._has_pending:
+                    self._cond.wait()
+
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+
+            # flush()와 같은 순서(_write_lock -> _cond)로 잠금을 잡음
+            with self._write_lock:
+                with self._cond:
+                    if not self._has_pending:
+                        continue
+                    data = self._take()
+
+                try:
+                    self._write(data)
+                except Exception as e:
+                    logger.error(f"Background write failed: {e}")
+
+    def flush(self) -> None:
+        """대기 중인 쓰기를 호출한 스레드에서 즉시 기록"""
+        with self._write_lock:
+            with self._cond:
+                if not self._has_pending:
+                    return
+                data = self._take()
+            self._write(data)
+
+
+class Storage(ABC):
+    """FileManager가 사용하는 저장소 인터페이스"""
+
+    # 행 단위 upsert/delete 지원 여부 (False면 호출자가 전체 데이터를 save()로 저장)
+    supports_rows = False
+
+    @abstractmethod
+    def load(self) -> list | dict:
+        ...
+
+    @abstractmethod
+    def save(self, data: list | dict) -> None:
+        ...
+
+    def upsert(self, rows: list[dict]) -> None:
+        raise NotImplementedError(f"{type(self).__name__} does not support row-level writes")
+
+    def delete(self, keys: Iterable[Any]) -> None:
+        raise NotImplementedError(f"{type(self).__name__} does not support row-level writes")
+
+    def flush(self) -> None:
+        ...
+
+    def purge(self, before: str) -> int:
+        """before(ISO 날짜) 이전 데이터 삭제 (보관 기간 적용), 삭제 건수 반환"""
+        return 0
+
+    def read_backwards(self, count: int, cursor: Any = None) -> tuple[list[dict], Any]:
+        """끝에서부터 최대 count건을 최신순으로 읽음
+
+        cursor가 주어지면 그 이전 기록부터 읽는다. 반환된 cursor가 None이면 더 읽을 기록이 없다.
+        기본 구현은 전체를 읽은 뒤 잘라내므로 저장소별로 재정의한다.
+        """
+        data = self.load()
+        if not isinstance(data, list):
+            return [], None
+
+        end = len(data) if cursor is None else cursor
+        start = max(0, end - count)
+        return list(reversed(data[start:end])), (start or None)
+
+
+class JsonStorage(Storage):
+    """JSON 문서 파일 저장소 ({"version": ..., source: data})"""
+    def __init__(self, data_file: Path, source: str, version: str, debounce: float | None = None) -> None:
+        self.data_file = data_file
+        self.source = source
+        self.data_version = version
+        # debounce가 지정되면 save()는 write-behind로 동작
+        self._writer = DebouncedWriter(self._write, debounce) if debounce is not None else None
+        self._ensure_data_file()
+
+    def _ensure_data_file(self) -> None:
+        """데이터 파일이 존재하는지 확인하고 없으면 생성"""
+        if not self.data_file.exists():
+            # 디렉토리가 없으면 생성
+            self.data_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # 초기 데이터 구조 생성
+            initial_data = {
+                "version": self.data_version,
+                self.source: []
+            }
+
+            self._write(initial_data)
+
+    def load(self) -> list | dict:
+        self.flush()
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                return data.get(self.source, [])
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"데이터 로드 오류: {e}")
+            return []
+
+    def save(self, data: list | dict) -> None:
+        if self._writer:
+            self._writer.submit({
+                "version": self.data_version,
+                self.source: _snapshot(data),
+            })
+            return
+
+        in_data = {
+            "version": self.data_version,
+            self.source: data,
+        }
+
+        try:
+            self._write(in_data)
+        except Exception as e:
+            print(f"데이터 저장 오류: {e}")
+            raise
+
+    def flush(self) -> None:
+        if self._writer:
+            self._writer.flush()
+
+    def _write(self, in_data: dict) -> None:
+        """임시 파일에 기록한 뒤 rename으로 교체 (중간에 종료돼도 기존 파일 유지)"""
+        tmp_file = self.data_file.with_name(f".{self.data_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(in_data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.data_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+
+class JsonlLogStorage(Storage):
+    """날짜별 JSON Lines 세그먼트 로그 저장소 (append-only)
+
+    새 로그만 현재 세그먼트 끝에 추가하므로 쓰기 비용은 보관 중인 전체 로그가 아니라
+    새 로그 수에 비례한다. 세그먼트는 날짜가 바뀌거나 max_bytes를 넘으면 교체된다.
+    파일 이름: log-YYYY-MM-DD.jsonl, log-YYYY-MM-DD.1.jsonl, ...
+    """
+    supports_rows = True
+    block_size = 64 * 1024
+    _pattern = re.compile(r"^log-(\d{4}-\d{2}-\d{2})(?:\.(\d+))?\.jsonl$")
+
+    def __init__(
+        self, segment_dir: Path, max_bytes: int,
+        legacy_file: Path | None = None, legacy_source: str = "data"
+    ) -> None:
+        self.segment_dir = segment_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        if legacy_file is not None:
+            self._migrate(legacy_file, legacy_source)
+
+    def segments(self) -> list[Path]:
+        """오래된 순서로 정렬된 세그먼트 목록"""
+        found = []
+        for path in self.segment_dir.iterdir():
+            match = self._pattern.match(path.name)
+            if match:
+                found.append(((match.group(1), int(match.group(2) or 0)), path))
+        return [path for _, path in sorted(found)]
+
+    def _segment_for(self, day: str) -> Path:
+        """day 날짜의 기록 가능한 세그먼트 (크기 초과 시 다음 번호)"""
+        seq = 0
+        while True:
+            name = f"log-{day}.jsonl" if seq == 0 else f"log-{day}.{seq}.jsonl"
+            path = self.segment_dir / name
+            if not path.exists() or path.stat().st_size < self.max_bytes:
+                return path
+            seq += 1
+
+    def load(self) -> list | dict:
+        entries = []
+        for path in self.segments():
+            entries.extend(self._read(path))
+        return entries
+
+    def _read(self, path: Path) -> list[dict]:
+        entries = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 기록 도중 종료되어 잘린 줄은 건너뜀
+                    continue
+        return entries
+
+    def read_backwards(self, count: int, cursor: tuple[str, int] | None = None) -> tuple[list[dict], tuple[str, int] | None]:
+        """최신 세그먼트 끝에서부터 블록 단위로 거꾸로 읽어 필요한 줄만 디코딩
+
+        cursor는 (세그먼트 이름, 바이트 위치)이며 그 위치 이전의 기록부터 읽는다.
+        """
+        segments = self.segments()
+        if cursor is None:
+            idx, end = len(segments) - 1, None
+        else:
+            names = [path.name for path in segments]
+            if cursor[0] not in names:
+                # 보관 기간이 지나 삭제된 세그먼트
+                return [], None
+            idx, end = names.index(cursor[0]), cursor[1]
+
+        records: list[dict] = []
+        while idx >= 0 and len(records) < count:
+            path = segments[idx]
+            if end is None:
+                end = path.stat().st_size
+
+            lines, start = self._tail_lines(path, end, count - len(records))
+            for line in lines:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+            if start > 0:
+                return records, (path.name, start)
+            idx, end = idx - 1, None
+
+        return records, (segments[idx].name, segments[idx].stat().st_size) if idx >= 0 else None
+
+    def _tail_lines(self, path: Path, end: int, count: int) -> tuple[list[bytes], int]:
+        """path의 end 위치 이전에서 마지막 count줄을 최신순으로 반환 (가장 앞 줄의 시작 위치 포함)"""
+        lines: list[bytes] = []
+        with open(path, 'rb') as f:
+            pos = end
+            carry = b""
+            while pos > 0:
+                size = min(self.block_size, pos)
+                pos -= size
+                f.seek(pos)
+                parts = (f.read(size) + carry).split(b"\n")
+                # 첫 조각은 앞 블록에서 시작된 줄일 수 있으므로 다음 블록과 합침
+                carry = parts[0]
+
+                starts = []
+                offset = pos + len(carry) + 1
+                for part in parts[1:]:
+                    starts.append(offset)
+                    offset += len(part) + 1
+
+                for part, start in zip(reversed(parts[1:]), reversed(starts)):
+                    if part.strip():
+                        lines.append(part)
+                        if len(lines) >= count:
+                            return lines, start
+
+            if carry.strip():
+                lines.append(carry)
+        return lines, 0
+
+    def upsert(self, rows: list[dict]) -> None:
+        """로그 추가 (날짜별로 묶어서 한 번에 기록)"""
+        by_day: dict[str, list[str]] = {}
+        for entry in rows:
+            day = str(entry.get("timestamp") or "")[:10] or time.strftime("%Y-%m-%d")
+            by_day.setdefault(day, []).append(json.dumps(entry, ensure_ascii=False, default=str))
+
+        with self._lock:
+            for day, lines in by_day.items():
+                with open(self._segment_for(day), 'a', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+
+    def save(self, data: list | dict) -> None:
+        """전체 교체 (로그 초기화 등)"""
+        with self._lock:
+            for path in self.segments():
+                path.unlink(missing_ok=True)
+        if data:
+            self.upsert(data) # type: ignore
+
+    def purge(self, before: str) -> int:
+        """before(YYYY-MM-DD) 이전 날짜의 세그먼트 삭제"""
+        removed = 0
+        with self._lock:
+            for path in self.segments():
+                match = self._pattern.match(path.name)
+                if match and match.group(1) < before:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    def _migrate(self, legacy_file: Path, source: str) -> None:
+        """기존 log.json 내용을 세그먼트로 옮긴 뒤 원본은 .migrated로 이름 변경"""
+        if not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file, 'r', encoding='utf-8') as f:
+                data = json.load(f).get(source, [])
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to read {legacy_file} for migration: {e}")
+            return
+
+        if data and not self.segments():
+            self.upsert(data)
+            logger.info(f"Migrated {len(data)} log entries from {legacy_file} to {self.segment_dir}")
+        os.replace(legacy_file, legacy_file.with_name(legacy_file.name + ".migrated"))
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS servers (
+    id TEXT PRIMARY KEY,
+    server_type TEXT,
+    status TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_servers_type ON servers(server_type);
+CREATE INDEX IF NOT EXISTS idx_servers_status ON servers(status);
+CREATE TABLE IF NOT EXISTS status_transitions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    server_id TEXT NOT NULL,
+    old_status TEXT,
+    new_status TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transitions_server_ts ON status_transitions(server_id, ts);
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    source TEXT NOT NULL,
+    event TEXT NOT NULL,
+    level TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_logs_source_ts ON logs(source, timestamp);
+CREATE INDEX IF NOT EXISTS idx_logs_ts ON logs(timestamp);
+CREATE TABLE IF NOT EXISTS documents (
+    source TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollups (
+    server_id TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    min REAL,
+    max REAL,
+    total REAL NOT NULL,
+    sketch TEXT NOT NULL,
+    part INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_rollups_server_res_start ON rollups(server_id, resolution, start);
+CREATE TABLE IF NOT EXISTS cluster_nodes (
+    node_id TEXT PRIMARY KEY,
+    address TEXT,
+    started_at REAL NOT NULL,
+    heartbeat REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS observations (
+    signature TEXT NOT NULL,
+    node_id TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    latency REAL,
+    ts REAL NOT NULL,
+    PRIMARY KEY (signature, node_id)
+);
+CREATE INDEX IF NOT EXISTS idx_observations_ts ON observations(ts);
+"""
+
+# 고정 SQL 문자열을 재사용하여 sqlite3의 statement 캐시(prepared statement)를 활용
+_SQL = {
+    "server_upsert": (
+        "INSERT INTO servers (id, server_type, status, updated_at, data) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(id) DO UPDATE SET server_type=excluded.server_type, status=excluded.status, "
+        "updated_at=excluded.updated_at, data=excluded.data"
+    ),
+    "server_delete": "DELETE FROM servers WHERE id = ?",
+    "server_load": "SELECT data FROM servers ORDER BY rowid",
+    "log_insert": "INSERT INTO logs (timestamp, source, event, level, details) VALUES (?, ?, ?, ?, ?)",
+    "log_load": "SELECT timestamp, source, event, level, details FROM logs ORDER BY id",
+    "document_upsert": (
+        "INSERT INTO documents (source, data) VALUES (?, ?) "
+        "ON CONFLICT(source) DO UPDATE SET data=excluded.data"
+    ),
+    "document_load": "SELECT data FROM documents WHERE source = ?",
+    "transition_insert": "INSERT INTO status_transitions (server_id, old_status, new_status, ts) VALUES (?, ?, ?, ?)",
+}
+
+
+class SQLiteDatabase:
+    """파일별로 하나의 커넥션을 공유하는 SQLite 데이터베이스"""
+    _instances: dict[Path, "SQLiteDatabase"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def open(cls, db_file: Path) -> "SQLiteDatabase":
+        with cls._instances_lock:
+            db = cls._instances.get(db_file)
+            if db is None:
+                db = cls._instances[db_file] = cls(db_file)
+            return db
+
+    def __init__(self, db_file: Path) -> None:
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.db_file = db_file
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(db_file, check_same_thread=False, isolation_level=None, cached_statements=256)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        atexit.register(self.close)
+
+    def write(self, sql: str, rows: list[tuple]) -> None:
+        """하나의 트랜잭션으로 여러 행 기록"""
+        self.write_batch([(sql, rows)])
+
+    def write_batch(self, statements: list[tuple[str, list[tuple]]]) -> None:
+        """여러 문장을 하나의 트랜잭션으로 실행"""
+        statements = [(sql, rows) for sql, rows in statements if rows]
+        if not statements:
+            return
+        with self.lock:
+            self.conn.execute("BEGIN")
+            try:
+                for sql, rows in statements:
+                    self.conn.executemany(sql, rows)
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    def query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def ensure_column(self, table: str, column: str, definition: str) -> None:
+        """이전 버전에서 만든 테이블에 없는 컬럼 추가"""
+        with self.lock:
+            columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def get_meta(self, key: str) -> str | None:
+        rows = self.query("SELECT value FROM meta WHERE key = ?", (key,))
+        return rows[0][0] if rows else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        self.write("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [(key, value)])
+
+    def close(self) -> None:
+        with self.lock:
+            try:
+                self.conn.close()
+            except sqlite3.Error:
+                pass
+
+
+def _server_row(server: dict) -> tuple:
+    return (
+        server["id"], server.get("server_type"), server.get("status"),
+        server.get("updated_at"), json.dumps(server, ensure_ascii=False),
+    )
+
+def _log_row(entry: dict) -> tuple:
+    details = entry.get("details")
+    return (
+        entry.get("timestamp"), entry.get("source"), str(entry.get("event")),
+        entry.get("level", "INFO"), json.dumps(details, ensure_ascii=False),
+    )
+
+def _log_dict(row: tuple) -> dict:
+    timestamp, source, event, level, details = row
+    return {
+        "timestamp": timestamp,
+        "source": source,
+        "event": event,
+        "level": level,
+        "details": json.loads(details) if details else "",
+    }
+
+
+class SQLiteStorage(Storage):
+    """SQLite 저장소
+
+    table이 "servers"/"logs"면 전용 테이블에 행 단위로 저장하고,
+    그 외에는 documents 테이블에 문서 하나로 저장한다.
+    """
+    supports_rows = True
+
+    def __init__(self, db_file: Path, table: str, json_file: Path | None = None, json_source: str = "data") -> None:
+        self.db = SQLiteDatabase.open(db_file)
+        self.table = table
+        if json_file is not None:
+            migrate_json(self, json_file, json_source)
+
+    def load(self) -> list | dict:
+        if self.table == "servers":
+            return [json.loads(data) for (data,) in self.db.query(_SQL["server_load"])]
+        if self.table == "logs":
+            return [_log_dict(row) for row in self.db.query(_SQL["log_load"])]
+
+        rows = self.db.query(_SQL["document_load"], (self.table,))
+        return json.loads(rows[0][0]) if rows else []
+
+    def save(self, data: list | dict) -> None:
+        """전체 데이터 교체"""
+        if self.table == "servers":
+            self.db.write_batch([
+                ("DELETE FROM servers", [()]),
+                (_SQL["server_upsert"], [_server_row(s) for s in data]),
+            ])
+        elif self.table == "logs":
+            self.db.write_batch([
+                ("DELETE FROM logs", [()]),
+                (_SQL["log_insert"], [_log_row(e) for e in data]),
+            ])
+        else:
+            self.db.write(_SQL["document_upsert"], [(self.table, json.dumps(data, ensure_ascii=False))])
+
+    def upsert(self, rows: list[dict]) -> None:
+        """서버는 id 기준 upsert, 로그는 추가"""
+        if self.table == "servers":
+            self.db.write(_SQL["server_upsert"], [_server_row(s) for s in rows])
+        elif self.table == "logs":
+            self.db.write(_SQL["log_insert"], [_log_row(e) for e in rows])
+        else:
+            raise NotImplementedError(f"[{self.table}] does not support row-level writes")
+
+    def purge(self, before: str) -> int:
+        if self.table != "logs":
+            return 0
+        with self.db.lock:
+            self.db.write("DELETE FROM logs WHERE timestamp < ?", [(before,)])
+            return self.db.conn.execute("SELECT changes()").fetchone()[0]
+
+    def delete(self, keys: Iterable[Any]) -> None:
+        if self.table != "servers":
+            raise NotImplementedError(f"[{self.table}] does not support row-level deletes")
+        self.db.write(_SQL["server_delete"], [(key,) for key in keys])
+
+    # 상태 변화 이력
+    def record_transitions(self, rows: list[tuple[str, str | None, str, float]]) -> None:
+        """(server_id, old_status, new_status, timestamp) 목록 기록"""
+        self.db.write(_SQL["transition_insert"], rows)
+
+    def query_transitions(
+        self, server_id: str, since: float | None = None,
+        until: float | None = None, limit: int | None = None
+    ) -> list[dict]:
+        sql = "SELECT old_status, new_status, ts FROM status_transitions WHERE server_id = ? AND ts >= ? AND ts <= ? ORDER BY ts DESC"
+        params: tuple = (server_id, since if since is not None else 0.0, until if until is not None else float("inf"))
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+
+        return [
+            {"old_status": old, "new_status": new, "timestamp": ts}
+            for old, new, ts in self.db.query(sql, params)
+        ]
+
+    def read_backwards(self, count: int, cursor: int | None = None) -> tuple[list[dict], int | None]:
+        """로그는 id 역순 인덱스로 읽고, 그 외에는 기본 구현 사용 (cursor는 마지막으로 읽은 id)"""
+        if self.table != "logs":
+            return super().read_backwards(count, cursor)
+
+        rows = self.db.query(
+            "SELECT id, timestamp, source, event, level, details FROM logs WHERE id < ? ORDER BY id DESC LIMIT ?",
+            (cursor if cursor is not None else 2**63 - 1, count)
+        )
+        records = [_log_dict(row[1:]) for row in rows]
+        return records, (rows[-1][0] if len(rows) == count else None)
+
+    def query_logs(
+        self, source: str | None = None, since: str | None = None,
+        until: str | None = None, limit: int = 100
+    ) -> list[dict]:
+        """최신순 로그 조회 (timestamp는 ISO 문자열)"""
+        clauses, params = [], []
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp <= ?")
+            params.append(until)
+
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        sql = f"SELECT timestamp, source, event, level, details FROM logs {where}ORDER BY id DESC LIMIT ?"
+        return [_log_dict(row) for row in self.db.query(sql, tuple(params) + (limit,))]
+
+
+def migrate_json(storage: SQLiteStorage, json_file: Path, source: str = "data") -> bool:
+    """기존 JSON 파일 내용을 SQLite로 한 번만 옮김"""
+    key = f"migrated:{storage.table}"
+    if storage.db.get_meta(key) is not None:
+        return False
+
+    migrated = False
+    if json_file.exists():
+        try:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f).get(source, [])
+        except (OSError, json.JSONDecodeError) as e:
+            logger.error(f"Failed to read {json_file} for migration: {e}")
+            return False
+
+        if data:
+            storage.save(data)
+            migrated = True
+            logger.info(f"Migrated {len(data)} records from {json_file} to SQLite ({storage.table})")
+
+    storage.db.set_meta(key, str(json_file))
+    return migrated
@@ -0,0 +1,255 @@
+"""
+가상 서버 N개를 대상으로 한 모니터링 확장성 벤치마크
+
+벤치마크 프로세스가 asyncio HTTP stub(별도 스레드)으로 /t/{i} 엔드포인트 N개를 제공하고,
+크기마다 새 자식 프로세스에서 MonitorService를 실행해 다음 항목을 측정한다.
+    - checks/sec: 측정 구간 동안 완료된 체크 수 / 시간 (목표: N / interval)
+    - tick: 모니터 루프 한 tick 처리 시간 (평균)
+    - latency: 서버별 마지막 체크 latency의 p50 / p99
+    - cpu: 자식 프로세스 CPU 사용률 (user + sys / wall)
+    - rss: 자식 프로세스 최대 RSS
+    - detect: 측정 구간 중간에 outage_fraction 만큼의 엔드포인트를 500으로 바꾼 뒤
+              inactive로 바뀔 때까지 걸린 시간 (p50 / max)
+
+응답 지연은 서버별 로그정규분포(중앙값 --latency-ms, --sigma)를 따르고,
+--slow-fraction 비율의 엔드포인트는 중앙값이 10배, --failure-rate 확률로 500을 돌려준다.
+
+    python benchmarks/fleet_bench.py [--sizes 10,100,1000] [--duration SEC] [--interval SEC]
+                                     [--latency-ms MS] [--sigma S] [--slow-fraction F] [--failure-rate P]
+                                     [--outage-fraction F] [--detect-timeout SEC] [--workers N] [--adaptive] [--seed N]
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class StubFleet:
+    """엔드포인트 N개를 흉내 내는 HTTP 서버 (keep-alive 없이 요청마다 응답 후 연결 종료)"""
+
+    def __init__(self, size: int, latency_ms: float, sigma: float, slow_fraction: float, failure_rate: float, seed: int) -> None:
+        rng = random.Random(seed)
+        self.mu = [
+            math.log(latency_ms / 1000 * (10 if rng.random() < slow_fraction else 1))
+            for _ in range(size)
+        ]
+        self.sigma = sigma
+        self.failure_rate = failure_rate
+        self.down: set[int] = set()
+        self.requests = 0
+        self._rng = random.Random(seed + 1)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.Server | None = None
+        self._thread: threading.Thread | None = None
+        self.port = 0
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+            path = request.split(b" ", 2)[1].decode()
+            if path.startswith("/__outage/"):
+                self.down.update(int(i) for i in path[len("/__outage/"):].split(",") if i)
+                code = 200
+            else:
+                self.requests += 1
+                index = int(path.rsplit("/", 1)[1])
+                await asyncio.sleep(self._rng.lognormvariate(self.mu[index], self.sigma))
+                failed = index in self.down or self._rng.random() < self.failure_rate
+                code = 500 if failed else 200
+            writer.write(
+                f"HTTP/1.1 {code} X\r\nContent-Type: application/json\r\n"
+                f"Content-Length: 2\r\nConnection: close\r\n\r\n{{}}".encode()
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError, IndexError):
+            pass
+        finally:
+            writer.close()
+
+    def start(self) -> None:
+        ready = threading.Event()
+
+        async def serve() -> None:
+            self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=4096)
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            await self._server.serve_forever()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            try:
+                self._loop.run_until_complete(serve())
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._server is not None:
+            # close()가 serve_forever를 취소
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+
+# 자식 프로세스
+async def _child(args: argparse.Namespace) -> dict:
+    import resource
+    import httpx
+    from app.services.server_service import ServerService
+    from app.services.monitor_service import MonitorService
+    from app.utils.metrics import percentile
+
+    service = ServerService()
+    service.add_many([
+        {"name": f"t{i}", "server_type": "web", "url": "http://127.0.0.1", "port": args.port, "endpoint": f"/t/{i}"}
+        for i in range(args.size)
+    ])
+    service.flush()
+    index_of = {server['id']: int(server['name'][1:]) for server in service.get_all_servers()}
+
+    monitor = MonitorService()
+    monitor.check_interval = args.interval
+    monitor.workers = args.workers
+    # 알림 채널이 설정되지 않으면 콘솔 출력으로 대체되므로 벤치마크에서는 끔
+    monitor.alerts_enabled = False
+    if not args.adaptive:
+        monitor.scheduler.min_interval = monitor.scheduler.max_interval = args.interval
+
+    outage = set(range(0, args.size, max(1, round(1 / args.outage_fraction)))) if args.outage_fraction > 0 else set()
+    outage_at: list[float] = []
+    detected: dict[int, float] = {}
+
+    def on_status(server_id: str, status: str) -> None:
+        index = index_of.get(server_id)
+        if outage_at and status == "inactive" and index in outage and index not in detected:
+            detected[index] = time.monotonic() - outage_at[0]
+
+    monitor.add_listener(on_status)
+    await monitor.start()
+
+    # 워밍업: 첫 체크가 주기 전체에 분산되므로 한 주기 이상 대기
+    await asyncio.sleep(args.interval * 1.5)
+    checks_before = sum(monitor.metrics.checks.values())
+    cycle_before = (monitor.metrics.cycle.count, monitor.metrics.cycle.sum)
+    usage_before = resource.getrusage(resource.RUSAGE_SELF)
+    started = time.monotonic()
+
+    await asyncio.sleep(args.duration / 2)
+    if outage:
+        async with httpx.AsyncClient() as client:
+            await client.get(f"http://127.0.0.1:{args.port}/__outage/{','.join(map(str, sorted(outage)))}")
+        outage_at.append(time.monotonic())
+    await asyncio.sleep(args.duration / 2)
+
+    elapsed = time.monotonic() - started
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    checks = sum(monitor.metrics.checks.values()) - checks_before
+    ticks = monitor.metrics.cycle.count - cycle_before[0]
+    tick_total = monitor.metrics.cycle.sum - cycle_before[1]
+    latencies = sorted(monitor.metrics.server_latency.values())
+    status = monitor.get_status()
+
+    # 재시도 때문에 장애 확인이 측정 구간보다 오래 걸릴 수 있으므로 추가로 대기
+    deadline = time.monotonic() + args.detect_timeout
+    while len(detected) < len(outage) and time.monotonic() < deadline:
+        await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    def pct(values: list[float], q: float) -> float | None:
+        return percentile(values, q) if values else None
+
+    delays = sorted(detected.values())
+    return {
+        "size": args.size,
+        "checks_per_sec": checks / elapsed,
+        "target_per_sec": args.size / args.interval,
+        "tick_mean": tick_total / ticks if ticks else None,
+        "latency_p50": pct(latencies, 0.5),
+        "latency_p99": pct(latencies, 0.99),
+        "cpu": (usage.ru_utime + usage.ru_stime - usage_before.ru_utime - usage_before.ru_stime) / elapsed,
+        "rss_mb": usage.ru_maxrss / 1024,
+        "loop_lag_p99": status["event_loop_lag"]["p99"],
+        "missed_slots": status["scheduler"]["missed_slots"],
+        "skipped_busy": status["scheduler"]["skipped_busy"],
+        "outage": len(outage),
+        "detected": len(delays),
+        "detect_p50": pct(delays, 0.5),
+        "detect_max": delays[-1] if delays else None,
+    }
+
+
+def _fmt(value: float | None, scale: float = 1, digits: int = 1) -> str:
+    return "-" if value is None else f"{value * scale:.{digits}f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Watchdog fleet scaling benchmark")
+    parser.add_argument("--sizes", default="10,100,1000", help="쉼표로 구분한 서버 수 목록 (예: 10,100,1000,10000)")
+    parser.add_argument("--duration", type=float, default=20, help="측정 구간 길이 (초)")
+    parser.add_argument("--interval", type=float, default=5, help="체크 주기 (초)")
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--sigma", type=float, default=0.5, help="로그정규분포 sigma")
+    parser.add_argument("--slow-fraction", type=float, default=0.05)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--outage-fraction", type=float, default=0.01)
+    parser.add_argument("--detect-timeout", type=float, default=30, help="측정 구간 이후 장애 감지를 기다리는 최대 시간 (초)")
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--adaptive", action="store_true", help="적응형 체크 주기 사용 (기본값: 고정 주기)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(_child(args))))
+        return
+
+    passthrough = [
+        "--duration", str(args.duration), "--interval", str(args.interval),
+        "--outage-fraction", str(args.outage_fraction), "--detect-timeout", str(args.detect_timeout),
+        "--workers", str(args.workers),
+    ] + (["--adaptive"] if args.adaptive else [])
+
+    print(f"{'N':>6} {'checks/s':>9} {'target':>7} {'tick ms':>8} {'lat p50':>8} {'lat p99':>8} "
+          f"{'cpu %':>6} {'rss MB':>7} {'lag p99':>8} {'missed':>6} {'detect p50':>10} {'detect max':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        stub = StubFleet(size, args.latency_ms, args.sigma, args.slow_fraction, args.failure_rate, args.seed)
+        stub.start()
+        with tempfile.TemporaryDirectory() as data_dir:
+            env = dict(os.environ, WATCHDOG_HOME=data_dir, PYTHONPATH=str(ROOT))
+            result = subprocess.run(
+                [sys.executable, __file__, "--child", "--size", str(size), "--port", str(stub.port), *passthrough],
+                cwd=ROOT, env=env, capture_output=True, text=True
+            )
+        stub.stop()
+        if result.returncode != 0 or not result.stdout.strip():
+            print(f"{size:>6} failed: {result.stderr.strip().splitlines()[-1:] or result.returncode}")
+            continue
+
+        r = json.loads(result.stdout.strip().splitlines()[-1])
+        print(
+            f"{size:>6} {r['checks_per_sec']:>9.1f} {r['target_per_sec']:>7.1f} {_fmt(r['tick_mean'], 1000):>8} "
+            f"{_fmt(r['latency_p50'], 1000):>8} {_fmt(r['latency_p99'], 1000):>8} {r['cpu'] * 100:>6.1f} "
+            f"{r['rss_mb']:>7.1f} {_fmt(r['loop_lag_p99'], 1000):>8} {r['missed_slots']:>6} "
+            f"{_fmt(r['detect_p50']) + 's':>10} {_fmt(r['detect_max']) + 's':>10}  ({r['detected']}/{r['outage']} detected)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+체크 기록 아카이브 크기 / 조회 벤치마크
+
+서버 N개를 --interval 간격으로 체크한 합성 기록을 HISTORY_WINDOW_SECONDS 구간마다
+HistoryArchive에 기록하고 다음 항목을 측정한다.
+    - 하루치 아카이브 크기와 한 달 환산 크기, 샘플당 bit 수
+    - 서버 하나의 하루 구간 조회 시간
+
+체크 시각은 서버별 위상 + 주기 + 스케줄 지연(0~0.5초) + latency, latency는 서버별 중앙값
+(5/20/80ms 중 하나)의 로그정규분포(--sigma)를 따르고 --failure-rate 확률로 down이다.
+
+    python benchmarks/history_bench.py [--servers N] [--interval SEC] [--hours H] [--sigma S]
+                                       [--failure-rate P] [--codec zlib|lzma] [--seed N]
+"""
+import sys
+import math
+import time
+import random
+import argparse
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from app.config.settings import HISTORY_WINDOW_SECONDS
+from app.utils.history_archive import CheckHistoryBuffer, HistoryArchive
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Watchdog check history archive benchmark")
+    parser.add_argument("--servers", type=int, default=100)
+    parser.add_argument("--interval", type=float, default=10, help="체크 주기 (초)")
+    parser.add_argument("--hours", type=int, default=24, help="기록할 시간 (시간)")
+    parser.add_argument("--sigma", type=float, default=0.2, help="latency 로그정규분포 sigma")
+    parser.add_argument("--failure-rate", type=float, default=0.001)
+    parser.add_argument("--codec", default="zlib", choices=("zlib", "lzma"))
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    server_ids = [f"{i:08x}-0000-4000-8000-{rng.getrandbits(48):012x}" for i in range(args.servers)]
+    phases = [rng.uniform(0, args.interval) for _ in server_ids]
+    medians = [math.log(rng.choice((0.005, 0.02, 0.08))) for _ in server_ids]
+
+    window = HISTORY_WINDOW_SECONDS
+    per_window = int(window / args.interval)
+    samples = 0
+    with tempfile.TemporaryDirectory() as directory:
+        archive = HistoryArchive(Path(directory), args.codec)
+        start = 1_760_000_000.0
+        write_time = 0.0
+        for _ in range(math.ceil(args.hours * 3600 / window)):
+            buffer = CheckHistoryBuffer(start)
+            for i, server_id in enumerate(server_ids):
+                for k in range(per_window):
+                    latency = rng.lognormvariate(medians[i], args.sigma)
+                    failed = rng.random() < args.failure_rate
+                    timestamp = start + phases[i] + k * args.interval + rng.uniform(0, 0.5) + latency
+                    buffer.record(server_id, timestamp, 2 if failed else 0, None if failed else latency)
+            samples += len(buffer)
+            started = time.perf_counter()
+            archive.write_window(buffer.drain(start + window), start, start + window)
+            write_time += time.perf_counter() - started
+            start += window
+
+        size = sum(path.stat().st_size for path in Path(directory).iterdir())
+        started = time.perf_counter()
+        rows = archive.query(server_ids[0], start - 86400, start)
+        query_time = time.perf_counter() - started
+
+    month = size * 30 * 24 / args.hours
+    print(f"servers / interval: {args.servers} / {args.interval:g}s ({samples} samples, window {window}s)")
+    print(f"archive:            {size / 1e6:.2f} MB for {args.hours}h -> {month / 1e6:.1f} MB/month")
+    print(f"per sample:         {size * 8 / samples:.2f} bits")
+    print(f"write:              {write_time * 1000 / samples * 1000:.1f} us/sample")
+    print(f"query 1 server/24h: {len(rows)} rows in {query_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
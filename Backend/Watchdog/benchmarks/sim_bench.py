@@ -0,0 +1,125 @@
+"""
+가상 서버(server_type "sim") 기반 처리량 벤치마크
+
+소켓을 사용하지 않으므로 네트워크 지연/잡음 없이 MonitorService 자체의
+스케줄링, 상태 반영, 알림(로그/리스너), 저장 경로 비용만 측정한다.
+서버마다 seed로 정한 위상에 따라 --outage-every 간격으로 --outage-length 동안 장애가
+발생하며, 시뮬레이션 시각은 실제 시간의 --speed배로 진행된다.
+
+    python benchmarks/sim_bench.py [--size N] [--interval SEC] [--duration SEC] [--speed X]
+                                   [--outage-every SEC] [--outage-length SEC] [--workers N] [--seed N]
+"""
+import os
+import sys
+import json
+import random
+import asyncio
+import argparse
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _servers(args: argparse.Namespace) -> list[dict]:
+    rng = random.Random(args.seed)
+    horizon = (args.duration + args.interval * 2) * args.speed
+    servers = []
+    for i in range(args.size):
+        start = rng.uniform(0, args.outage_every)
+        outages = []
+        while start < horizon:
+            outages.append([start, start + args.outage_length, "down"])
+            start += args.outage_every
+        servers.append({
+            "name": f"sim{i}", "server_type": "sim", "seed": args.seed * 1_000_003 + i,
+            "latency_ms": 20, "outages": outages,
+        })
+    return servers
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.core.sim_watcher import clock
+    from app.services.server_service import ServerService
+    from app.services.monitor_service import MonitorService
+
+    service = ServerService()
+    service.add_many(_servers(args))
+    service.flush()
+
+    monitor = MonitorService()
+    monitor.check_interval = args.interval
+    monitor.workers = args.workers
+    # 알림 채널이 설정되지 않으면 콘솔 출력으로 대체되므로 벤치마크에서는 끔
+    monitor.alerts_enabled = False
+    monitor.scheduler.min_interval = monitor.scheduler.max_interval = args.interval
+    monitor.set_phase_timing(True)
+
+    transitions = 0
+
+    def on_status(server_id: str, status: str) -> None:
+        nonlocal transitions
+        transitions += 1
+
+    monitor.add_listener(on_status)
+    # 워커 프로세스는 start()에서 시작될 때 이 설정(기준 시각, 속도)을 이어받음
+    clock.configure(speed=args.speed)
+    await monitor.start()
+
+    # 첫 체크가 주기 전체에 분산되므로 한 주기 이상 지난 뒤부터 측정
+    await asyncio.sleep(args.interval * 1.5)
+    monitor.phases.reset()
+    checks_before = sum(monitor.metrics.checks.values())
+    transitions_before = transitions
+    usage_before = resource.getrusage(resource.RUSAGE_SELF)
+    started = time.monotonic()
+
+    await asyncio.sleep(args.duration)
+
+    elapsed = time.monotonic() - started
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    checks = sum(monitor.metrics.checks.values()) - checks_before
+    status = monitor.get_status()
+    persist = {
+        operation: {"count": histogram.count, "total_ms": round(histogram.sum * 1000, 1)}
+        for operation, histogram in monitor.metrics.persist.items()
+    }
+    await monitor.stop()
+
+    return {
+        "size": args.size,
+        "checks_per_sec": round(checks / elapsed, 1),
+        "target_per_sec": round(args.size / args.interval, 1),
+        "transitions_per_sec": round((transitions - transitions_before) / elapsed, 1),
+        "cpu_percent": round((usage.ru_utime + usage.ru_stime - usage_before.ru_utime - usage_before.ru_stime) / elapsed * 100, 1),
+        "rss_mb": round(usage.ru_maxrss / 1024, 1),
+        "loop_lag": status["event_loop_lag"],
+        "missed_slots": status["scheduler"]["missed_slots"],
+        "phase_timing_ms": status["phase_timing_ms"],
+        "persist": persist,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Watchdog simulated fleet throughput benchmark")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--interval", type=float, default=1, help="체크 주기 (초)")
+    parser.add_argument("--duration", type=float, default=15, help="측정 구간 길이 (초)")
+    parser.add_argument("--speed", type=float, default=60, help="시뮬레이션 시각 진행 배율")
+    parser.add_argument("--outage-every", type=float, default=600, help="서버별 장애 간격 (시뮬레이션 초)")
+    parser.add_argument("--outage-length", type=float, default=120, help="장애 길이 (시뮬레이션 초)")
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        # 설정 모듈이 데이터 경로를 계산하기 전에 지정해야 함
+        os.environ["WATCHDOG_HOME"] = data_dir
+        sys.path.insert(0, str(ROOT))
+        print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+콜드 스타트 벤치마크
+
+새 인터프리터 프로세스를 띄워 다음 항목을 측정한다.
+    - import: app.services / app.daemon import 시간
+    - first_check: 프로세스 시작부터 첫 번째 헬스체크 결과까지 걸린 시간
+    - rss: 첫 체크 직후 최대 RSS
+
+    python benchmarks/startup_bench.py [--runs N]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = Path(__file__).resolve().parent.parent
+# 첫 체크가 이 시간 안에 끝나지 않으면 측정 실패로 처리 (초)
+CHILD_TIMEOUT = 60
+
+# 자식 프로세스에서 실행되는 코드 (시작 시각은 argv로 전달)
+CHILD = r"""
+import sys, time, json
+t_import = time.perf_counter()
+import app.services
+import app.daemon
+import_time = time.perf_counter() - t_import
+
+import asyncio, resource
+from app.services.monitor_service import MonitorService
+
+async def main():
+    monitor = MonitorService()
+    monitor.check_interval = 3600
+    # 첫 체크를 위상만큼 늦추지 않고 바로 수행 (첫 체크까지 걸리는 시간만 측정)
+    monitor.scheduler.first_check_spread = 0
+    await monitor.start()
+    while not len(monitor.history):
+        await asyncio.sleep(0.001)
+    first_check = time.time()
+    modules = [m for m in ("httpx", "sqlalchemy", "aiomysql", "psycopg", "flet") if m in sys.modules]
+    await monitor.stop()
+    return first_check, modules
+
+first_check, modules = asyncio.run(main())
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"import": import_time, "first_check": first_check, "rss_kb": rss, "modules": modules}))
+"""
+
+SEED = r"""
+from app.services.server_service import ServerService
+service = ServerService()
+service.add_server({"name": "bench", "server_type": "web", "url": "http://127.0.0.1", "port": %d, "endpoint": "/health"})
+service.flush()
+"""
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(code: str, env: dict, *args: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True, timeout=CHILD_TIMEOUT
+    )
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Watchdog cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = dict(os.environ, WATCHDOG_HOME=data_dir, PYTHONPATH=str(ROOT))
+        _run(SEED % server.server_address[1], env)
+
+        samples = []
+        for _ in range(args.runs):
+            started = time.time()
+            report = json.loads(_run(CHILD, env))
+            report["first_check"] -= started
+            samples.append(report)
+
+    server.shutdown()
+
+    def median(key: str) -> float:
+        return statistics.median(sample[key] for sample in samples)
+
+    print(f"runs:               {args.runs}")
+    print(f"import (median):    {median('import') * 1000:.1f} ms")
+    print(f"first check:        {median('first_check') * 1000:.1f} ms")
+    print(f"max RSS:            {median('rss_kb') / 1024:.1f} MiB")
+    print(f"heavy modules:      {', '.join(samples[-1]['modules']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,12 @@ try:
     from .base import BaseWatcher, Notifier
     from .web_watcher import WebWatcher, WebConfig
     from .db_watcher import DBWatcher, DBConfig
-    from .alert import set_notifiers, set_alert
+    from .alert import build_routes, set_alert
 except ImportError:
     from base import BaseWatcher, Notifier
     from web_watcher import WebWatcher, WebConfig
     from db_watcher import DBWatcher, DBConfig
-    from alert import set_notifiers, set_alert
+    from alert import build_routes, set_alert
 
 def set_watcher_dict() -> dict[tuple, BaseWatcher]:
     watchers: list[BaseWatcher] = [WebWatcher(
@@ -68,7 +68,7 @@ async def check_and_send(watcher: BaseWatcher, notifiers: dict) -> None:
 async def main():
     watchers = set_watcher_dict()
 
-    notifiers = set_notifiers()
+    notifiers = build_routes()
 
     tasks = [check_and_send(watcher, notifiers) for k, watcher in watchers.items()]
 
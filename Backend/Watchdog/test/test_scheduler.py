@@ -0,0 +1,118 @@
+"""
+AdaptiveScheduler 테스트 (체크 속도 한도, backoff, flapping)
+
+    cd Backend/Watchdog && python -m pytest test/test_scheduler.py
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.core.models import Status
+from app.services.scheduler import AdaptiveScheduler, phase_of
+
+
+def _first_due(scheduler: AdaptiveScheduler, server_ids: list[str]) -> float:
+    """서버를 등록하고 모두 due가 되는 시각 반환"""
+    scheduler.due(server_ids, 0.0)
+    return max(phase_of(server_id, scheduler.base_interval) for server_id in server_ids)
+
+
+def test_rate_limit_caps_checks_per_tick():
+    servers = [f"server-{i}" for i in range(20)]
+    scheduler = AdaptiveScheduler(base_interval=10, max_rate=5)
+    now = _first_due(scheduler, servers)
+
+    assert len(scheduler.due(servers, now)) == 5
+    # token이 다 떨어지면 채워질 때까지 체크하지 않음
+    assert scheduler.due(servers, now) == []
+    assert len(scheduler.due(servers, now + 0.4)) == 2
+    # 오래 쉬어도 최대 1초 분량까지만 모임
+    assert len(scheduler.due(servers, now + 100)) == 5
+
+
+def test_rate_limit_below_one_check_per_second():
+    servers = [f"server-{i}" for i in range(3)]
+    scheduler = AdaptiveScheduler(base_interval=10, max_rate=0.5)
+    now = _first_due(scheduler, servers)
+
+    assert len(scheduler.due(servers, now)) == 1
+    assert scheduler.due(servers, now + 1) == []
+    # 2초에 1회
+    assert len(scheduler.due(servers, now + 2)) == 1
+    assert scheduler.next_wakeup(now + 2, 60) == pytest.approx(now + 4)
+    assert len(scheduler.due(servers, now + 4)) == 1
+
+
+def test_rate_limited_servers_run_oldest_first():
+    servers = ["a", "b", "c"]
+    scheduler = AdaptiveScheduler(base_interval=10, max_rate=1)
+    now = _first_due(scheduler, servers)
+    oldest = sorted(servers, key=lambda server_id: phase_of(server_id, 10))
+
+    # 모두 due지만 token이 1초에 1개뿐이므로 오래 기다린 순서대로 체크
+    assert [scheduler.due(servers, now + i) for i in range(3)] == [[server_id] for server_id in oldest]
+
+
+def test_first_check_is_spread_over_a_short_window():
+    servers = [f"server-{i}" for i in range(20)]
+    scheduler = AdaptiveScheduler(base_interval=3600, first_check_spread=5)
+    scheduler.due(servers, 0.0)
+
+    # 주기가 길어도 첫 체크는 first_check_spread 안에 모두 수행
+    assert sorted(scheduler.due(servers, 5.0)) == sorted(servers)
+    # 두 번째 체크부터는 주기 전체에 분산된 위상을 따름
+    for server_id in servers:
+        scheduler.observe(server_id, Status.normal, 5.0)
+    assert scheduler.next_wakeup(5.0, 86400) == pytest.approx(min(3600 + phase_of(s, 3600) for s in servers))
+
+
+def test_first_check_without_spread_runs_immediately():
+    scheduler = AdaptiveScheduler(base_interval=3600, first_check_spread=0)
+    assert scheduler.due(["a"], 0.0) == ["a"]
+
+
+def test_backoff_grows_until_max_interval():
+    scheduler = AdaptiveScheduler(base_interval=10, min_interval=5, max_interval=40, backoff=2)
+    now = _first_due(scheduler, ["a"])
+
+    intervals = []
+    for _ in range(5):
+        assert scheduler.due(["a"], now) == ["a"]
+        scheduler.observe("a", Status.normal, now)
+        intervals.append(scheduler.interval_of("a"))
+        now += scheduler.interval_of("a")
+    assert intervals == [10, 20, 40, 40, 40]
+
+    # 장애가 나면 바로 최소 주기, 복구되면 기본 주기부터 다시 늘림
+    scheduler.due(["a"], now)
+    scheduler.observe("a", Status.down, now)
+    assert scheduler.interval_of("a") == 5
+    now += 5
+    scheduler.due(["a"], now)
+    scheduler.observe("a", Status.normal, now)
+    assert scheduler.interval_of("a") == 10
+
+
+def test_flapping_server_stays_at_min_interval():
+    scheduler = AdaptiveScheduler(
+        base_interval=10, min_interval=5, max_interval=40, backoff=2, flap_window=100, flap_threshold=3
+    )
+    now = _first_due(scheduler, ["a"])
+    for status in (Status.normal, Status.down, Status.normal, Status.down, Status.normal):
+        scheduler.due(["a"], now)
+        scheduler.observe("a", status, now)
+        now += scheduler.interval_of("a")
+
+    # 정상이지만 최근 상태 변화가 threshold 이상
+    assert scheduler.interval_of("a") == 5
+    assert scheduler.stats()["flapping"] == 1
+
+    # flap_window가 지나면 상태 변화 기록이 사라지고 다시 backoff
+    now += 100
+    scheduler.due(["a"], now)
+    scheduler.observe("a", Status.normal, now)
+    assert scheduler.stats()["flapping"] == 0
+    assert scheduler.interval_of("a") == 10
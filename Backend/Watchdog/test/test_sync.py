@@ -4,7 +4,7 @@ from app.core.base import BaseWatcher
 # from .models import WebCheckResult, Status, BaseConfig, WebConfig
 from app.core.web_watcher import WebWatcher, WebConfig
 from app.core.db_watcher import DBWatcher, DBConfig
-from app.core.alert import set_notifiers, set_alert
+from app.core.alert import build_routes, set_alert
 
 
 # class TestWatcher(BaseWatcher):
@@ -61,7 +61,7 @@ if __name__ == "__main__":
     watcher_dict = {watcher.sign: watcher for watcher in watchers}
     print(len(watcher_dict.items()))
 
-    notifiers = set_notifiers()
+    notifiers = build_routes()
     
     for i in range(3):
         print(f"({i+1})th iteration...")